@@ -9,6 +9,7 @@ Typical usage::
         agent_id="bot_1",
         server_address="tcp://127.0.0.1:5555",
     )
+    env = agent_env()   # TITAN_* knobs, parsed once per process
 """
 
 from __future__ import annotations
@@ -16,6 +17,8 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 
+from utils.env import FALSY, TRUTHY, env_truthy
+
 
 @dataclass(slots=True)
 class AgentConfig:
@@ -23,7 +26,7 @@ class AgentConfig:
 
     Attributes:
         agent_id:         Unique identifier sent in ZMQ check-in messages.
-        server_address:   ZMQ ``REQ`` endpoint (e.g. ``tcp://127.0.0.1:5555``).
+        server_address:   HiveBrain ZMQ endpoint (e.g. ``tcp://127.0.0.1:5555``).
         table_id:         Logical table identifier for multi-table support.
         interval_seconds: Sleep between decision cycles.
         timeout_ms:       ZMQ send/receive timeout.
@@ -75,9 +78,9 @@ def parse_bool_env(name: str, default: bool) -> bool:
     raw = os.getenv(name, "").strip().lower()
     if not raw:
         return default
-    if raw in {"1", "true", "yes", "on"}:
+    if raw in TRUTHY:
         return True
-    if raw in {"0", "false", "no", "off"}:
+    if raw in FALSY:
         return False
     return default
 
@@ -90,3 +93,117 @@ def clamp_float(value: float, min_value: float, max_value: float) -> float:
 def clamp_int(value: int, min_value: int, max_value: int) -> int:
     """Clamp *value* into ``[min_value, max_value]``."""
     return max(min_value, min(max_value, value))
+
+
+# ── Startup env snapshot ─────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class AgentEnv:
+    """Typed snapshot of the ``TITAN_*`` env-vars used by :class:`PokerAgent`.
+
+    Built once by :func:`load_agent_env` so the agent never calls
+    ``os.getenv`` inside its decision loop.
+    """
+
+    calibration_cache_enabled: bool = True
+    calibration_session: str = "default"
+    calibration_file: str = os.path.join("reports", "action_calibration_cache.json")
+    calibration_max_scopes: int = 50
+    smoothing_enabled: bool = True
+    smoothing_alpha: float = 0.35
+    smoothing_deadzone_px: int = 3
+    ocr_ref_w: int = 720
+    ocr_ref_h: int = 1280
+    ocr_confirm_frames: int = 2
+    screen_stability_threshold: float = 0.01
+    sanity_history_size: int = 5
+    sanity_stable_frames: int = 3
+    opponents_plus_one: int | None = None
+    hud_disabled: bool = False
+    max_cycles: int | None = None
+    active_players: int | None = None
+    redis_url: str = "redis://:titan_secret@127.0.0.1:6379/0"
+    use_mock_vision: bool = False
+    mock_scenario: str = "ALT"
+
+
+def _optional_digits_env(name: str) -> int | None:
+    raw = os.getenv(name, "").strip()
+    return int(raw) if raw.isdigit() else None
+
+
+def load_agent_env() -> AgentEnv:
+    """Read every agent ``TITAN_*`` env-var once, clamped to valid ranges."""
+    opponents = _optional_digits_env("TITAN_OPPONENTS")
+    return AgentEnv(
+        calibration_cache_enabled=env_truthy("TITAN_ACTION_CALIBRATION_CACHE", default=True),
+        calibration_session=(
+            os.getenv("TITAN_ACTION_CALIBRATION_SESSION", "default").strip() or "default"
+        ),
+        calibration_file=os.getenv(
+            "TITAN_ACTION_CALIBRATION_FILE",
+            os.path.join("reports", "action_calibration_cache.json"),
+        ).strip(),
+        calibration_max_scopes=clamp_int(
+            parse_int_env("TITAN_ACTION_CALIBRATION_MAX_SCOPES", 50),
+            min_value=1, max_value=500,
+        ),
+        smoothing_enabled=env_truthy("TITAN_ACTION_SMOOTHING", default=True),
+        smoothing_alpha=clamp_float(
+            parse_float_env("TITAN_ACTION_SMOOTHING_ALPHA", 0.35),
+            min_value=0.05, max_value=1.0,
+        ),
+        smoothing_deadzone_px=clamp_int(
+            parse_int_env("TITAN_ACTION_SMOOTHING_DEADZONE_PX", 3),
+            min_value=0, max_value=50,
+        ),
+        ocr_ref_w=parse_int_env("TITAN_OCR_REF_W", 720),
+        ocr_ref_h=parse_int_env("TITAN_OCR_REF_H", 1280),
+        ocr_confirm_frames=clamp_int(
+            parse_int_env("TITAN_OCR_CONFIRM_FRAMES", 2),
+            min_value=1, max_value=5,
+        ),
+        screen_stability_threshold=clamp_float(
+            parse_float_env("TITAN_SCREEN_STABILITY_THRESHOLD", 0.01),
+            min_value=0.0001, max_value=0.50,
+        ),
+        sanity_history_size=clamp_int(
+            parse_int_env("TITAN_SANITY_HISTORY_SIZE", 5),
+            min_value=3, max_value=10,
+        ),
+        sanity_stable_frames=clamp_int(
+            parse_int_env("TITAN_SANITY_STABLE_FRAMES", 3),
+            min_value=2, max_value=5,
+        ),
+        opponents_plus_one=max(1, min(9, opponents)) + 1 if opponents is not None else None,
+        hud_disabled=env_truthy("TITAN_HUD_DISABLED"),
+        max_cycles=_optional_digits_env("TITAN_AGENT_MAX_CYCLES"),
+        active_players=_optional_digits_env("TITAN_ACTIVE_PLAYERS"),
+        redis_url=os.getenv(
+            "TITAN_REDIS_URL", "redis://:titan_secret@127.0.0.1:6379/0",
+        ).strip(),
+        use_mock_vision=parse_bool_env("TITAN_USE_MOCK_VISION", False),
+        mock_scenario=os.getenv("TITAN_MOCK_SCENARIO", "ALT").strip() or "ALT",
+    )
+
+
+_AGENT_ENV: AgentEnv | None = None
+
+
+def agent_env() -> AgentEnv:
+    """Process-wide :class:`AgentEnv`, parsed on first use and then reused.
+
+    Every :class:`PokerAgent` built in the same process shares it, so
+    agent spin-up does not re-read and re-clamp the ``TITAN_*`` vars.
+    """
+    global _AGENT_ENV
+    if _AGENT_ENV is None:
+        _AGENT_ENV = load_agent_env()
+    return _AGENT_ENV
+
+
+def refresh_agent_env() -> AgentEnv:
+    """Re-read the env-vars into the shared snapshot (tests, hot reload)."""
+    global _AGENT_ENV
+    _AGENT_ENV = load_agent_env()
+    return _AGENT_ENV
@@ -33,6 +33,8 @@ import threading
 import time
 from typing import Callable
 
+from utils.env import FALSY, TRUTHY
+
 _log = logging.getLogger("AutomationToggle")
 
 # Optional: audio beep (Windows only)
@@ -71,10 +73,10 @@ class AutomationToggle:
         beep: bool = True,
     ) -> None:
         self._hotkey = os.getenv("TITAN_TOGGLE_HOTKEY", hotkey).strip()
-        initial_env = os.getenv("TITAN_TOGGLE_INITIAL", "").strip()
-        if initial_env in ("1", "true", "yes", "on"):
+        initial_env = os.getenv("TITAN_TOGGLE_INITIAL", "").strip().lower()
+        if initial_env in TRUTHY:
             initial_state = True
-        elif initial_env in ("0", "false", "no", "off"):
+        elif initial_env in FALSY:
             initial_state = False
 
         self._active = initial_state
@@ -9,6 +9,9 @@ Storage layers (in priority order):
 1. **In-memory dict** — fastest, per-process.
 2. **Redis** — shared across agents on the same machine.
 3. **JSON file** — survives restarts (``reports/action_calibration_cache.json``).
+   Updates are appended to a JSON-lines delta journal next to it
+   (``action_calibration_cache.jsonl``) and compacted into the snapshot
+   on startup or when the journal grows past ``10 × max_scopes`` lines.
 
 Environment variables
 ---------------------
@@ -23,14 +26,32 @@ Environment variables
 
 from __future__ import annotations
 
-import json
 import os
 import time
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+from utils import json_codec
+
 
 # ── Point validation ────────────────────────────────────────────────────────
 
+_ACTION_LABELS: frozenset[str] = frozenset((
+    "fold", "call", "raise", "raise_2x", "raise_2_5x", "raise_pot", "raise_confirm",
+))
+
+
+def _is_int_pair(point: Any) -> bool:
+    return (
+        type(point) is tuple
+        and len(point) == 2
+        and type(point[0]) is int
+        and type(point[1]) is int
+    )
+
+
 def normalized_action_points(raw_points: Any) -> dict[str, tuple[int, int]]:
     """Validate and normalise raw action-point coordinates.
 
@@ -47,12 +68,18 @@ def normalized_action_points(raw_points: Any) -> dict[str, tuple[int, int]]:
     if not isinstance(raw_points, dict):
         return {}
 
+    # Already canonical (vision / local cache): copy without re-validating keys
+    if raw_points.keys() <= _ACTION_LABELS and all(
+        _is_int_pair(point) for point in raw_points.values()
+    ):
+        return dict(raw_points)
+
     normalized: dict[str, tuple[int, int]] = {}
     for raw_action, raw_point in raw_points.items():
         if not isinstance(raw_action, str):
             continue
         action = raw_action.strip().lower()
-        if action not in {"fold", "call", "raise", "raise_2x", "raise_2_5x", "raise_pot", "raise_confirm"}:
+        if action not in _ACTION_LABELS:
             continue
         if not isinstance(raw_point, (tuple, list)) or len(raw_point) != 2:
             continue
@@ -66,6 +93,37 @@ def normalized_action_points(raw_points: Any) -> dict[str, tuple[int, int]]:
 
 # ── Smoothing ───────────────────────────────────────────────────────────────
 
+@dataclass(slots=True)
+class ActionPointsSoA:
+    """Action points packed as a structure of arrays.
+
+    Attributes:
+        keys: Action names, in row order.
+        xy:   ``(N, 2)`` ``int32`` array of ``(x, y)`` coordinates.
+    """
+
+    keys: tuple[str, ...]
+    xy: np.ndarray
+
+    @classmethod
+    def from_dict(
+        cls,
+        points: dict[str, tuple[int, int]],
+        keys: tuple[str, ...] | None = None,
+    ) -> ActionPointsSoA:
+        """Pack *points* in *keys* order (defaults to the dict order)."""
+        ordered = tuple(points) if keys is None else keys
+        xy = np.array([points[k] for k in ordered], dtype=np.int32).reshape(-1, 2)
+        return cls(keys=ordered, xy=xy)
+
+    def to_dict(self) -> dict[str, tuple[int, int]]:
+        """Unpack back to ``{action: (x, y)}`` with plain Python ints."""
+        return {
+            key: (int(x), int(y))
+            for key, (x, y) in zip(self.keys, self.xy.tolist())
+        }
+
+
 def smooth_action_points(
     current_points: dict[str, tuple[int, int]],
     previous_points: dict[str, tuple[int, int]],
@@ -79,7 +137,11 @@ def smooth_action_points(
         blended = previous + (current - previous) * alpha
 
     If the delta is within ``deadzone`` pixels on both axes, the previous
-    position is kept unchanged to avoid sub-pixel jitter.
+    position is kept unchanged to avoid sub-pixel jitter.  Actions with
+    no previous position take the current one as-is.
+
+    The blend runs on :class:`ActionPointsSoA` arrays (one vectorised
+    pass over all buttons, with a mask instead of a per-point branch).
 
     Args:
         current_points:  Fresh coordinates from YOLO this frame.
@@ -90,32 +152,21 @@ def smooth_action_points(
     Returns:
         Smoothed ``{action: (x, y)}`` dict.
     """
-    if not previous_points:
+    if not previous_points or not current_points:
         return dict(current_points)
 
-    smoothed: dict[str, tuple[int, int]] = {}
+    current = ActionPointsSoA.from_dict(current_points)
+    previous_xy = np.array(
+        [previous_points.get(key, current_points[key]) for key in current.keys],
+        dtype=np.int32,
+    ).reshape(-1, 2)
 
-    for action_name, (current_x, current_y) in current_points.items():
-        previous_point = previous_points.get(action_name)
-        if previous_point is None:
-            smoothed[action_name] = (current_x, current_y)
-            continue
-
-        previous_x, previous_y = previous_point
-        delta_x = current_x - previous_x
-        delta_y = current_y - previous_y
-
-        # Inside deadzone → no update (suppress jitter).
-        if abs(delta_x) <= deadzone and abs(delta_y) <= deadzone:
-            smoothed[action_name] = (previous_x, previous_y)
-            continue
+    delta = current.xy - previous_xy
+    moved = (np.abs(delta) > deadzone).any(axis=1)
+    blended = np.rint(previous_xy + delta * alpha).astype(np.int32)
+    smoothed = np.where(np.expand_dims(moved, 1), blended, previous_xy)
 
-        # EMA blend
-        blended_x = int(round(previous_x + (delta_x * alpha)))
-        blended_y = int(round(previous_y + (delta_y * alpha)))
-        smoothed[action_name] = (blended_x, blended_y)
-
-    return smoothed
+    return ActionPointsSoA(keys=current.keys, xy=smoothed).to_dict()
 
 
 # ── File-based cache ────────────────────────────────────────────────────────
@@ -154,34 +205,182 @@ def prune_scope_entries(
     }
 
 
+def calibration_journal_path(filepath: str) -> str:
+    """Return the append-only delta journal path paired with *filepath*.
+
+    ``reports/action_calibration_cache.json`` →
+    ``reports/action_calibration_cache.jsonl``.
+    """
+    if filepath.endswith(".json"):
+        return f"{filepath}l"
+    return f"{filepath}.jsonl"
+
+
+# Journal line counts per journal path, so appends do not re-read the file.
+_journal_line_counts: dict[str, int] = {}
+
+
+def _count_journal_lines(journal_file: str) -> int:
+    try:
+        with open(journal_file, "r", encoding="utf-8") as f:
+            return sum(1 for line in f if line.strip())
+    except OSError:
+        return 0
+
+
+def _append_line(journal_file: str, line: str) -> None:
+    """Append *line*, creating the parent folder only if the open fails."""
+    try:
+        f = open(journal_file, "a", encoding="utf-8", buffering=8192)
+    except FileNotFoundError:
+        target_dir = os.path.dirname(journal_file)
+        if not target_dir:
+            raise
+        os.makedirs(target_dir, exist_ok=True)
+        f = open(journal_file, "a", encoding="utf-8", buffering=8192)
+    with f:
+        f.write(line)
+
+
+def _load_snapshot_scopes(filepath: str) -> dict[str, Any]:
+    """Read the ``scopes`` mapping from the compacted JSON snapshot."""
+    if not filepath:
+        return {}
+    try:
+        with open(filepath, "rb") as f:
+            payload = json_codec.loads(f.read())
+    except Exception:
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    scopes = payload.get("scopes", {})
+    return scopes if isinstance(scopes, dict) else {}
+
+
+def _replay_journal(journal_file: str, scopes: dict[str, Any]) -> int:
+    """Apply journal deltas onto *scopes* in place (latest line wins).
+
+    Returns the number of journal lines read (malformed lines included,
+    since they still count towards the compaction threshold).  A missing
+    journal simply reads as zero lines.
+    """
+    line_count = 0
+    try:
+        with open(journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                line_count += 1
+                try:
+                    entry = json_codec.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(entry, dict):
+                    continue
+                scope_key = entry.get("scope")
+                points = entry.get("points")
+                if not isinstance(scope_key, str) or not isinstance(points, dict):
+                    continue
+                scopes[scope_key] = {
+                    "updated_at": str(entry.get("updated_at", "")),
+                    "points": points,
+                }
+    except OSError:
+        return line_count
+    return line_count
+
+
+# O_BINARY stops the Windows CRT from translating newlines (0 on POSIX).
+_SNAPSHOT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_snapshot(filepath: str, scopes: dict[str, Any]) -> bool:
+    """Atomically write the compacted snapshot.
+
+    The payload is encoded once to bytes, written straight to a raw fd,
+    fsync'd and then swapped in with ``os.replace`` so a crash never
+    leaves a truncated snapshot behind.
+    """
+    payload: dict[str, Any] = {
+        "version": 1,
+        "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scopes": scopes,
+    }
+
+    target_dir = os.path.dirname(filepath)
+    if target_dir:
+        os.makedirs(target_dir, exist_ok=True)
+
+    temp_file = f"{filepath}.tmp"
+    try:
+        data = memoryview(json_codec.dumps_bytes(payload, indent=True))
+        fd = os.open(temp_file, _SNAPSHOT_OPEN_FLAGS, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_file, filepath)
+        return True
+    except Exception:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        return False
+
+
+def compact_calibration_file(filepath: str, max_scopes: int | None = None) -> dict[str, Any]:
+    """Fold the delta journal into the JSON snapshot and truncate the journal.
+
+    Args:
+        filepath:   Snapshot JSON file path.
+        max_scopes: Prune to this many scopes (``None`` keeps all).
+
+    Returns:
+        The compacted ``scopes`` mapping.
+    """
+    journal_file = calibration_journal_path(filepath)
+    scopes = _load_snapshot_scopes(filepath)
+    replayed = _replay_journal(journal_file, scopes)
+    if max_scopes is not None:
+        scopes = prune_scope_entries(scopes, max_scopes)
+
+    if replayed and _write_snapshot(filepath, scopes):
+        try:
+            os.remove(journal_file)
+        except OSError:
+            pass
+        _journal_line_counts[journal_file] = 0
+    return scopes
+
+
 def restore_calibration_from_file(
     filepath: str,
     scope_key: str,
+    max_scopes: int | None = None,
 ) -> dict[str, tuple[int, int]]:
-    """Load cached action points from the JSON calibration file.
+    """Load cached action points from the snapshot + delta journal.
+
+    Pending journal deltas are compacted into the snapshot first, so
+    startup leaves a single up-to-date JSON file behind.
 
     Args:
-        filepath:  Absolute or relative path to the JSON cache.
-        scope_key: ``<table_id>::<session_id>`` key inside ``scopes``.
+        filepath:   Absolute or relative path to the JSON cache.
+        scope_key:  ``<table_id>::<session_id>`` key inside ``scopes``.
+        max_scopes: Prune limit applied while compacting.
 
     Returns:
         Normalised action points, or empty dict on any failure.
     """
-    if not filepath or not os.path.exists(filepath):
+    if not filepath:
         return {}
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            payload = json.load(f)
+        scopes = compact_calibration_file(filepath, max_scopes)
     except Exception:
         return {}
 
-    if not isinstance(payload, dict):
-        return {}
-
-    scopes = payload.get("scopes", {})
-    if not isinstance(scopes, dict):
-        return {}
-
     scope_payload = scopes.get(scope_key, {})
     scope_points = (
         scope_payload.get("points", {})
@@ -197,62 +396,43 @@ def persist_calibration_to_file(
     points: dict[str, tuple[int, int]],
     max_scopes: int,
 ) -> None:
-    """Atomically write calibration points to the JSON cache file.
+    """Append calibration points to the delta journal.
 
-    Uses a write-to-temp + ``os.replace`` strategy for crash safety.
+    Each call writes a single JSON line (``{"scope", "points",
+    "updated_at"}``) instead of rewriting the whole snapshot.  Once the
+    journal grows past ``10 × max_scopes`` lines it is compacted into
+    the snapshot via :func:`compact_calibration_file`.
 
     Args:
-        filepath:   Target JSON file path.
+        filepath:   Target JSON snapshot path.
         scope_key:  ``<table_id>::<session_id>`` key.
         points:     Action points to persist.
         max_scopes: Maximum scope entries before old ones are pruned.
     """
     norm_points = normalized_action_points(points)
-    if not norm_points:
+    if not norm_points or not filepath:
         return
 
-    existing_payload: dict[str, Any] = {}
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-            if isinstance(loaded, dict):
-                existing_payload = loaded
-        except Exception:
-            existing_payload = {}
-
-    scopes = existing_payload.get("scopes", {})
-    if not isinstance(scopes, dict):
-        scopes = {}
-
-    scopes[scope_key] = {
-        "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    entry = {
+        "scope": scope_key,
         "points": {
             action: [int(xy[0]), int(xy[1])]
             for action, xy in norm_points.items()
         },
-    }
-
-    scopes = prune_scope_entries(scopes, max_scopes)
-
-    payload: dict[str, Any] = {
-        "version": 1,
         "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
-        "scopes": scopes,
     }
 
-    target_dir = os.path.dirname(filepath)
-    if target_dir:
-        os.makedirs(target_dir, exist_ok=True)
+    journal_file = calibration_journal_path(filepath)
+    line_count = _journal_line_counts.get(journal_file)
+    if line_count is None:
+        line_count = _count_journal_lines(journal_file)
 
-    temp_file = f"{filepath}.tmp"
     try:
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        os.replace(temp_file, filepath)
+        _append_line(journal_file, json_codec.dumps(entry) + "\n")
     except Exception:
-        try:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-        except Exception:
-            pass
+        return
+
+    line_count += 1
+    _journal_line_counts[journal_file] = line_count
+    if line_count > 10 * max(1, max_scopes):
+        compact_calibration_file(filepath, max_scopes)
@@ -48,6 +48,7 @@ from random import gauss, lognormvariate, random, uniform
 from typing import Any
 
 from utils.logger import TitanLogger
+from utils.env import env_truthy
 from tools.mouse_protocol import (  # canonical definitions
     ClickPoint,
     GhostMouseConfig,
@@ -763,9 +764,7 @@ class GhostMouse:
             self._android_h = int(os.getenv("TITAN_ANDROID_H", "1280"))
             self._console_exe = _find_console_exe(self._emu_profile)
             self._emu_index = int(os.getenv("TITAN_EMU_INDEX", "0"))
-            self._enabled = os.getenv(
-                "TITAN_GHOST_MOUSE", "0"
-            ).strip().lower() in {"1", "true", "yes", "on"}
+            self._enabled = env_truthy("TITAN_GHOST_MOUSE")
 
             # NOTE: Digitizer discovery deferred â€” it calls ADB which
             # restarts the daemon and kills the emulator network bridge.
@@ -781,16 +780,12 @@ class GhostMouse:
                 f"enabled={self._enabled}"
             )
         elif self._input_backend == "adb":
-            self._enabled = os.getenv(
-                "TITAN_GHOST_MOUSE", "0"
-            ).strip().lower() in {"1", "true", "yes", "on"}
+            self._enabled = env_truthy("TITAN_GHOST_MOUSE")
             self._log.info(
                 f"ADB backend: exe={self._adb_exe} device={self._adb_device} enabled={self._enabled}"
             )
         else:
-            self._enabled = _HAS_PYAUTOGUI and os.getenv(
-                "TITAN_GHOST_MOUSE", "0"
-            ).strip().lower() in {"1", "true", "yes", "on"}
+            self._enabled = _HAS_PYAUTOGUI and env_truthy("TITAN_GHOST_MOUSE")
 
         # Offset da janela do emulador (definido pelo agente via set_window_offset)
         self._window_left: int = 0
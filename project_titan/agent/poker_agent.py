@@ -11,7 +11,7 @@ Architecture
 ------------
 ::
 
-    ┌─────────────┐   ZMQ REQ/REP   ┌──────────────┐
+    ┌─────────────┐ ZMQ DEALER/REP  ┌──────────────┐
     │ PokerAgent  │ ◄─────────────► │  HiveBrain   │
     │  (run loop) │                 │  (orchestr.) │
     └──────┬──────┘                 └──────────────┘
@@ -29,33 +29,37 @@ See :mod:`agent.agent_config` for config-level vars and
 
 from __future__ import annotations
 
+import atexit
+import functools
 import os
+import threading
 import time
+import weakref
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Any
 
 from memory.redis_memory import RedisMemory
-from agent.sanity_guard import SanityGuard
+from agent.sanity_guard import OCR_KEY_IDS, OCR_KEYS, SanityGuard, sanitize_ocr_scalar
 from agent.vision_mock import MockVision
-from agent.vision_ocr import TitanOCR
-from agent.vision_yolo import VisionYolo
 from tools.action_tool import ActionTool
 from tools.equity_tool import EquityTool
 from tools.rng_tool import RngTool
 from tools.terminator_vision import TerminatorVision
 from tools.titan_hud_state import hud_state
-from tools.vision_tool import VisionTool
+from tools.vision_models import TableSnapshot
 from utils.config import AgentRuntimeConfig, OCRRuntimeConfig, VisionRuntimeConfig
+from utils.json_codec import dumps_bytes as json_dumps_bytes, loads as json_loads
 from utils.logger import TitanLogger
 from utils.titan_config import cfg
 from workflows.poker_hand_workflow import PokerHandWorkflow
 
 from agent.agent_config import (
     AgentConfig,
-    clamp_float,
-    clamp_int,
+    AgentEnv,
+    agent_env,
     parse_bool_env,
-    parse_float_env,
-    parse_int_env,
 )
 from agent.calibration import (
     normalized_action_points,
@@ -69,6 +73,50 @@ try:
 except Exception:
     zmq = None
 
+# Minimum spacing between calibration file writes; the latest points are
+# still flushed when the run loop exits.
+_CALIBRATION_PERSIST_INTERVAL_S = 60.0
+
+# Per-cycle summary line; formatted lazily by TitanLogger only when emitted.
+_CYCLE_LOG_TEMPLATE = (
+    "mode=%s partners=%s dead_cards=%s active_players=%s "
+    "hu_obf=%s latency_ms=%s my_turn=%s state_changed=%s "
+    "pot=%.2f stack=%.2f call=%.2f action_points=%s action_calibration=%s "
+    "cycle=%s cycle_ms=%.2f decision=%s amount=%s equity=%s spr=%s "
+    "mode=%s committed=%s desc=%s"
+)
+
+_NORMALIZE_CACHE_MAX = 256
+
+# DEALER timeouts don't wedge the socket: rebuild only after this many
+# consecutive requests went unanswered (HiveBrain likely restarted).
+_ZMQ_MAX_MISSED_REPLIES = 3
+
+
+def _request_head(message_type: str, config: AgentConfig) -> bytes:
+    """Encode the fixed fields of a HiveBrain request as an open JSON object.
+
+    ``head + encoded_tail[1:]`` is the full request, so the per-cycle
+    serialisation only covers the fields that change.
+    """
+    head = json_dumps_bytes({
+        "type": message_type,
+        "agent_id": config.agent_id,
+        "table_id": config.table_id,
+    })
+    return head[:-1] + b","
+
+
+def _flush_calibration_at_exit(flush_ref: weakref.WeakMethod) -> None:
+    """``atexit`` hook: flush the agent's calibration if it is still alive."""
+    flush = flush_ref()
+    if flush is not None:
+        flush()
+
+
+# HUD action-log line: "[HH:MM:SS] #cycle ACTION | Eq 72% | Pot 40 | SPR 2.5 | SOLO"
+_HUD_ACTION_TEMPLATE = "[%s] #%d %s | Eq %.0f%% | Pot %.0f | SPR %.1f | %s"
+
 
 class PokerAgent:
     """Autonomous poker agent with ZMQ check-in and calibrated actions.
@@ -82,6 +130,29 @@ class PokerAgent:
         self.config = config
         self._context: Any | None = None
         self._socket: Any | None = None
+        self._poller: Any | None = None
+        # Consecutive unanswered requests; the socket is only rebuilt after
+        # ``_ZMQ_MAX_MISSED_REPLIES`` of them.
+        self._missed_replies = 0
+        # All ZMQ traffic runs on this single worker so the check-in
+        # round-trip overlaps with OCR and replies arrive in order.
+        self._zmq_executor: ThreadPoolExecutor | None = None
+        # Requests = pre-encoded fixed head + reused per-cycle tail dict
+        # (tails are only touched from the ZMQ worker)
+        self._checkin_head = _request_head("checkin", config)
+        self._checkin_tail: dict[str, Any] = {
+            "cycle_id": 0,
+            "cards": [],
+            "active_players": 0,
+            "last_action": "",
+        }
+        self._decision_head = _request_head("decision", config)
+        self._decision_tail: dict[str, Any] = {
+            "cycle_id": 0,
+            "action": "",
+            "amount": 0.0,
+            "target": None,
+        }
 
         # ── Memory backend ──────────────────────────────────────────
         self.memory = RedisMemory(
@@ -89,37 +160,42 @@ class PokerAgent:
             ttl_seconds=3600,
         )
 
-        # ── Calibration settings (from env-vars) ───────────────────
-        self._action_calibration_cache: dict[str, dict[str, tuple[int, int]]] = {}
-        self._action_calibration_cache_enabled = os.getenv(
-            "TITAN_ACTION_CALIBRATION_CACHE", "1"
-        ).strip().lower() in {"1", "true", "yes", "on"}
+        # ── Env-vars (read once) ────────────────────────────────────
+        env: AgentEnv = agent_env()
+        self._env_opponents_plus_one = env.opponents_plus_one
+        self._hud_disabled = env.hud_disabled
 
-        self._action_calibration_session_id = (
-            os.getenv("TITAN_ACTION_CALIBRATION_SESSION", "default").strip() or "default"
-        )
-        self._action_calibration_file = os.getenv(
-            "TITAN_ACTION_CALIBRATION_FILE",
-            os.path.join("reports", "action_calibration_cache.json"),
-        ).strip()
-        self._action_calibration_max_scopes = clamp_int(
-            parse_int_env("TITAN_ACTION_CALIBRATION_MAX_SCOPES", 50),
-            min_value=1, max_value=500,
-        )
+        # ── Calibration settings ───────────────────────────────────
+        self._action_calibration_cache: dict[str, dict[str, tuple[int, int]]] = {}
+        self._action_calibration_cache_enabled = env.calibration_cache_enabled
+        self._action_calibration_session_id = env.calibration_session
+        self._action_calibration_file = env.calibration_file
+        self._action_calibration_max_scopes = env.calibration_max_scopes
+        # table_id and session are fixed for the agent lifetime
+        self._scope_key = self._cache_scope_key()
+        self._last_persisted_points_hash: int | None = None
+        self._last_persist_at = float("-inf")
+
+        # Short-circuit state for stable YOLO button coordinates.
+        self._last_direct_hash: int | None = None
+        self._last_raw_points: dict[str, Any] | None = None
+        # Tables whose Redis ``action_points_cache`` key was already read:
+        # afterwards the local cache is authoritative (we write both).
+        self._redis_points_checked: set[str] = set()
+        self._last_effective_points: dict[str, tuple[int, int]] = {}
+        self._last_set_hash: int | None = None
+        self._last_hero_cards_tuple: tuple[str, ...] = ()
+        # Journal writes are spaced out; flush the pending points even when
+        # the loop dies without reaching its normal shutdown path.
+        self._register_exit_flush()
+        self._normalize_cache: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self._last_ts_second = -1
+        self._last_ts_str = ""
 
         # ── Smoothing settings ──────────────────────────────────────
-        self._action_smoothing_enabled = os.getenv(
-            "TITAN_ACTION_SMOOTHING", "1"
-        ).strip().lower() in {"1", "true", "yes", "on"}
-
-        self._action_smoothing_alpha = clamp_float(
-            parse_float_env("TITAN_ACTION_SMOOTHING_ALPHA", 0.35),
-            min_value=0.05, max_value=1.0,
-        )
-        self._action_smoothing_deadzone_px = clamp_int(
-            parse_int_env("TITAN_ACTION_SMOOTHING_DEADZONE_PX", 3),
-            min_value=0, max_value=50,
-        )
+        self._action_smoothing_enabled = env.smoothing_enabled
+        self._action_smoothing_alpha = env.smoothing_alpha
+        self._action_smoothing_deadzone_px = env.smoothing_deadzone_px
 
         # ── Tool construction ──────────────────────────────────────
         vision_config = VisionRuntimeConfig()
@@ -127,6 +203,10 @@ class PokerAgent:
         if self._use_mock_vision:
             self.vision = MockVision(scenario=config.mock_vision_scenario)
         else:
+            # YOLO / OCR backends (cv2, ultralytics) are only imported when
+            # the real vision pipeline is used.
+            from tools.vision_tool import VisionTool
+
             self.vision = VisionTool(
                 model_path=vision_config.model_path,
                 monitor=vision_config.monitor_region(),
@@ -135,52 +215,73 @@ class PokerAgent:
         # OCR pipeline (pot / stack / call)
         self.ocr_config = OCRRuntimeConfig()
 
-        # Auto-detect Tesseract if not configured
-        _tess_cmd = self.ocr_config.tesseract_cmd or None
-        if not _tess_cmd:
-            import shutil
-            _tess_default = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-            if os.path.isfile(_tess_default):
-                _tess_cmd = _tess_default
-            elif shutil.which("tesseract"):
-                _tess_cmd = shutil.which("tesseract")
-
-        self.ocr = TitanOCR(
-            use_easyocr=self.ocr_config.use_easyocr,
-            tesseract_cmd=_tess_cmd,
-        )
-        self.ocr_vision = VisionYolo(model_path=vision_config.model_path)
+        # Mock vision never reads the screen: no capture / OCR backends.
+        self.ocr: Any | None = None
+        self.ocr_vision: Any | None = None
+        if not self._use_mock_vision:
+            from agent.vision_ocr import TitanOCR
+            from agent.vision_yolo import VisionYolo
+
+            # Auto-detect Tesseract if not configured
+            _tess_cmd = self.ocr_config.tesseract_cmd or None
+            if not _tess_cmd:
+                import shutil
+                _tess_default = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+                if os.path.isfile(_tess_default):
+                    _tess_cmd = _tess_default
+                elif shutil.which("tesseract"):
+                    _tess_cmd = shutil.which("tesseract")
+
+            self.ocr = TitanOCR(
+                use_easyocr=self.ocr_config.use_easyocr,
+                tesseract_cmd=_tess_cmd,
+            )
+            self.ocr_vision = VisionYolo(model_path=vision_config.model_path)
         # Reference Android resolution for OCR region scaling
-        self._ocr_ref_w = int(os.getenv("TITAN_OCR_REF_W", "720"))
-        self._ocr_ref_h = int(os.getenv("TITAN_OCR_REF_H", "1280"))
+        self._ocr_ref_w = env.ocr_ref_w
+        self._ocr_ref_h = env.ocr_ref_h
+        # OCR regions are static for the session: resolve once, and cache
+        # the clamped slices for the last seen frame size.
+        self._ocr_regions = self.ocr_config.regions()
+        self._ocr_slices: list[tuple[str, int, slice | None, slice | None]] = []
+        self._ocr_slices_size: tuple[int, int] | None = None
         self._ocr_last_values: dict[str, float] = {
             "pot": 0.0,
             "hero_stack": 0.0,
             "call_amount": 0.0,
         }
-        self._ocr_pending_values: dict[str, tuple[float, int]] = {}
-        self._ocr_confirm_frames = clamp_int(
-            parse_int_env("TITAN_OCR_CONFIRM_FRAMES", 2),
-            min_value=1,
-            max_value=5,
+        # Read-only live view handed to callers (no per-cycle dict copy)
+        self._ocr_last_values_view: Mapping[str, float] = MappingProxyType(
+            self._ocr_last_values,
         )
-        self._screen_stability_threshold = clamp_float(
-            parse_float_env("TITAN_SCREEN_STABILITY_THRESHOLD", 0.01),
-            min_value=0.0001,
-            max_value=0.50,
+        self._ocr_confirm_frames = env.ocr_confirm_frames
+        # Guard state indexed by OCR_KEY_IDS: (min, max, max_delta) limits
+        # frozen at startup and the pending (value, count) jump per metric.
+        _limits = self.ocr_config.value_limits()
+        _deltas = self.ocr_config.max_deltas()
+        self._ocr_guard_limits: tuple[tuple[float, float, float], ...] = tuple(
+            (*_limits[key], float(_deltas[key])) for key in OCR_KEYS
         )
-        self._prev_ocr_frame: Any | None = None
+        self._ocr_pending: list[tuple[float, int]] = [(0.0, 0)] * len(OCR_KEYS)
+        # Warm-up: dispara a compilação JIT (numba) fora do loop principal
+        sanitize_ocr_scalar(0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0, 1)
+        self._screen_stability_threshold = env.screen_stability_threshold
+        # Previous frame kept only as (full shape, reduced signature)
+        self._prev_ocr_signature: tuple[tuple[int, ...], Any] | None = None
+
+        # Double-buffered capture: a background thread keeps the latest
+        # frame in a single slot while the main loop runs the workflow.
+        self._capture_thread: threading.Thread | None = None
+        self._capture_stop = threading.Event()
+        self._frame_ready = threading.Event()
+        # Set by the consumer when it takes a frame: the producer captures
+        # at most one frame ahead of the agent loop.
+        self._frame_taken = threading.Event()
+        self._latest_frame: Any | None = None
+
         self.sanity_guard = SanityGuard(
-            history_size=clamp_int(
-                parse_int_env("TITAN_SANITY_HISTORY_SIZE", 5),
-                min_value=3,
-                max_value=10,
-            ),
-            stable_frames=clamp_int(
-                parse_int_env("TITAN_SANITY_STABLE_FRAMES", 3),
-                min_value=2,
-                max_value=5,
-            ),
+            history_size=env.sanity_history_size,
+            stable_frames=env.sanity_stable_frames,
         )
 
         self.equity = EquityTool()
@@ -212,128 +313,192 @@ class PokerAgent:
     _card_to_pt = staticmethod(_card_to_pt_fn)
 
     def _log_seen_cards(self, logger: TitanLogger, cards: list[str]) -> None:
-        if not cards:
-            return
-        spoken = [text for text in (self._card_to_pt(card) for card in cards) if text]
-        if not spoken:
+        cards_key = tuple(cards)
+        if cards_key == self._last_hero_cards_tuple:
             return
-        logger.info(f"Eu vejo um {spoken[0]}")
+        self._last_hero_cards_tuple = cards_key
+        # Only the first readable card is announced: stop translating there.
+        spoken = next((text for text in map(self._card_to_pt, cards_key) if text), None)
+        if spoken is not None:
+            logger.info("Eu vejo um %s", spoken)
+
+    def _clock_hms(self) -> str:
+        """``HH:MM:SS`` wall-clock string, re-formatted at most once per second."""
+        now_s = int(time.time())
+        if now_s != self._last_ts_second:
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now_s))
+            self._last_ts_second = now_s
+        return self._last_ts_str
 
     # ── OCR helpers ────────────────────────────────────────────────
 
-    @staticmethod
-    def _crop_region(frame: Any, region: tuple[int, int, int, int]) -> Any | None:
-        if frame is None:
-            return None
-        x, y, w, h = region
-        try:
-            frame_h, frame_w = frame.shape[:2]
-        except Exception:
-            return None
+    def _build_region_slices(
+        self, frame_h: int, frame_w: int,
+    ) -> list[tuple[str, int, slice | None, slice | None]]:
+        """Scale + clamp the OCR regions for a ``frame_w`` x ``frame_h`` frame.
 
-        x1 = max(0, min(frame_w, int(x)))
-        y1 = max(0, min(frame_h, int(y)))
-        x2 = max(0, min(frame_w, x1 + int(w)))
-        y2 = max(0, min(frame_h, y1 + int(h)))
-        if x2 <= x1 or y2 <= y1:
-            return None
-        return frame[y1:y2, x1:x2]
+        Regions are in the reference coordinate system
+        (``_ocr_ref_w`` x ``_ocr_ref_h``) and are auto-scaled proportionally
+        when the frame differs by more than 2%.  Each entry carries the
+        metric id from :data:`OCR_KEY_IDS`; empty regions map to
+        ``(key, key_id, None, None)``.
+        """
+        sx = frame_w / self._ocr_ref_w if self._ocr_ref_w > 0 else 1.0
+        sy = frame_h / self._ocr_ref_h if self._ocr_ref_h > 0 else 1.0
+        scale = abs(sx - 1.0) > 0.02 or abs(sy - 1.0) > 0.02
+
+        slices: list[tuple[str, int, slice | None, slice | None]] = []
+        for key, (x, y, w, h) in self._ocr_regions.items():
+            if scale:
+                x, y, w, h = int(x * sx), int(y * sy), int(w * sx), int(h * sy)
+            x1 = max(0, min(frame_w, int(x)))
+            y1 = max(0, min(frame_h, int(y)))
+            x2 = max(0, min(frame_w, x1 + int(w)))
+            y2 = max(0, min(frame_h, y1 + int(h)))
+            if x2 <= x1 or y2 <= y1:
+                slices.append((key, OCR_KEY_IDS[key], None, None))
+            else:
+                slices.append((key, OCR_KEY_IDS[key], slice(y1, y2), slice(x1, x2)))
+        return slices
 
-    def _read_ocr_metrics(self) -> dict[str, float]:
+    def _read_ocr_metrics(self) -> Mapping[str, float]:
         """Read pot/stack/call via OCR with safe fallback semantics."""
-        if not self.ocr_config.enabled:
-            return dict(self._ocr_last_values)
+        if not self.ocr_config.enabled or self.ocr_vision is None:
+            return self._ocr_last_values_view
 
         frame = self.ocr_vision.capture_frame()
         if frame is None:
-            return dict(self._ocr_last_values)
+            return self._ocr_last_values_view
         return self._read_ocr_metrics_from_frame(frame)
 
-    def _read_ocr_metrics_from_frame(self, frame: Any) -> dict[str, float]:
+    def _read_ocr_metrics_from_frame(self, frame: Any) -> Mapping[str, float]:
         """Read OCR metrics from a pre-captured frame.
 
-        If the frame dimensions differ from the reference OCR region
-        coordinate system (``_ocr_ref_w`` x ``_ocr_ref_h``), regions
-        are auto-scaled proportionally.
+        Region slices are built once per frame size (see
+        :meth:`_build_region_slices`), so each cycle only indexes the frame.
+        Values are updated in place; the return is a live read-only view.
         """
-        if frame is None:
-            return dict(self._ocr_last_values)
-
-        regions = self.ocr_config.regions()
-        updated = dict(self._ocr_last_values)
+        if frame is None or self.ocr is None:
+            return self._ocr_last_values_view
 
-        # Auto-scale regions if frame size differs from reference
+        updated = self._ocr_last_values
         try:
-            frame_h, frame_w = frame.shape[:2]
+            frame_size = (int(frame.shape[0]), int(frame.shape[1]))
         except Exception:
-            frame_h, frame_w = self._ocr_ref_h, self._ocr_ref_w
-
-        sx = frame_w / self._ocr_ref_w if self._ocr_ref_w > 0 else 1.0
-        sy = frame_h / self._ocr_ref_h if self._ocr_ref_h > 0 else 1.0
+            frame_size = (0, 0)
+        if frame_size != self._ocr_slices_size:
+            self._ocr_slices = self._build_region_slices(*frame_size)
+            self._ocr_slices_size = frame_size
 
-        for key, region in regions.items():
-            x, y, w, h = region
-            if abs(sx - 1.0) > 0.02 or abs(sy - 1.0) > 0.02:
-                x = int(x * sx)
-                y = int(y * sy)
-                w = int(w * sx)
-                h = int(h * sy)
-            crop = self._crop_region(frame, (x, y, w, h))
+        for key, key_id, rows, cols in self._ocr_slices:
+            crop = frame[rows, cols] if rows is not None else None
             value = self.ocr.read_numeric_region(
                 crop,
                 key=key,
                 fallback=updated.get(key, 0.0),
             )
             updated[key] = self._sanitize_ocr_value(
-                key=key,
+                key_id,
                 candidate=max(0.0, float(value)),
                 previous=updated.get(key, 0.0),
             )
 
-        self._ocr_last_values = updated
-        return updated
-
-    def _sanitize_ocr_value(self, key: str, candidate: float, previous: float) -> float:
-        """Filter noisy OCR values by bounds and max-delta guards."""
-        limits = self.ocr_config.value_limits()
-        deltas = self.ocr_config.max_deltas()
-
-        min_value, max_value = limits.get(key, (0.0, 1_000_000.0))
-        safe_candidate = max(0.0, float(candidate))
-        safe_previous = max(0.0, float(previous))
-
-        if key == "pot" and safe_candidate <= 1.0:
-            return safe_previous if safe_previous > 0 else 0.0
+        return self._ocr_last_values_view
 
-        if key == "hero_stack" and safe_previous >= 50.0 and safe_candidate <= 5.0:
-            return safe_previous
+    def _sanitize_ocr_value(self, key_id: int, candidate: float, previous: float) -> float:
+        """Filter noisy OCR values by bounds and max-delta guards.
 
-        if safe_candidate < min_value or safe_candidate > max_value:
-            return safe_previous
-
-        max_delta = float(deltas.get(key, 0.0))
-        if max_delta > 0 and safe_previous > 0:
-            if abs(safe_candidate - safe_previous) > max_delta:
-                pending_value, pending_count = self._ocr_pending_values.get(
-                    key,
-                    (safe_candidate, 0),
-                )
-                pending_epsilon = max(1.0, max_delta * 0.10)
-                if abs(pending_value - safe_candidate) <= pending_epsilon:
-                    pending_count += 1
-                else:
-                    pending_value = safe_candidate
-                    pending_count = 1
+        *key_id* indexes :data:`OCR_KEYS`; limits and pending-jump state
+        live in per-metric tuples so no dict lookups happen per frame.
+        """
+        min_value, max_value, max_delta = self._ocr_guard_limits[key_id]
+        pending_value, pending_count = self._ocr_pending[key_id]
+        value, pending_value, pending_count = sanitize_ocr_scalar(
+            key_id,
+            float(candidate),
+            float(previous),
+            min_value,
+            max_value,
+            max_delta,
+            pending_value,
+            pending_count,
+            self._ocr_confirm_frames,
+        )
+        self._ocr_pending[key_id] = (pending_value, pending_count)
+        return value
 
-                self._ocr_pending_values[key] = (pending_value, pending_count)
-                if pending_count >= self._ocr_confirm_frames:
-                    self._ocr_pending_values.pop(key, None)
-                    return pending_value
-                return safe_previous
+    # ── Frame capture (background thread) ──────────────────────────
 
-        self._ocr_pending_values.pop(key, None)
+    def _capture_loop(self) -> None:
+        """Producer loop: keep ``_latest_frame`` filled with the newest capture.
 
-        return safe_candidate
+        Uses mss first and falls back to ADB ``screencap`` (mss fails when
+        the emulator window is occluded).  After publishing a frame the
+        loop waits until the agent loop takes it (at most one agent
+        interval), so capture runs at the agent's pace, not ``target_fps``.
+        ADB is last resort: each ``screencap`` is followed by one agent
+        interval of back-off (heavy ADB traffic can break the emulator's
+        network bridge), as is a cycle where both captures fail.
+        """
+        backoff_s = max(0.1, float(self.config.interval_seconds))
+        while not self._capture_stop.is_set():
+            used_adb = False
+            try:
+                frame = self.ocr_vision.capture_frame()
+                if frame is None:
+                    used_adb = True
+                    frame = self.ocr_vision.capture_frame_adb()
+            except Exception:
+                frame = None
+            if frame is None:
+                self._capture_stop.wait(backoff_s)
+                continue
+            self._frame_taken.clear()
+            self._latest_frame = frame
+            self._frame_ready.set()
+            if used_adb:
+                self._capture_stop.wait(backoff_s)
+            self._frame_taken.wait(timeout=backoff_s)
+
+    def _start_capture_thread(self) -> None:
+        """Start the background capture thread (idempotent)."""
+        if self.ocr_vision is None:
+            return
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+        self._capture_stop.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            name=f"titan-capture-{self.config.agent_id}",
+            daemon=True,
+        )
+        self._capture_thread.start()
+
+    def _stop_capture_thread(self) -> None:
+        """Signal the capture thread to stop and wait briefly for it."""
+        self._capture_stop.set()
+        self._frame_taken.set()
+        thread = self._capture_thread
+        if thread is not None:
+            thread.join(timeout=2.0)
+        self._capture_thread = None
+
+    def _next_capture_frame(self, timeout: float) -> Any | None:
+        """Return the freshest captured frame, waiting up to *timeout* seconds.
+
+        The frame is handed off: ``_latest_frame`` is cleared and the
+        producer is released.  Returns ``None`` if no new frame arrived in
+        time, so the same pixels are never OCR'd twice (always ``None``
+        with mock vision, which has no capture thread).
+        """
+        if self.ocr_vision is None:
+            return None
+        if not self._frame_ready.wait(timeout=timeout):
+            return None
+        self._frame_ready.clear()
+        frame, self._latest_frame = self._latest_frame, None
+        self._frame_taken.set()
+        return frame
 
     # ── Calibration cache helpers ───────────────────────────────────
 
@@ -349,51 +514,127 @@ class PokerAgent:
         """Load persisted action points from the JSON calibration file."""
         if not self._action_calibration_cache_enabled:
             return
-        scope_key = self._cache_scope_key()
         scoped_points = restore_calibration_from_file(
-            self._action_calibration_file, scope_key,
+            self._action_calibration_file, self._scope_key,
+            max_scopes=self._action_calibration_max_scopes,
         )
         if not scoped_points:
             return
+        self._last_persisted_points_hash = hash(tuple(sorted(scoped_points.items())))
         self._action_calibration_cache[self.config.table_id] = dict(scoped_points)
         self.memory.set(
             f"action_points_cache:{self.config.table_id}", dict(scoped_points),
         )
 
     def _persist_action_calibration_file_cache(
-        self, points: dict[str, tuple[int, int]],
+        self, points: dict[str, tuple[int, int]], *, force: bool = False,
     ) -> None:
-        """Write calibration points to the JSON cache file."""
-        if not self._action_calibration_cache_enabled:
+        """Append calibration points to the cache journal.
+
+        Skips points equal to the last persisted ones and, unless *force*
+        is set, writes at most once per ``_CALIBRATION_PERSIST_INTERVAL_S``.
+        """
+        if not self._action_calibration_cache_enabled or not points:
             return
+        points_hash = hash(tuple(sorted(points.items())))
+        if points_hash == self._last_persisted_points_hash:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_persist_at < _CALIBRATION_PERSIST_INTERVAL_S:
+            return
+        self._last_persist_at = now
         persist_calibration_to_file(
             filepath=self._action_calibration_file,
-            scope_key=self._cache_scope_key(),
+            scope_key=self._scope_key,
             points=points,
             max_scopes=self._action_calibration_max_scopes,
         )
+        self._last_persisted_points_hash = points_hash
+
+    def _flush_action_calibration(self) -> None:
+        """Force-write the latest effective points if they were not persisted."""
+        try:
+            self._persist_action_calibration_file_cache(
+                self._last_effective_points, force=True,
+            )
+        except Exception:
+            pass
+
+    def _register_exit_flush(self) -> None:
+        """Flush calibration at interpreter exit without pinning the agent.
+
+        The hook holds a weak reference, so a discarded agent (and its
+        Redis client, vision and OCR backends) can still be collected.
+        ``run()`` unregisters it after its own final flush.
+        """
+        self._exit_flush = functools.partial(
+            _flush_calibration_at_exit,
+            weakref.WeakMethod(self._flush_action_calibration),
+        )
+        atexit.register(self._exit_flush)
+
+    def _set_action_regions(self, points: dict[str, tuple[int, int]]) -> None:
+        """Push *points* to the ActionTool, skipping unchanged coordinates."""
+        points_hash = hash(tuple(sorted(points.items())))
+        if points_hash == self._last_set_hash:
+            return
+        self.action.set_action_regions_from_xy(points)
+        self._last_set_hash = points_hash
+
+    def _cached_action_points(self, table_id: str) -> dict[str, tuple[int, int]]:
+        """Local calibration cache, seeded from Redis on the first miss only."""
+        cached_points = self._action_calibration_cache.get(table_id)
+        if cached_points or table_id in self._redis_points_checked:
+            return cached_points or {}
+        self._redis_points_checked.add(table_id)
+        memory_cached = normalized_action_points(
+            self.memory.get(f"action_points_cache:{table_id}", {}),
+        )
+        if memory_cached:
+            self._action_calibration_cache[table_id] = dict(memory_cached)
+        return memory_cached
 
     def _apply_action_calibration(
-        self, snapshot: Any,
+        self, snapshot: TableSnapshot, writer: Any | None = None,
     ) -> tuple[dict[str, tuple[int, int]], str]:
         """Resolve action-button coordinates from vision, cache or nothing.
 
+        Memory writes go to *writer* (a :class:`MemoryPipeline` from the run
+        loop) when given, otherwise straight to ``self.memory``.
+
+        When YOLO reports the same coordinates as the previous cycle and
+        smoothing has already converged on them, the cached result is
+        returned without re-normalising, re-smoothing, re-caching or
+        re-persisting (raw dict equality first, then the normalised hash).
+
         Returns:
             Tuple of ``(effective_points, source)`` where *source* is
             ``"vision"``, ``"cache"`` or ``"none"``.
         """
         table_id = self.config.table_id
-        direct_points = normalized_action_points(
-            getattr(snapshot, "action_points", {}),
-        )
+        raw_points = snapshot.action_points
+        # Same raw YOLO dict as a converged cycle: skip normalisation too.
+        if raw_points and raw_points == self._last_raw_points:
+            effective_points = self._last_effective_points
+            self._set_action_regions(effective_points)
+            self._persist_action_calibration_file_cache(effective_points)
+            return effective_points, "vision"
+
+        direct_points = normalized_action_points(raw_points)
 
         if direct_points:
+            direct_hash = hash(tuple(sorted(direct_points.items())))
+            if direct_hash == self._last_direct_hash and self._last_effective_points:
+                self._last_raw_points = dict(raw_points)
+                effective_points = self._last_effective_points
+                self._set_action_regions(effective_points)
+                self._persist_action_calibration_file_cache(effective_points)
+                return effective_points, "vision"
+
             # Fresh points from YOLO — apply smoothing and update cache.
             previous_points = self._action_calibration_cache.get(table_id, {})
             if not previous_points and self._action_calibration_cache_enabled:
-                previous_points = normalized_action_points(
-                    self.memory.get(f"action_points_cache:{table_id}", {}),
-                )
+                previous_points = self._cached_action_points(table_id)
 
             if self._action_smoothing_enabled:
                 effective_points = smooth_action_points(
@@ -404,11 +645,24 @@ class PokerAgent:
             else:
                 effective_points = dict(direct_points)
 
-            self.action.set_action_regions_from_xy(effective_points)
-
-            if self._action_calibration_cache_enabled:
+            # Re-running the blend on identical input only yields the same
+            # points once smoothing has reached a fixed point.
+            converged = effective_points == previous_points
+            self._last_direct_hash = direct_hash if converged else None
+            self._last_raw_points = dict(raw_points) if converged else None
+            self._last_effective_points = effective_points
+            self._set_action_regions(effective_points)
+
+            # Jitter inside the deadzone leaves the cache untouched: skip
+            # the cache copy and Redis write (persistence is hash-gated).
+            if converged:
+                if self._action_calibration_cache_enabled:
+                    # previous_points may have come from Redis: keep it local
+                    self._action_calibration_cache.setdefault(table_id, previous_points)
+                self._persist_action_calibration_file_cache(effective_points)
+            elif self._action_calibration_cache_enabled:
                 self._action_calibration_cache[table_id] = dict(effective_points)
-                self.memory.set(
+                (writer or self.memory).set(
                     f"action_points_cache:{table_id}", dict(effective_points),
                 )
                 self._persist_action_calibration_file_cache(effective_points)
@@ -419,17 +673,9 @@ class PokerAgent:
         if not self._action_calibration_cache_enabled:
             return {}, "none"
 
-        cached_points = self._action_calibration_cache.get(table_id, {})
-        if not cached_points:
-            memory_cached = normalized_action_points(
-                self.memory.get(f"action_points_cache:{table_id}", {}),
-            )
-            if memory_cached:
-                cached_points = memory_cached
-                self._action_calibration_cache[table_id] = dict(memory_cached)
-
+        cached_points = self._cached_action_points(table_id)
         if cached_points:
-            self.action.set_action_regions_from_xy(cached_points)
+            self._set_action_regions(cached_points)
             return cached_points, "cache"
 
         return {}, "none"
@@ -437,7 +683,15 @@ class PokerAgent:
     # ── ZMQ coordination ────────────────────────────────────────────
 
     def _connect(self) -> None:
-        """Establish (or re-establish) the ZMQ ``REQ`` socket to HiveBrain."""
+        """Ensure the ZMQ ``DEALER`` socket to HiveBrain exists.
+
+        HiveBrain binds a ``REP`` socket; the ``DEALER`` adds the empty
+        delimiter frame itself (see :meth:`_request`), so a timed-out
+        request leaves the socket usable.  Idempotent: a live socket is
+        reused.  Use :meth:`_reconnect_on_error` to force a fresh socket.
+        """
+        if self._socket is not None and not self._socket.closed:
+            return
         if zmq is None:
             raise RuntimeError(
                 "pyzmq nao disponivel. Instale dependencias com requirements.txt"
@@ -446,48 +700,119 @@ class PokerAgent:
         if self._context is None:
             self._context = zmq.Context.instance()
 
+        socket = self._context.socket(zmq.DEALER)
+        self._apply_socket_options(socket)
+        socket.connect(self.config.server_address)
+        self._socket = socket
+        self._poller = zmq.Poller()
+        self._poller.register(socket, zmq.POLLIN)
+        self._missed_replies = 0
+
+    def _apply_socket_options(self, socket: Any) -> None:
+        # Receives go through the poller; SNDTIMEO bounds the send while
+        # no HiveBrain peer is connected yet.
+        timeout_ms = max(100, int(self.config.timeout_ms))
+        for option, value in (
+            (zmq.LINGER, 0),
+            (zmq.SNDTIMEO, timeout_ms),
+        ):
+            socket.setsockopt(option, value)
+
+    def _reconnect_on_error(self) -> None:
+        """Drop the current socket and open a new one."""
         if self._socket is not None:
             try:
+                if self._poller is not None:
+                    self._poller.unregister(self._socket)
                 self._socket.close(0)
             except Exception:
                 pass
-
-        socket = self._context.socket(zmq.REQ)
-        socket.setsockopt(zmq.LINGER, 0)
-        socket.setsockopt(zmq.RCVTIMEO, max(100, int(self.config.timeout_ms)))
-        socket.setsockopt(zmq.SNDTIMEO, max(100, int(self.config.timeout_ms)))
-        socket.connect(self.config.server_address)
-        self._socket = socket
+            self._socket = None
+            self._poller = None
+        try:
+            self._connect()
+        except Exception:
+            pass
 
     # Card normalisation delegated to utils.card_utils
     from utils.card_utils import normalize_cards as _normalize_cards_fn
     _normalize_cards = staticmethod(_normalize_cards_fn)
 
-    def _effective_active_players(self, snapshot: Any | None = None) -> int:
+    def _normalize_cards_cached(self, cards: list[str]) -> list[str]:
+        """Memoised :func:`normalize_cards` keyed by the raw card tuple.
+
+        Hole cards rarely change between frames; the cache is bounded to
+        ``_NORMALIZE_CACHE_MAX`` entries with FIFO eviction.
+        """
+        try:
+            key = tuple(cards)
+            cached = self._normalize_cache.get(key)
+        except TypeError:
+            return self._normalize_cards(cards)
+        if cached is None:
+            cached = tuple(self._normalize_cards(list(cards)))
+            if len(self._normalize_cache) >= _NORMALIZE_CACHE_MAX:
+                self._normalize_cache.pop(next(iter(self._normalize_cache)))
+            self._normalize_cache[key] = cached
+        return list(cached)
+
+    def _effective_active_players(self, snapshot: TableSnapshot | None = None) -> int:
         """Determine active player count from snapshot → config → env-var."""
-        if snapshot is not None:
-            snapshot_active = getattr(snapshot, "active_players", 0)
-            if isinstance(snapshot_active, int) and snapshot_active > 0:
-                return snapshot_active
+        if snapshot is not None and snapshot.active_players > 0:
+            return snapshot.active_players
 
         if isinstance(self.config.active_players, int) and self.config.active_players > 0:
             return self.config.active_players
 
-        opponents_raw = os.getenv("TITAN_OPPONENTS", "").strip()
-        if opponents_raw.isdigit():
-            opponents = max(1, min(9, int(opponents_raw)))
-            return opponents + 1
+        if self._env_opponents_plus_one is not None:
+            return self._env_opponents_plus_one
 
         return 0
 
-    def _checkin(self, cards: list[str], active_players: int, cycle_id: int) -> dict[str, Any]:
-        """Send a check-in message to HiveBrain and return the response.
+    def _request(
+        self, head: bytes, tail: dict[str, Any], reply_type: str | None,
+    ) -> dict[str, Any] | None:
+        """Send *head* + *tail* to HiveBrain and wait for its matching reply.
 
-        The ZMQ ``REQ/REP`` pattern requires strict send→recv alternation.
-        On timeout, the socket is recreated.
+        Replies to earlier requests that timed out are still delivered on
+        the ``DEALER`` socket; they are told apart by ``cycle_id`` and
+        ``type`` (``None`` for check-ins) and discarded.  Returns ``None``
+        on timeout.  A send/recv error, or ``_ZMQ_MAX_MISSED_REPLIES``
+        timeouts in a row, rebuilds the socket.
         """
-        if self._socket is None:
-            self._connect()
+        try:
+            cycle_id = tail["cycle_id"]
+            self._socket.send_multipart((b"", head + json_dumps_bytes(tail)[1:]))
+            deadline = time.monotonic() + max(100, int(self.config.timeout_ms)) / 1000.0
+            while True:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0 or not self._poller.poll(remaining_ms):
+                    break
+                response = json_loads(self._socket.recv_multipart()[-1])
+                if not isinstance(response, dict):
+                    continue
+                if "cycle_id" not in response and "error" in response:
+                    # HiveBrain rejected the request itself (no echo fields)
+                    self._missed_replies = 0
+                    return response
+                if (
+                    response.get("cycle_id") == cycle_id
+                    and response.get("type") == reply_type
+                ):
+                    self._missed_replies = 0
+                    return response
+        except Exception:
+            self._reconnect_on_error()
+            return None
+
+        self._missed_replies += 1
+        if self._missed_replies >= _ZMQ_MAX_MISSED_REPLIES:
+            self._reconnect_on_error()
+        return None
+
+    def _checkin(self, cards: list[str], active_players: int, cycle_id: int) -> dict[str, Any]:
+        """Send a check-in message to HiveBrain and return the response."""
+        self._connect()
 
         last_decision = self.memory.get("last_decision", {})
         last_action = ""
@@ -496,25 +821,32 @@ class PokerAgent:
             if isinstance(raw_action, str):
                 last_action = raw_action.strip().upper()
 
-        payload = {
-            "type": "checkin",
-            "agent_id": self.config.agent_id,
-            "table_id": self.config.table_id,
-            "cycle_id": max(0, int(cycle_id)),
-            "cards": self._normalize_cards(cards),
-            "active_players": max(0, int(active_players)),
-            "last_action": last_action,
-        }
+        tail = self._checkin_tail
+        tail["cycle_id"] = max(0, int(cycle_id))
+        tail["cards"] = self._normalize_cards_cached(cards)
+        tail["active_players"] = max(0, int(active_players))
+        tail["last_action"] = last_action
 
-        try:
-            self._socket.send_json(payload)
-            response = self._socket.recv_json()
-            if isinstance(response, dict):
-                return response
-            return {"ok": False, "error": "invalid_response"}
-        except Exception:
-            self._connect()
+        response = self._request(self._checkin_head, tail, reply_type=None)
+        if response is None:
             return {"ok": False, "error": "connection_timeout"}
+        return response
+
+    def _zmq_call(self, fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+        """Run *fn* on the ZMQ worker (or inline outside ``run()``) and wait."""
+        if self._zmq_executor is None:
+            return fn(*args, **kwargs)
+        return self._zmq_executor.submit(fn, *args, **kwargs).result()
+
+    def _submit_checkin(
+        self, cards: list[str], active_players: int, cycle_id: int,
+    ) -> Future[dict[str, Any]]:
+        """Start :meth:`_checkin` on the ZMQ worker and return its future."""
+        if self._zmq_executor is None:
+            future: Future[dict[str, Any]] = Future()
+            future.set_result(self._checkin(cards, active_players, cycle_id))
+            return future
+        return self._zmq_executor.submit(self._checkin, cards, active_players, cycle_id)
 
     def _report_decision(
         self,
@@ -526,26 +858,32 @@ class PokerAgent:
     ) -> None:
         if self._socket is None:
             return
-        payload = {
-            "type": "decision",
-            "agent_id": self.config.agent_id,
-            "table_id": self.config.table_id,
-            "cycle_id": max(0, int(cycle_id)),
-            "action": str(action).strip().lower(),
-            "amount": float(amount),
-            "target": [int(target[0]), int(target[1])] if target is not None else None,
-        }
-        try:
-            self._socket.send_json(payload)
-            _ = self._socket.recv_json()
-        except Exception:
-            try:
-                self._connect()
-            except Exception:
-                pass
+        tail = self._decision_tail
+        tail["cycle_id"] = max(0, int(cycle_id))
+        # Decision.action is already canonical lower-case and action points
+        # are normalised to int tuples by agent.calibration.
+        tail["action"] = action
+        tail["amount"] = float(amount)
+        tail["target"] = list(target) if target is not None else None
+        self._request(self._decision_head, tail, reply_type="decision_ack")
 
     # ── Main loop ───────────────────────────────────────────────────
 
+    @staticmethod
+    def _pace_cycle(deadline: float, interval: float) -> float:
+        """Sleep until *deadline* (``time.monotonic``) and return the next one.
+
+        A cycle that overran keeps the grid when it is less than one
+        *interval* late; further behind, the grid restarts from now
+        instead of firing a burst of catch-up cycles.
+        """
+        now = time.monotonic()
+        if deadline > now:
+            time.sleep(deadline - now)
+        elif now - deadline > interval:
+            return now + interval
+        return deadline + interval
+
     def run(self) -> None:
         """Enter the main decision loop.
 
@@ -557,7 +895,12 @@ class PokerAgent:
             5. Log the outcome and sleep.
         """
         _log = TitanLogger("Agent")
-        self._connect()
+        _info_enabled = _log.is_info_enabled()
+        _highlight_enabled = _log.is_highlight_enabled()
+        self._zmq_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"titan-zmq-{self.config.agent_id}",
+        )
+        self._zmq_call(self._connect)
         _log.highlight(
             f"Agente {self.config.agent_id} conectado a {self.config.server_address} "
             f"table={self.config.table_id}  memory={self.memory.backend}"
@@ -583,8 +926,7 @@ class PokerAgent:
 
         # ── HUD: Painel de Controle visual ─────────────────────────
         _hud = None
-        _hud_disabled = os.getenv("TITAN_HUD_DISABLED", "0").strip() in ("1", "true", "yes")
-        if not _hud_disabled:
+        if not self._hud_disabled:
             try:
                 from tools.titan_hud import TitanHUD
                 _hud = TitanHUD()
@@ -597,8 +939,16 @@ class PokerAgent:
         if self._overlay is not None:
             self._overlay.start()
 
+        # Captura em thread dedicada (mss → ADB) sobrepõe o workflow
+        self._start_capture_thread()
+
         cycle = 0
         _toggle_log_counter = 0
+        # Loop pacing is fixed for the whole run; cycles start on a fixed
+        # grid of deadlines so the time spent working is not added on top.
+        sleep_s = max(0.1, float(self.config.interval_seconds))
+        paused_sleep_s = max(0.5, sleep_s)
+        next_deadline = time.monotonic() + sleep_s
         while True:
             # Skip cycle when automation is paused
             if not toggle.is_active:
@@ -609,62 +959,85 @@ class PokerAgent:
                         f"(aguardando há {_toggle_log_counter} ciclos)"
                     )
                 hud_state.push(bot_active=False)
-                time.sleep(max(0.5, float(self.config.interval_seconds)))
+                time.sleep(paused_sleep_s)
+                next_deadline = time.monotonic() + sleep_s
                 continue
             # Reset counter when active
             if _toggle_log_counter > 0:
                 _log.highlight(f"Toggle automação: ON — iniciando ciclos de jogo")
                 _toggle_log_counter = 0
-            hud_state.push(bot_active=True)
+            # HUD: fields accumulate here and are flushed once per cycle
+            hud_patch: dict[str, Any] = {"bot_active": True}
             cycle_started_at = time.perf_counter()
             cycle_id = cycle + 1
             snapshot = self.vision.read_table()
-            self._log_seen_cards(_log, list(getattr(snapshot, "hero_cards", [])))
+            # TableSnapshot is a slots dataclass with defaults: read fields directly
+            hero_cards = snapshot.hero_cards
+            self._log_seen_cards(_log, hero_cards)
 
-            # Use mss capture first (no ADB — safe for network)
-            # ADB screencap as last resort only
-            current_ocr_frame = self.ocr_vision.capture_frame()
-            if current_ocr_frame is None:
-                # fallback to ADB if mss fails (window occluded, etc.)
-                current_ocr_frame = self.ocr_vision.capture_frame_adb()
+            # Frame from the capture thread (mss first, ADB as last resort)
+            current_ocr_frame = self._next_capture_frame(
+                timeout=sleep_s,
+            )
 
             # Overlay: atualiza frame e snapshot
             if self._overlay is not None:
                 if current_ocr_frame is not None:
                     self._overlay.update_frame(current_ocr_frame)
                 self._overlay.update_snapshot(snapshot)
-                self._overlay.update_ocr_regions(self.ocr_config.regions())
-
-            # HUD: push table snapshot
-            hud_state.push(
-                hero_cards=list(getattr(snapshot, 'hero_cards', [])),
-                board_cards=list(getattr(snapshot, 'board_cards', [])),
-                dead_cards=list(getattr(snapshot, 'dead_cards', [])),
-                pot=float(getattr(snapshot, 'pot', 0.0)),
-                stack=float(getattr(snapshot, 'stack', 0.0)),
-                call_amount=float(getattr(snapshot, 'call_amount', 0.0)),
-                active_players=int(getattr(snapshot, 'active_players', 0)),
-                is_my_turn=bool(getattr(snapshot, 'is_my_turn', False)),
+                self._overlay.update_ocr_regions(self._ocr_regions)
+
+            # HUD: table snapshot
+            hud_patch.update(
+                hero_cards=hero_cards,
+                board_cards=snapshot.board_cards,
+                dead_cards=snapshot.dead_cards,
+                pot=float(snapshot.pot),
+                stack=float(snapshot.stack),
+                call_amount=float(snapshot.call_amount),
+                active_players=int(snapshot.active_players),
+                is_my_turn=bool(snapshot.is_my_turn),
             )
 
+            # Per-cycle memory writes, flushed once before the workflow runs
+            memory_batch = self.memory.pipeline()
+
+            active_players = self._effective_active_players(snapshot)
+            checkin_future: Future[dict[str, Any]] | None = None
+
             if not self._use_mock_vision:
                 if current_ocr_frame is None:
-                    time.sleep(max(0.1, float(self.config.interval_seconds)))
+                    hud_state.push_many(hud_patch)
+                    next_deadline = self._pace_cycle(next_deadline, sleep_s)
                     continue
 
-                if self._prev_ocr_frame is not None:
-                    is_stable = self.ocr_vision.check_screen_stability(
-                        self._prev_ocr_frame,
-                        current_ocr_frame,
-                        threshold=self._screen_stability_threshold,
+                current_signature = (
+                    tuple(current_ocr_frame.shape),
+                    self.ocr_vision.stability_signature(current_ocr_frame),
+                )
+                previous_signature = self._prev_ocr_signature
+                self._prev_ocr_signature = current_signature
+                if previous_signature is not None:
+                    is_stable = (
+                        previous_signature[0] == current_signature[0]
+                        and self.ocr_vision.check_signature_stability(
+                            previous_signature[1],
+                            current_signature[1],
+                            threshold=self._screen_stability_threshold,
+                        )
                     )
                     if not is_stable:
-                        self._prev_ocr_frame = current_ocr_frame
                         _log.info("screen_stable=0 ocr_skipped=1")
-                        time.sleep(max(0.1, float(self.config.interval_seconds)))
+                        hud_state.push_many(hud_patch)
+                        next_deadline = self._pace_cycle(next_deadline, sleep_s)
                         continue
 
-                self._prev_ocr_frame = current_ocr_frame
+                # Check-in runs on the ZMQ worker while OCR reads the frame;
+                # cycles skipped above (no frame / unstable screen) never
+                # check in.  A failed sanity check below still waits for it.
+                checkin_future = self._submit_checkin(
+                    cards=hero_cards, active_players=active_players, cycle_id=cycle_id,
+                )
 
                 ocr_metrics = self._read_ocr_metrics_from_frame(current_ocr_frame)
                 ocr_pot = float(ocr_metrics.get("pot", 0.0))
@@ -678,7 +1051,7 @@ class PokerAgent:
                     _log.info(
                         f"[OCR_DIAG] frame={fw}x{fh} "
                         f"pot={ocr_pot:.2f} stack={ocr_stack:.2f} call={ocr_call:.2f} "
-                        f"regions={self.ocr_config.regions()} "
+                        f"regions={self._ocr_regions} "
                         f"tesseract_loaded={_tess_ok}"
                     )
 
@@ -688,11 +1061,13 @@ class PokerAgent:
                         f"reason={self.sanity_guard.last_reason} "
                         f"pot={ocr_pot:.2f} stack={ocr_stack:.2f} call={ocr_call:.2f}"
                     )
-                    hud_state.push(
+                    hud_patch.update(
                         sanity_ok=False,
                         sanity_reason=self.sanity_guard.last_reason,
                     )
-                    time.sleep(max(0.1, float(self.config.interval_seconds)))
+                    hud_state.push_many(hud_patch)
+                    checkin_future.result()
+                    next_deadline = self._pace_cycle(next_deadline, sleep_s)
                     continue
 
                 if ocr_pot > 0:
@@ -700,23 +1075,24 @@ class PokerAgent:
                 if ocr_stack > 0:
                     snapshot.stack = ocr_stack
                 snapshot.call_amount = ocr_call
-                self.memory.set("call_amount", ocr_call)
+                memory_batch.set("call_amount", ocr_call)
 
-                # Re-push OCR values to HUD (initial push had pre-OCR zeros)
-                hud_state.push(
+                # OCR values override the pre-OCR zeros in the HUD patch
+                hud_patch.update(
                     pot=float(snapshot.pot),
                     stack=float(snapshot.stack),
                     call_amount=float(snapshot.call_amount),
                 )
 
             effective_action_points, action_calibration_source = (
-                self._apply_action_calibration(snapshot)
+                self._apply_action_calibration(snapshot, memory_batch)
             )
 
-            active_players = self._effective_active_players(snapshot)
-            response = self._checkin(
-                cards=snapshot.hero_cards, active_players=active_players, cycle_id=cycle_id,
-            )
+            if checkin_future is None:
+                checkin_future = self._submit_checkin(
+                    cards=hero_cards, active_players=active_players, cycle_id=cycle_id,
+                )
+            response = checkin_future.result()
 
             mode = response.get("mode", "unknown")
             partners = response.get("partners", [])
@@ -724,13 +1100,16 @@ class PokerAgent:
             heads_up_obfuscation = bool(response.get("heads_up_obfuscation", False))
             latency_ms = response.get("latency_ms", "-")
 
-            self.memory.set(
+            memory_batch.set(
                 "dead_cards", dead_cards if isinstance(dead_cards, list) else [],
             )
-            self.memory.set("heads_up_obfuscation", heads_up_obfuscation)
+            memory_batch.set("heads_up_obfuscation", heads_up_obfuscation)
 
             if isinstance(snapshot.current_opponent, str) and snapshot.current_opponent.strip():
-                self.memory.set("current_opponent", snapshot.current_opponent.strip())
+                memory_batch.set("current_opponent", snapshot.current_opponent.strip())
+
+            # One Redis round-trip; the workflow reads these keys next.
+            memory_batch.execute()
 
             outcome = self.workflow.execute(
                 snapshot=snapshot,
@@ -738,7 +1117,8 @@ class PokerAgent:
             )
 
             action_target = effective_action_points.get(outcome.action)
-            self._report_decision(
+            self._zmq_call(
+                self._report_decision,
                 cycle_id=cycle_id,
                 action=outcome.action,
                 amount=outcome.amount,
@@ -755,47 +1135,50 @@ class PokerAgent:
                     cycle_ms=cycle_ms,
                     equity=outcome.equity,
                     spr=outcome.spr,
-                    street=outcome.street if hasattr(outcome, 'street') else 'preflop',
+                    street=outcome.street,
                 )
 
-            # HUD: push decision
-            hud_state.push(
+            # HUD: decision + single flush for the cycle
+            hud_patch.update(
                 action=outcome.action,
                 equity=outcome.equity,
                 spr=outcome.spr,
-                street=getattr(outcome, 'street', 'preflop'),
-                pot_odds=getattr(outcome, 'pot_odds', 0.0),
-                committed=getattr(outcome, 'committed', False),
-                mode=getattr(outcome, 'mode', 'SOLO'),
-                opponent_class=getattr(outcome, 'opponent_class', 'Unknown'),
-                gto_distribution=getattr(outcome, 'gto_distribution', {}),
-                description=getattr(outcome, 'description', ''),
+                street=outcome.street,
+                pot_odds=outcome.pot_odds,
+                committed=outcome.committed,
+                mode=outcome.mode,
+                opponent_class=outcome.opponent_class,
+                gto_distribution=outcome.gto_distribution,
+                description=outcome.description,
                 cycle_id=cycle_id,
                 cycle_ms=cycle_ms,
                 sanity_ok=True,
                 sanity_reason='ok',
             )
+            hud_state.push_many(hud_patch)
             hud_state.log_action(
-                f"[{time.strftime('%H:%M:%S')}] #{cycle_id} {outcome.action.upper()} "
-                f"| Eq {outcome.equity:.0%} | Pot {snapshot.pot:.0f} "
-                f"| SPR {outcome.spr:.1f} | {outcome.mode}"
+                _HUD_ACTION_TEMPLATE % (
+                    self._clock_hms(), cycle_id, outcome.action.upper(),
+                    outcome.equity * 100.0, snapshot.pot, outcome.spr, outcome.mode,
+                )
             )
 
-            log_method = _log.highlight if mode == "squad" else _log.info
-            log_method(
-                f"mode={mode} partners={partners} "
-                f"dead_cards={dead_cards} active_players={active_players} "
-                f"hu_obf={heads_up_obfuscation} latency_ms={latency_ms} "
-                f"my_turn={snapshot.is_my_turn} state_changed={snapshot.state_changed} "
-                f"pot={snapshot.pot:.2f} stack={snapshot.stack:.2f} call={snapshot.call_amount:.2f} "
-                f"action_points={list(effective_action_points.keys())} "
-                f"action_calibration={action_calibration_source} "
-                f"cycle={cycle_id} cycle_ms={cycle_ms:.2f} "
-                f"decision={outcome.action} amount={outcome.amount} "
-                f"equity={outcome.equity} spr={outcome.spr} "
-                f"mode={outcome.mode} committed={outcome.committed} "
-                f"desc={outcome.description}"
-            )
+            if mode == "squad":
+                log_method, log_enabled = _log.highlight, _highlight_enabled
+            else:
+                log_method, log_enabled = _log.info, _info_enabled
+            if log_enabled:
+                log_method(
+                    _CYCLE_LOG_TEMPLATE,
+                    mode, partners, dead_cards, active_players,
+                    heads_up_obfuscation, latency_ms,
+                    snapshot.is_my_turn, snapshot.state_changed,
+                    snapshot.pot, snapshot.stack, snapshot.call_amount,
+                    list(effective_action_points), action_calibration_source,
+                    cycle_id, cycle_ms,
+                    outcome.action, outcome.amount, outcome.equity, outcome.spr,
+                    outcome.mode, outcome.committed, outcome.description,
+                )
 
             if heads_up_obfuscation:
                 _log.warn("obfuscacao heads-up ativa -- forcando agressividade")
@@ -805,8 +1188,15 @@ class PokerAgent:
                 _log.success(f"max_cycles={self.config.max_cycles} atingido. parando.")
                 break
 
-            time.sleep(max(0.1, float(self.config.interval_seconds)))
+            next_deadline = self._pace_cycle(next_deadline, sleep_s)
 
+        # Encerra thread de captura e worker ZMQ
+        self._stop_capture_thread()
+        self._zmq_executor.shutdown(wait=True)
+        self._zmq_executor = None
+        # Grava a última calibração pendente (escrita é espaçada no loop)
+        self._flush_action_calibration()
+        atexit.unregister(self._exit_flush)
         # Encerra overlay ao sair do loop
         if self._overlay is not None:
             self._overlay.stop()
@@ -817,13 +1207,7 @@ class PokerAgent:
 
 if __name__ == "__main__":
     runtime = AgentRuntimeConfig()
-    max_cycles_raw = os.getenv("TITAN_AGENT_MAX_CYCLES", "").strip()
-    max_cycles = int(max_cycles_raw) if max_cycles_raw.isdigit() else None
-    active_players_raw = os.getenv("TITAN_ACTIVE_PLAYERS", "").strip()
-    active_players = int(active_players_raw) if active_players_raw.isdigit() else None
-    redis_url = os.getenv("TITAN_REDIS_URL", "redis://:titan_secret@127.0.0.1:6379/0").strip()
-    use_mock_vision = parse_bool_env("TITAN_USE_MOCK_VISION", False)
-    mock_vision_scenario = os.getenv("TITAN_MOCK_SCENARIO", "ALT").strip() or "ALT"
+    startup_env = agent_env()
 
     PokerAgent(
         AgentConfig(
@@ -832,10 +1216,10 @@ if __name__ == "__main__":
             table_id=runtime.table_id,
             interval_seconds=runtime.heartbeat_seconds,
             timeout_ms=runtime.timeout_ms,
-            active_players=active_players,
-            max_cycles=max_cycles,
-            redis_url=redis_url,
-            use_mock_vision=use_mock_vision,
-            mock_vision_scenario=mock_vision_scenario,
+            active_players=startup_env.active_players,
+            max_cycles=startup_env.max_cycles,
+            redis_url=startup_env.redis_url,
+            use_mock_vision=startup_env.use_mock_vision,
+            mock_vision_scenario=startup_env.mock_scenario,
         )
     ).run()
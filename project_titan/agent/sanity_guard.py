@@ -2,15 +2,70 @@
 
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
+try:
+    from numba import njit  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover - numba é opcional
+    njit = None
 
+OCR_KEYS: tuple[str, ...] = ("pot", "hero_stack", "call_amount")
+"""Ordem fixa das métricas OCR (índice = código usado pelo kernel)."""
 
-@dataclass(slots=True)
-class OCRSample:
-    pot: float
-    stack: float
-    call: float
+OCR_KEY_IDS: dict[str, int] = {key: idx for idx, key in enumerate(OCR_KEYS)}
+
+_KEY_POT = 0
+_KEY_HERO_STACK = 1
+
+
+def sanitize_ocr_scalar(
+    key_id: int,
+    candidate: float,
+    previous: float,
+    min_value: float,
+    max_value: float,
+    max_delta: float,
+    pending_value: float,
+    pending_count: int,
+    confirm_frames: int,
+) -> tuple[float, float, int]:
+    """Filtra um valor OCR por limites e salto máximo entre frames.
+
+    Função pura (compilada com numba quando disponível).  Retorna
+    ``(valor, pending_value, pending_count)``; ``pending_count == 0``
+    significa que não há salto pendente de confirmação.
+    """
+    safe_candidate = max(0.0, candidate)
+    safe_previous = max(0.0, previous)
+
+    if key_id == _KEY_POT and safe_candidate <= 1.0:
+        if safe_previous > 0:
+            return safe_previous, pending_value, pending_count
+        return 0.0, pending_value, pending_count
+
+    if key_id == _KEY_HERO_STACK and safe_previous >= 50.0 and safe_candidate <= 5.0:
+        return safe_previous, pending_value, pending_count
+
+    if safe_candidate < min_value or safe_candidate > max_value:
+        return safe_previous, pending_value, pending_count
+
+    if max_delta > 0 and safe_previous > 0 and abs(safe_candidate - safe_previous) > max_delta:
+        pending_epsilon = max(1.0, max_delta * 0.10)
+        if pending_count > 0 and abs(pending_value - safe_candidate) <= pending_epsilon:
+            pending_count += 1
+        else:
+            pending_value = safe_candidate
+            pending_count = 1
+        if pending_count >= confirm_frames:
+            return pending_value, 0.0, 0
+        return safe_previous, pending_value, pending_count
+
+    return safe_candidate, 0.0, 0
+
+
+# Referência em Python puro: os testes comparam a versão compilada com ela
+_sanitize_ocr_scalar_py = sanitize_ocr_scalar
+
+if njit is not None:
+    sanitize_ocr_scalar = njit(cache=True)(sanitize_ocr_scalar)
 
 
 class SanityGuard:
@@ -29,12 +84,19 @@ class SanityGuard:
         self.repeat_decimals = max(0, int(repeat_decimals))
         self.pot_drop_tolerance = max(0.0, float(pot_drop_tolerance))
         self.new_hand_pot_threshold = max(0.0, float(new_hand_pot_threshold))
-        self._samples: deque[OCRSample] = deque(maxlen=self.history_size)
+        # Run-length da última leitura repetida: substitui o histórico de
+        # amostras (só a cauda estável importava; O(1) por frame)
+        self._tail_key: tuple[float, float, float] | None = None
+        self._tail_run: int = 0
         self._last_valid_pot: float = 0.0
         self.last_reason: str = "boot"
 
+    def _clear_samples(self) -> None:
+        self._tail_key = None
+        self._tail_run = 0
+
     def reset(self) -> None:
-        self._samples.clear()
+        self._clear_samples()
         self._last_valid_pot = 0.0
         self.last_reason = "reset"
 
@@ -42,15 +104,17 @@ class SanityGuard:
         safe = max(0.0, float(value))
         return round(safe, self.repeat_decimals)
 
+    def _push_sample(self, pot: float, stack: float, call: float) -> None:
+        key = (pot, stack, call)
+        if key == self._tail_key:
+            self._tail_run += 1
+        else:
+            self._tail_key = key
+            self._tail_run = 1
+
     def _is_tail_stable(self) -> bool:
-        if len(self._samples) < self.stable_frames:
-            return False
-        tail = list(self._samples)[-self.stable_frames:]
-        first = tail[0]
-        return all(
-            item.pot == first.pot and item.stack == first.stack and item.call == first.call
-            for item in tail
-        )
+        # ``history_size`` ainda limita quantas leituras iguais contam
+        return self.stable_frames <= min(self._tail_run, self.history_size)
 
     def validate(self, pot: float, stack: float, call: float) -> bool:
         pot_value = self._normalized(pot)
@@ -66,13 +130,13 @@ class SanityGuard:
             and pot_value + self.pot_drop_tolerance < self._last_valid_pot
         ):
             if pot_value <= self.new_hand_pot_threshold and call_value <= 0.01:
-                self._samples.clear()
+                self._clear_samples()
                 self._last_valid_pot = 0.0
             else:
                 self.last_reason = "pot_decreased"
                 return False
 
-        self._samples.append(OCRSample(pot=pot_value, stack=stack_value, call=call_value))
+        self._push_sample(pot_value, stack_value, call_value)
 
         if not self._is_tail_stable():
             self.last_reason = "unstable_tail"
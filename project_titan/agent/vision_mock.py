@@ -19,9 +19,44 @@ Uso::
 
 from __future__ import annotations
 
-import os
+from dataclasses import replace
 
 from tools.vision_models import TableSnapshot
+from utils.env import env_truthy
+
+# Mesmos botões nos dois cenários; listas e dicts dos modelos abaixo são
+# compartilhados por todos os snapshots (ninguém os altera in-place).
+_MOCK_ACTION_POINTS: dict[str, tuple[int, int]] = {
+    "fold": (620, 705),
+    "call": (805, 705),
+    "raise": (995, 705),
+    "raise_2x": (200, 750),
+    "raise_pot": (500, 750),
+    "raise_confirm": (995, 750),
+}
+
+# Cenário A — mão forte (Ah Kh com flush draw no flop).
+_SCENARIO_A = TableSnapshot(
+    hero_cards=["Ah", "Kh"],
+    board_cards=["Th", "Jh", "2s"],
+    pot=32.0,
+    stack=118.0,
+    call_amount=6.0,
+    dead_cards=[],
+    current_opponent="mock_villain",
+    active_players=2,
+    action_points=_MOCK_ACTION_POINTS,
+    showdown_events=[],
+    is_my_turn=True,
+    state_changed=False,
+)
+
+# Cenário B — mão lixo (7d 2c sem conexão ao board).
+_SCENARIO_B = replace(
+    _SCENARIO_A,
+    hero_cards=["7d", "2c"],
+    board_cards=["Ah", "Kh", "Qs"],
+)
 
 
 class MockVision:
@@ -33,77 +68,29 @@ class MockVision:
 
     def __init__(self, scenario: str = "ALT") -> None:
         self.scenario = (scenario or "ALT").strip().upper()
-        self._last_signature = ""
+        self._last_signature: tuple | None = None
         self._call_count = 0
-
-    def _snapshot_scenario_a(self) -> TableSnapshot:
-        """Cenário A — mão forte (Ah Kh com flush draw no flop)."""
-        return TableSnapshot(
-            hero_cards=["Ah", "Kh"],
-            board_cards=["Th", "Jh", "2s"],
-            pot=32.0,
-            stack=118.0,
-            call_amount=6.0,
-            dead_cards=[],
-            current_opponent="mock_villain",
-            active_players=2,
-            action_points={
-                "fold": (620, 705),
-                "call": (805, 705),
-                "raise": (995, 705),
-                "raise_2x": (200, 750),
-                "raise_pot": (500, 750),
-                "raise_confirm": (995, 750),
-            },
-            showdown_events=[],
-            is_my_turn=True,
-            state_changed=False,
-        )
-
-    def _snapshot_scenario_b(self) -> TableSnapshot:
-        """Cenário B — mão lixo (7d 2c sem conexão ao board)."""
-        return TableSnapshot(
-            hero_cards=["7d", "2c"],
-            board_cards=["Ah", "Kh", "Qs"],
-            pot=32.0,
-            stack=118.0,
-            call_amount=6.0,
-            dead_cards=[],
-            current_opponent="mock_villain",
-            active_players=2,
-            action_points={
-                "fold": (620, 705),
-                "call": (805, 705),
-                "raise": (995, 705),
-                "raise_2x": (200, 750),
-                "raise_pot": (500, 750),
-                "raise_confirm": (995, 750),
-            },
-            showdown_events=[],
-            is_my_turn=True,
-            state_changed=False,
+        # Os cenários são constantes: assinatura calculada uma única vez.
+        self._scenarios = {"A": _SCENARIO_A, "B": _SCENARIO_B}
+        self._signatures = {
+            key: self._state_signature(template)
+            for key, template in self._scenarios.items()
+        }
+
+    @staticmethod
+    def _state_signature(snapshot: TableSnapshot) -> tuple:
+        """Gera assinatura (tupla hashable) do estado para detecção de state_changed."""
+        return (
+            tuple(snapshot.hero_cards),
+            tuple(snapshot.board_cards),
+            tuple(snapshot.dead_cards),
+            round(snapshot.pot, 2),
+            round(snapshot.stack, 2),
+            round(snapshot.call_amount, 2),
+            bool(snapshot.is_my_turn),
+            tuple(sorted(snapshot.action_points.items())),
         )
 
-    def _state_signature(self, snapshot: TableSnapshot) -> str:
-        """Gera assinatura única do estado para detecção de state_changed."""
-        hero_key = ",".join(snapshot.hero_cards)
-        board_key = ",".join(snapshot.board_cards)
-        dead_key = ",".join(snapshot.dead_cards)
-        action_key = "|".join(
-            f"{name}:{point[0]},{point[1]}"
-            for name, point in sorted(snapshot.action_points.items(), key=lambda item: item[0])
-        )
-        return "|".join([
-            hero_key,
-            board_key,
-            dead_key,
-            f"pot={snapshot.pot:.2f}",
-            f"stack={snapshot.stack:.2f}",
-            f"call={snapshot.call_amount:.2f}",
-            f"turn={1 if snapshot.is_my_turn else 0}",
-            f"ap={action_key}",
-        ])
-
     def read_table(self) -> TableSnapshot:
         """Retorna o próximo TableSnapshot conforme o cenário configurado.
 
@@ -116,22 +103,16 @@ class MockVision:
         scenario = self.scenario
         self._call_count += 1
 
-        if scenario == "A":
-            snapshot = self._snapshot_scenario_a()
-        elif scenario == "B":
-            snapshot = self._snapshot_scenario_b()
-        else:
-            if self._call_count % 2 == 1:
-                snapshot = self._snapshot_scenario_a()
-            else:
-                snapshot = self._snapshot_scenario_b()
-
-        signature = self._state_signature(snapshot)
-        snapshot.state_changed = bool(self._last_signature) and signature != self._last_signature
+        if scenario not in self._scenarios:
+            scenario = "A" if self._call_count % 2 == 1 else "B"
+
+        signature = self._signatures[scenario]
+        changed = self._last_signature is not None and signature != self._last_signature
         self._last_signature = signature
-        return snapshot
+        # Cópia rasa do modelo: o loop altera campos escalares por ciclo
+        return replace(self._scenarios[scenario], state_changed=changed)
 
 
 def use_mock_vision_from_env() -> bool:
     """Verifica se a variável ``TITAN_USE_MOCK_VISION`` está ativa."""
-    return os.getenv("TITAN_USE_MOCK_VISION", "0").strip().lower() in {"1", "true", "yes", "on"}
+    return env_truthy("TITAN_USE_MOCK_VISION")
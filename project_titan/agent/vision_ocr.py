@@ -8,13 +8,100 @@ Estratégia de robustez:
 2. OCR com whitelist estrita ``0123456789.$,``.
 3. Sanitização agressiva para remover lixo (ex.: ``A50`` -> ``50``).
 4. Fallback para último valor válido por chave (ou ``0.0``).
+
+Reconhecedor de dígitos opcional: com ``onnxruntime`` instalado e
+``TITAN_OCR_DIGIT_MODEL`` apontando para um ``.onnx`` (entrada
+``(N, 1, 28, 28)`` float32 em ``[0, 1]``, saída ``(N, len(_DIGIT_LABELS))``),
+cada glifo é classificado por uma CNN; tesseract só roda nos candidatos
+em que a confiança fica abaixo de ``TITAN_OCR_DIGIT_MIN_CONF`` (0.90).
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import tempfile
+from contextlib import contextmanager
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 
+from utils.env import env_truthy
+
+try:
+    from numba import njit  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover - numba é opcional
+    njit = None
+
+_TESSERACT_WHITELIST = "0123456789.$,Kk"
+_TESSERACT_CONFIG = f"--psm 7 -c tessedit_char_whitelist={_TESSERACT_WHITELIST}"
+
+
+@contextmanager
+def _single_thread_tesseract() -> Iterator[None]:
+    """``OMP_THREAD_LIMIT=1`` só enquanto o pytesseract lança o processo filho.
+
+    Recortes numéricos são minúsculos: tesseract single-thread é mais
+    rápido.  O processo do agente (torch, OpenCV) não é afetado, e um
+    valor já definido pelo usuário é respeitado.
+    """
+    if "OMP_THREAD_LIMIT" in os.environ:
+        yield
+        return
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    try:
+        yield
+    finally:
+        os.environ.pop("OMP_THREAD_LIMIT", None)
+
+# Erros comuns do OCR (O→0, S→5) e ruído descartado (espaços, ``$``)
+_NOISE_TRANS = str.maketrans({"O": "0", "o": "0", "S": "5", "s": "5", "$": None, " ": None})
+_NON_NUMERIC_RE = re.compile(r"[^0-9.,]")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Classes do modelo de dígitos, na ordem das saídas
+_DIGIT_LABELS = "0123456789.,K"
+_DIGIT_SIZE = 28
+# Componentes menores que isso (px) são ruído, não glifos
+_DIGIT_MIN_AREA = 4
+
+
+def _invert_dark_channels(image: Any) -> None:
+    """Inverte in-place os canais de *image* ``(H, W, C)`` com < 30% de branco.
+
+    Contagem e inversão no mesmo kernel, sem arrays temporários (compilado
+    com numba quando disponível).
+    """
+    height, width, channels = image.shape
+    total = height * width
+    for c in range(channels):
+        white = 0
+        for y in range(height):
+            for x in range(width):
+                if image[y, x, c] > 127:
+                    white += 1
+        if white / total < 0.3:
+            for y in range(height):
+                for x in range(width):
+                    image[y, x, c] = 255 - image[y, x, c]
+
+
+def _invert_dark_channels_numpy(image: Any) -> None:
+    """Fallback vetorizado de :func:`_invert_dark_channels` (sem numba)."""
+    for c, white_frac in enumerate((image > 127).mean(axis=(0, 1))):
+        if white_frac < 0.3:
+            image[..., c] = 255 - image[..., c]
+
+
+# Kernel sem decorar: os testes o comparam com o fallback numpy
+_invert_dark_channels_py = _invert_dark_channels
+
+if njit is not None:
+    _invert_dark_channels = njit(cache=True, boundscheck=False)(_invert_dark_channels)
+else:
+    _invert_dark_channels = _invert_dark_channels_numpy
+
 
 class TitanOCR:
     """OCR numérico com fallback seguro para uso em loop de decisão."""
@@ -27,18 +114,46 @@ class TitanOCR:
     ) -> None:
         self.use_easyocr = bool(use_easyocr)
         self._easy_reader: Any | None = None
+        # easyocr (~64 MB de pesos) só é carregado no primeiro uso
+        self._easy_reader_pending = self.use_easyocr
         self._last_values: dict[str, float] = {}
+        # Último recorte por chave: digest → valor lido (None = OCR falhou)
+        self._crop_digests: dict[str, tuple[bytes, float | None]] = {}
 
         self._cv2: Any | None = None
         self._np: Any | None = None
         self._pytesseract: Any | None = None
+        # tesserocr (API C in-process) quando instalado: sem subprocesso
+        self._tesserapi: Any | None = None
+        self._digit_session: Any | None = None
+        self._digit_min_conf = 0.90
+        # Objetos cv2 reutilizados por todos os recortes (criados com o cv2)
+        self._clahe_std: Any | None = None
+        self._clahe_agg: Any | None = None
+        self._kernel_2x2: Any | None = None
+        # TITAN_OCR_UMAT=1: pré-processamento via OpenCL (cv2.UMat) se houver
+        self._use_umat = False
+        # Buffers intermediários reaproveitados entre recortes do mesmo tamanho
+        self._scratch: dict[tuple[str, tuple[int, ...]], Any] = {}
+        # Pasta temporária reutilizada pelo OCR em lote (criada sob demanda)
+        self._batch_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._batch_enabled = True
 
         self._load_backends(tesseract_cmd=tesseract_cmd)
+        if njit is not None and self._np is not None:
+            # Warm-up: compila o kernel numba fora do loop de decisão
+            _invert_dark_channels(self._np.zeros((1, 1, 1), dtype=self._np.uint8))
 
     def _load_backends(self, tesseract_cmd: str | None = None) -> None:
         try:
             import cv2  # type: ignore[import-untyped]
             self._cv2 = cv2
+            self._clahe_std = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(4, 4))
+            self._clahe_agg = cv2.createCLAHE(clipLimit=10.0, tileGridSize=(2, 2))
+            self._kernel_2x2 = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+            if env_truthy("TITAN_OCR_UMAT") and cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                self._use_umat = True
         except Exception:
             self._cv2 = None
 
@@ -48,6 +163,15 @@ class TitanOCR:
         except Exception:
             self._np = None
 
+        try:
+            import tesserocr  # type: ignore[import-untyped]
+
+            api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_LINE)
+            api.SetVariable("tessedit_char_whitelist", _TESSERACT_WHITELIST)
+            self._tesserapi = api
+        except Exception:
+            self._tesserapi = None
+
         try:
             import pytesseract  # type: ignore[import-untyped]
 
@@ -62,7 +186,6 @@ class TitanOCR:
                         r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
                     ]
                     for _c in _candidates:
-                        import os
                         if os.path.isfile(_c):
                             cmd = _c
                             break
@@ -76,13 +199,19 @@ class TitanOCR:
         except Exception:
             self._pytesseract = None
 
-        if self.use_easyocr:
+        model_path = os.getenv("TITAN_OCR_DIGIT_MODEL", "").strip()
+        if model_path and os.path.isfile(model_path) and self._cv2 is not None:
             try:
-                import easyocr  # type: ignore[import-untyped]
-
-                self._easy_reader = easyocr.Reader(["en"], gpu=False, verbose=False)
+                import onnxruntime  # type: ignore[import-untyped]
+
+                options = onnxruntime.SessionOptions()
+                options.intra_op_num_threads = 1
+                self._digit_session = onnxruntime.InferenceSession(
+                    model_path, options, providers=["CPUExecutionProvider"],
+                )
+                self._digit_min_conf = float(os.getenv("TITAN_OCR_DIGIT_MIN_CONF", "0.90"))
             except Exception:
-                self._easy_reader = None
+                self._digit_session = None
 
     def _build_candidates(self, image_crop: Any) -> list[Any]:
         """Build all preprocessing candidates for OCR.
@@ -98,22 +227,41 @@ class TitanOCR:
         3. CLAHE + OTSU
         4. Adaptive Gaussian threshold
         5. Fixed threshold at 140
+        6. Aggressive CLAHE + OTSU on a 6× upscale
+        """
+        return [
+            candidate
+            for stage in self._iter_candidate_stages(image_crop)
+            for candidate in stage
+        ]
+
+    def _iter_candidate_stages(self, image_crop: Any) -> Iterator[list[Any]]:
+        """Yield the candidates of :meth:`_build_candidates` in two stages.
+
+        Colour masks (cheap) come first; the grayscale strategies, with the
+        3×/6× upscales and CLAHE, are only built when the caller asks for
+        the next stage.
         """
         if image_crop is None:
-            return []
-        if self._cv2 is None or self._np is None:
-            return [image_crop] if image_crop is not None else []
-
+            return
         cv2 = self._cv2
-        np = self._np
-        candidates: list[Any] = []
+        if cv2 is None or self._np is None:
+            yield [image_crop]
+            return
 
         try:
             frame = image_crop
+            height, width = frame.shape[:2]
+            is_color = frame.ndim == 3
+            # With OpenCL the cv2 calls below run on the UMat; only the
+            # candidates themselves are copied back (.get()) for OCR.
+            use_umat = self._use_umat
+            src = cv2.UMat(frame) if use_umat else frame
+            colour: list[Any] = []
 
             # ── Colour isolation strategies ───────────────────────
-            if len(frame.shape) == 3:
-                hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+            if is_color:
+                hsv = cv2.cvtColor(src, cv2.COLOR_BGR2HSV)
 
                 # Yellow/gold text mask — PPPoker pot numbers
                 yellow_mask = cv2.inRange(hsv, (10, 80, 80), (35, 255, 255))
@@ -122,37 +270,62 @@ class TitanOCR:
                 # Combined: catches both yellow and white text
                 combined_mask = cv2.bitwise_or(yellow_mask, white_mask)
 
-                h, w = yellow_mask.shape[:2]
+                h, w = height, width
                 scale = 4
-                kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+                kernel = self._kernel_2x2
+
+                # One resize + one dilate for the three masks (as channels);
+                # both ops are per-channel, so the result is unchanged.
+                up_shape = (h * scale, w * scale, 3)
+                stacked = cv2.merge((yellow_mask, combined_mask, white_mask))
+                stacked = cv2.resize(
+                    stacked, (w * scale, h * scale),
+                    dst=self._scratch_buffer("mask_up", up_shape, use_umat),
+                    interpolation=cv2.INTER_NEAREST,
+                )
+                stacked = cv2.dilate(
+                    stacked, kernel,
+                    dst=self._scratch_buffer("mask_dilate", up_shape, use_umat),
+                    iterations=1,
+                )
+                if use_umat:
+                    stacked = stacked.get()
+                colour.extend(cv2.split(stacked))
+        except Exception:
+            yield [image_crop]
+            return
 
-                for mask in [yellow_mask, combined_mask, white_mask]:
-                    up = cv2.resize(
-                        mask, (w * scale, h * scale),
-                        interpolation=cv2.INTER_NEAREST,
-                    )
-                    up = cv2.dilate(up, kernel, iterations=1)
-                    candidates.append(up)
+        if colour:
+            yield colour
 
+        try:
             # ── Grayscale strategies ──────────────────────────────
-            if len(frame.shape) == 3:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if is_color:
+                gray = cv2.cvtColor(src, cv2.COLOR_BGR2GRAY)
             else:
-                gray = frame
+                gray = src
 
-            h, w = gray.shape[:2]
+            h, w = height, width
             if h <= 0 or w <= 0:
-                return candidates
+                return
 
+            # INTER_CUBIC stays: on these crop sizes OpenCV's SIMD resize is
+            # memory-bound (cubic ≈ linear ≈ nearest in time), while linear /
+            # nearest+dilate change 3–13% of the binarised pixels.
             scale = 3
+            up_shape = (h * scale, w * scale)
             upscaled = cv2.resize(
-                gray, (w * scale, h * scale), interpolation=cv2.INTER_CUBIC
+                gray, (w * scale, h * scale),
+                dst=self._scratch_buffer("gray_up", up_shape, use_umat),
+                interpolation=cv2.INTER_CUBIC,
+            )
+            blurred = cv2.GaussianBlur(
+                upscaled, (3, 3), 0,
+                dst=self._scratch_buffer("gray_blur", up_shape, use_umat),
             )
-            blurred = cv2.GaussianBlur(upscaled, (3, 3), 0)
 
             # Strategy 3: CLAHE + OTSU
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(4, 4))
-            enhanced = clahe.apply(blurred)
+            enhanced = self._clahe_std.apply(blurred)
             _, thresh1 = cv2.threshold(
                 enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
             )
@@ -169,49 +342,215 @@ class TitanOCR:
             # Strategy 5: Fixed threshold
             _, thresh3 = cv2.threshold(blurred, 140, 255, cv2.THRESH_BINARY)
 
-            for thresh_img in [thresh1, thresh2, thresh3]:
-                k = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-                cleaned = cv2.morphologyEx(thresh_img, cv2.MORPH_CLOSE, k)
-                white_frac = float(np.mean(cleaned > 127))
-                if white_frac < 0.3:
-                    cleaned = cv2.bitwise_not(cleaned)
-                candidates.append(cleaned)
+            # Close the three thresholds in one pass (as channels), then
+            # invert the dark-background ones in place.
+            closed = cv2.morphologyEx(
+                cv2.merge(
+                    (thresh1, thresh2, thresh3),
+                    self._scratch_buffer("thresh_merged", (*up_shape, 3), use_umat),
+                ),
+                cv2.MORPH_CLOSE, self._kernel_2x2,
+                dst=self._scratch_buffer("thresh_closed", (*up_shape, 3), use_umat),
+            )
+            if use_umat:
+                closed = closed.get()
+            _invert_dark_channels(closed)
+            grayscale = list(cv2.split(closed))
 
             # Strategy 6: Aggressive CLAHE for low-contrast button text
             # PPPoker buttons have lighter text on coloured buttons (very
             # low contrast).  High clipLimit + OTSU can extract it.
-            clahe_agg = cv2.createCLAHE(clipLimit=10.0, tileGridSize=(2, 2))
             up_6x = cv2.resize(
-                gray, (w * 6, h * 6), interpolation=cv2.INTER_CUBIC
+                gray, (w * 6, h * 6),
+                dst=self._scratch_buffer("gray_up6", (h * 6, w * 6), use_umat),
+                interpolation=cv2.INTER_CUBIC,
+            )
+            enhanced_agg = self._clahe_agg.apply(
+                up_6x, self._scratch_buffer("gray_clahe6", (h * 6, w * 6), use_umat),
             )
-            enhanced_agg = clahe_agg.apply(up_6x)
             _, thresh_agg = cv2.threshold(
                 enhanced_agg, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
             )
-            white_frac_agg = float(np.mean(thresh_agg > 127))
-            if white_frac_agg < 0.3:
-                thresh_agg = cv2.bitwise_not(thresh_agg)
-            candidates.append(thresh_agg)
-
-            return candidates
+            if use_umat:
+                thresh_agg = thresh_agg.get()
+            _invert_dark_channels(thresh_agg[:, :, None])
+            grayscale.append(thresh_agg)
         except Exception:
-            return [image_crop]
+            if not colour:
+                yield [image_crop]
+            return
+
+        yield grayscale
+
+    def _scratch_buffer(self, tag: str, shape: tuple[int, ...], use_umat: bool) -> Any:
+        """Reusable uint8 ``dst`` for an intermediate step (``None`` on UMat).
+
+        Only for intermediates that never end up in the candidate list;
+        buffers are keyed by step and shape, so each region size keeps its
+        own set.
+        """
+        if use_umat:
+            return None
+        key = (tag, shape)
+        buffer = self._scratch.get(key)
+        if buffer is None:
+            if len(self._scratch) >= 64:
+                self._scratch.clear()
+            buffer = self._np.empty(shape, dtype=self._np.uint8)
+            self._scratch[key] = buffer
+        return buffer
 
     def _ocr_with_tesseract(self, image: Any) -> str:
+        if self._tesserapi is not None and self._np is not None:
+            try:
+                frame = self._np.ascontiguousarray(image)
+                height, width = frame.shape[:2]
+                depth = 1 if frame.ndim == 2 else int(frame.shape[2])
+                self._tesserapi.SetImageBytes(
+                    frame.tobytes(), width, height, depth, width * depth,
+                )
+                return self._tesserapi.GetUTF8Text().strip()
+            except Exception:
+                return ""
         if self._pytesseract is None:
             return ""
         try:
-            config = "--psm 7 -c tessedit_char_whitelist=0123456789.$,Kk"
-            text = self._pytesseract.image_to_string(image, config=config)
+            with _single_thread_tesseract():
+                text = self._pytesseract.image_to_string(image, config=_TESSERACT_CONFIG)
             return text.strip()
         except Exception:
             return ""
 
+    def _ocr_batch_with_tesseract(self, images: list[Any]) -> dict[int, str] | None:
+        """OCR every image in a single tesseract process.
+
+        Each image is written as an uncompressed PNM page and tesseract
+        reads them from a list file, so the process spawn and model load
+        happen once per region instead of once per candidate.
+
+        Returns:
+            Text per image keyed by ``id(image)``, or ``None`` when batching
+            is unavailable (the caller then OCRs image by image).  A failed
+            batch disables batching for the rest of the session.
+        """
+        if not self._batch_enabled or self._pytesseract is None or self._cv2 is None:
+            return None
+        if not images:
+            return {}
+        try:
+            if self._batch_dir is None:
+                self._batch_dir = tempfile.TemporaryDirectory(prefix="titan_ocr_")
+            root = self._batch_dir.name
+            paths: list[str] = []
+            for index, image in enumerate(images):
+                path = os.path.join(root, f"c{index:02d}.pnm")
+                if not self._cv2.imwrite(path, image):
+                    raise OSError(f"imwrite failed: {path}")
+                paths.append(path)
+            list_path = os.path.join(root, "batch.txt")
+            with open(list_path, "w", encoding="utf-8") as handle:
+                handle.write("\n".join(paths))
+            with _single_thread_tesseract():
+                blob = self._pytesseract.image_to_string(list_path, config=_TESSERACT_CONFIG)
+        except Exception:
+            self._batch_enabled = False
+            return None
+
+        # Uma página por imagem, separadas por form feed (com ou sem o final)
+        pages = blob.split("\f")
+        if len(pages) == len(images) + 1 and not pages[-1].strip():
+            pages.pop()
+        if len(pages) != len(images):
+            self._batch_enabled = False
+            return None
+        return {id(image): page.strip() for image, page in zip(images, pages)}
+
+    def _digit_glyphs(self, image: Any) -> list[Any]:
+        """Split a binary candidate into 28×28 glyphs, left to right."""
+        cv2 = self._cv2
+        np = self._np
+        if image is None or image.ndim != 2:
+            return []
+        # Texto precisa ser o primeiro plano (minoria branca)
+        binary = image if np.count_nonzero(image > 127) * 2 < image.size else cv2.bitwise_not(image)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        glyphs: list[Any] = []
+        for x, y, w, h, area in sorted(stats[1:count].tolist()):
+            if area < _DIGIT_MIN_AREA:
+                continue
+            side = max(w, h)
+            square = np.zeros((side, side), dtype=np.uint8)
+            oy, ox = (side - h) // 2, (side - w) // 2
+            square[oy:oy + h, ox:ox + w] = binary[y:y + h, x:x + w]
+            glyphs.append(cv2.resize(square, (_DIGIT_SIZE, _DIGIT_SIZE), interpolation=cv2.INTER_AREA))
+        return glyphs
+
+    def _ocr_with_digit_model(self, images: list[Any]) -> dict[int, str]:
+        """Classify the glyphs of every image in one ONNX Runtime call.
+
+        Returns text keyed by ``id(image)`` for images whose every glyph
+        clears ``_digit_min_conf`` (``""`` when there is no glyph at all);
+        the rest go to tesseract.
+        """
+        if self._digit_session is None or self._np is None or not images:
+            return {}
+        np = self._np
+        texts: dict[int, str] = {}
+        try:
+            spans: list[tuple[Any, int, int]] = []
+            glyphs: list[Any] = []
+            for image in images:
+                found = self._digit_glyphs(image)
+                if found:
+                    spans.append((image, len(glyphs), len(glyphs) + len(found)))
+                    glyphs.extend(found)
+                else:
+                    texts[id(image)] = ""
+            if not glyphs:
+                return texts
+            batch = np.stack(glyphs).astype(np.float32)[:, None, :, :] / 255.0
+            input_name = self._digit_session.get_inputs()[0].name
+            logits = np.asarray(self._digit_session.run(None, {input_name: batch})[0], dtype=np.float32)
+            logits = logits - logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+            labels = probs.argmax(axis=1)
+            confidence = probs.max(axis=1)
+        except Exception:
+            return {}
+
+        for image, start, stop in spans:
+            if float(confidence[start:stop].min()) >= self._digit_min_conf:
+                texts[id(image)] = "".join(_DIGIT_LABELS[i] for i in labels[start:stop])
+        return texts
+
+    def _inverted(self, image: Any) -> Any | None:
+        """Return *image* with inverted polarity, or ``None`` without cv2."""
+        if self._cv2 is None or image is None:
+            return None
+        try:
+            return self._cv2.bitwise_not(image)
+        except Exception:
+            return None
+
+    def _get_easy_reader(self) -> Any | None:
+        """Return the easyocr reader, loading it on the first call."""
+        if self._easy_reader is None and self._easy_reader_pending:
+            self._easy_reader_pending = False
+            try:
+                import easyocr  # type: ignore[import-untyped]
+
+                self._easy_reader = easyocr.Reader(["en"], gpu=False, verbose=False)
+            except Exception:
+                self._easy_reader = None
+        return self._easy_reader
+
     def _ocr_with_easyocr(self, image: Any) -> str:
-        if self._easy_reader is None:
+        reader = self._get_easy_reader()
+        if reader is None:
             return ""
         try:
-            results = self._easy_reader.readtext(
+            results = reader.readtext(
                 image,
                 detail=0,
                 allowlist="0123456789.$,",
@@ -223,10 +562,44 @@ class TitanOCR:
         except Exception:
             return ""
 
+    def _ocr_batch_with_easyocr(self, images: list[Any]) -> dict[int, str] | None:
+        """Read every image in one ``readtext_batched`` call.
+
+        Images are resized to a common size so detection and recognition
+        run as a single batch.  Returns text keyed by ``id(image)``, or
+        ``None`` on failure (the caller then reads image by image).
+        """
+        if not images:
+            return {}
+        reader = self._get_easy_reader()
+        if reader is None:
+            return None
+        try:
+            batch = reader.readtext_batched(
+                images,
+                n_width=max(int(image.shape[1]) for image in images),
+                n_height=max(int(image.shape[0]) for image in images),
+                batch_size=len(images),
+                detail=0,
+                allowlist="0123456789.$,",
+                paragraph=False,
+            )
+        except Exception:
+            return None
+        if len(batch) != len(images):
+            return None
+        return {
+            id(image): " ".join(str(item) for item in results).strip()
+            for image, results in zip(images, batch)
+        }
+
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_numeric_text(text: str) -> float | None:
         """Converte texto OCR para float, removendo ruído comum.
 
+        Memoizado: candidatos diferentes costumam devolver o mesmo texto.
+
         Handles PPPoker-specific formatting:
         - "K" suffix for thousands (e.g., "5.4K" → 5400)
         - Comma as decimal or thousands separator
@@ -235,18 +608,15 @@ class TitanOCR:
         if not text:
             return None
 
-        cleaned = text.strip().replace(" ", "")
-        cleaned = cleaned.replace("O", "0").replace("o", "0")
-        cleaned = cleaned.replace("S", "5").replace("s", "5")
-        cleaned = cleaned.replace("$", "")
+        cleaned = text.strip().translate(_NOISE_TRANS)
 
         # Detect K/k suffix (thousands multiplier) before stripping
-        has_k = cleaned.upper().endswith("K")
+        has_k = cleaned[-1:] in ("K", "k")
         if has_k:
             cleaned = cleaned[:-1]
 
         # Mantém só dígitos e separadores
-        cleaned = re.sub(r"[^0-9.,]", "", cleaned)
+        cleaned = _NON_NUMERIC_RE.sub("", cleaned)
         if not cleaned:
             return None
 
@@ -258,7 +628,7 @@ class TitanOCR:
             cleaned = cleaned.replace(",", "")
 
         # Captura primeiro número válido
-        match = re.search(r"\d+(?:\.\d+)?", cleaned)
+        match = _NUMBER_RE.search(cleaned)
         if match is None:
             return None
 
@@ -285,8 +655,9 @@ class TitanOCR:
     ) -> float:
         """Lê um recorte numérico e retorna ``float`` com fallback seguro.
 
-        Tries ALL preprocessing candidates with OCR and picks the best
-        result — the valid number with the fewest digits (least noisy).
+        Tries the preprocessing candidates with OCR and picks the best
+        result — the first value two candidates agree on, else the one
+        closest to the last reading or with the fewest digits (least noisy).
         This multi-attempt approach is critical because PPPoker uses
         different text colours (yellow pot, white stack) on varied
         backgrounds, and no single preprocessing strategy works for all.
@@ -308,62 +679,138 @@ class TitanOCR:
         if image_crop is None:
             return effective_fallback
 
-        candidates = self._build_candidates(image_crop)
-        if not candidates:
-            return effective_fallback
+        # Recortes chegam como views da captura (strided): uma única cópia
+        # contígua aqui serve ao digest sem tobytes() e a todas as estratégias.
+        if self._np is not None:
+            image_crop = self._np.ascontiguousarray(image_crop)
+
+        # Mesmo recorte do tick anterior: o OCR daria o mesmo resultado.
+        digest = self._crop_digest(image_crop) if key is not None else None
+        if key is not None and digest is not None:
+            previous = self._crop_digests.get(key)
+            if previous is not None and previous[0] == digest:
+                return effective_fallback if previous[1] is None else previous[1]
+            self._crop_digests[key] = (digest, None)
 
         # Try each candidate; collect all valid results.
-        # To limit latency, stop after finding 3 successful readings.
+        # Keep the first 3 successful readings (same order as before), but
+        # stop as soon as two of them agree: consensus is the real signal.
+        # Candidates arrive in stages, so the grayscale/CLAHE ones are only
+        # built and OCR'd when the colour masks were not enough.
         results: list[float] = []
+        votes: dict[float, int] = {}
+        consensus: float | None = None
         max_attempts = 3
-        for candidate in candidates:
-            if len(results) >= max_attempts:
-                break
-            value = self._try_ocr(candidate)
-            if value is not None and value > 0:
+        for candidates in self._iter_candidate_stages(image_crop):
+            inverted = [self._inverted(candidate) for candidate in candidates]
+            texts, easy_texts = self._read_stage_texts(
+                [image for image in (*candidates, *inverted) if image is not None]
+            )
+            for candidate, candidate_inv in zip(candidates, inverted):
+                if len(results) >= max_attempts:
+                    break
+                value = self._try_ocr(candidate, texts, easy_texts=easy_texts)
+                if value is None or value <= 0:
+                    # Also try inverted polarity
+                    value = self._try_ocr(candidate_inv, texts, easy_texts=easy_texts)
+                    if value is None or value <= 0:
+                        continue
                 results.append(value)
-                continue
-            # Also try inverted polarity
-            if self._cv2 is not None and candidate is not None:
-                try:
-                    inv = self._cv2.bitwise_not(candidate)
-                    value_inv = self._try_ocr(inv)
-                    if value_inv is not None and value_inv > 0:
-                        results.append(value_inv)
-                except Exception:
-                    pass
+                rounded_value = round(value, 1)
+                count = votes.get(rounded_value, 0) + 1
+                votes[rounded_value] = count
+                if count >= 2:
+                    consensus = rounded_value
+                    break
+            if consensus is not None or len(results) >= max_attempts:
+                break
 
         if not results:
             return effective_fallback
 
         # Pick best result using a scoring system:
+        # 0. Two readings that agree win outright (consensus)
         # 1. Prefer values closest to last known value (temporal coherence)
         # 2. Otherwise prefer shortest digit count (least noisy OCR)
-        # 3. Break ties by preferring values seen more than once (consensus)
-        best = results[0]
-        if key is not None and key in self._last_values:
+        if consensus is not None:
+            best = next(v for v in results if round(v, 1) == consensus)
+        elif key is not None and key in self._last_values:
             last = self._last_values[key]
             # Temporal coherence: prefer value closest to last known
             best = min(results, key=lambda v: abs(v - last))
         else:
-            # Count occurrences for consensus
-            from collections import Counter
-            rounded = Counter(round(v, 1) for v in results)
-            # Sort by (-frequency, digit_count) to prefer consensus + shorter
-            best = min(
-                results,
-                key=lambda v: (-rounded[round(v, 1)], len(str(int(v)))),
-            )
+            best = min(results, key=lambda v: len(str(int(v))))
 
         if key is not None:
             self._last_values[key] = best
+            if digest is not None:
+                self._crop_digests[key] = (digest, best)
         return best
 
-    def _try_ocr(self, image: Any) -> float | None:
-        """Attempt OCR on a preprocessed image, return parsed value or None."""
+    def _read_stage_texts(
+        self, images: list[Any],
+    ) -> tuple[dict[int, str], dict[int, str] | None]:
+        """OCR a stage's candidates (and inverses) in as few calls as possible.
+
+        The digit model (if loaded) goes first, a single tesseract process
+        reads what it could not, and easyocr (if enabled) gets one batch
+        with everything still empty.  With in-process tesserocr, or when
+        tesseract batching is off, there is no batch to build on: the rest
+        is left to :meth:`_try_ocr`, which only reads the candidates the
+        selection actually reaches (easyocr only where tesseract read
+        nothing).  Returns ``(texts, easy_texts)`` for :meth:`_try_ocr`.
+        """
+        texts = self._ocr_with_digit_model(images)
+        if self._tesserapi is not None:
+            return texts, None
+        batch = self._ocr_batch_with_tesseract(
+            [image for image in images if id(image) not in texts]
+        )
+        texts.update(batch or {})
+        easy_texts = None
+        # Sem lote do tesseract os candidatos ainda não foram lidos: um lote
+        # do easyocr agora rodaria até nos que o tesseract vai ler sozinho
+        if self.use_easyocr and (batch is not None or self._pytesseract is None):
+            easy_texts = self._ocr_batch_with_easyocr(
+                [image for image in images if not texts.get(id(image))]
+            )
+        return texts, easy_texts
+
+    @staticmethod
+    def _crop_digest(image_crop: Any) -> bytes | None:
+        """64-bit digest of the full crop (shape + pixels), or ``None``.
+
+        The whole crop is hashed: a strided sample could miss the thin
+        strokes that tell digits apart, and regions are only a few KB.
+        """
+        try:
+            hasher = hashlib.blake2b(repr(image_crop.shape).encode(), digest_size=8)
+            pixels = image_crop.data if image_crop.flags.c_contiguous else image_crop.tobytes()
+            hasher.update(pixels)
+            return hasher.digest()
+        except Exception:
+            return None
+
+    def _try_ocr(
+        self,
+        image: Any,
+        texts: dict[int, str] | None = None,
+        *,
+        easy_texts: dict[int, str] | None = None,
+    ) -> float | None:
+        """Attempt OCR on a preprocessed image, return parsed value or None.
+
+        *texts* holds the batched digit-model/tesseract results and
+        *easy_texts* the batched easyocr ones; images found there are not
+        read again.
+        """
         if image is None:
             return None
-        text = self._ocr_with_tesseract(image)
+        text = texts.get(id(image)) if texts is not None else None
+        if text is None:
+            text = self._ocr_with_tesseract(image)
         if not text and self.use_easyocr:
-            text = self._ocr_with_easyocr(image)
+            text = easy_texts.get(id(image)) if easy_texts is not None else None
+            if text is None:
+                text = self._ocr_with_easyocr(image)
         return self._parse_numeric_text(text)
@@ -30,7 +30,22 @@ Variáveis de ambiente
 ``TITAN_EMULATOR_TITLE``     Termo de busca no título da janela (default ``MuMu``).
 ``TITAN_YOLO_MODEL``         Caminho do arquivo ``.pt`` de pesos YOLO.
 ``TITAN_YOLO_CONFIDENCE``    Confiança mínima para detecções (default ``0.35``).
+``TITAN_YOLO_TRT``           ``1`` = usa engine TensorRT FP16 ao lado do ``.pt``
+                             (exportada na primeira carga; default ``0``).
+``TITAN_YOLO_INT8``          ``1`` = prefere a engine ``.int8.engine`` calibrada por
+                             ``training/export_int8.py`` (default ``0``).
+``TITAN_YOLO_HALF``          ``0`` = desliga inferência FP16 na GPU (ex.: GTX 10xx;
+                             default ``1``, só tem efeito com CUDA).
+``TITAN_YOLO_COMPILE``       ``1`` = ``torch.compile`` (reduce-overhead) nos pesos
+                             ``.pt`` + warm-up na carga (default ``0``).
+``TITAN_YOLO_BACKEND``       ``onnx`` = ONNX Runtime (DirectML/CPU) com o ``.onnx``
+                             ao lado do ``.pt``, sem PyTorch (default: Ultralytics).
 ``TITAN_VISION_TARGET_FPS``  FPS alvo para captura (default ``30``).
+``TITAN_VISION_PREFETCH``    ``1`` = captura contínua numa thread; ``detect()`` usa
+                             sempre o frame mais recente (default ``0``).
+``TITAN_VISION_SKIP_STATIC`` ``1`` = reaproveita as detecções quando o frame é
+                             idêntico, pixel a pixel, ao anterior (default ``0``).
+``TITAN_WINDOW_TTL``         Segundos entre buscas completas da janela (default ``1.0``).
 ``TITAN_CHROME_TOP``         Pixels a remover do topo — barra de título (default ``35``).
 ``TITAN_CHROME_BOTTOM``      Pixels a remover de baixo — toolbar (default ``0``).
 ``TITAN_CHROME_LEFT``         Pixels a remover da esquerda — sidebar (default ``0``).
@@ -42,10 +57,14 @@ from __future__ import annotations
 import ctypes
 import hashlib
 import os
+import queue
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
+from utils.env import env_truthy
+
 # ---------------------------------------------------------------------------
 # Imports opcionais — falham graciosamente para ambientes sem GUI / CI.
 # ---------------------------------------------------------------------------
@@ -59,6 +78,11 @@ try:
 except Exception:  # pragma: no cover
     _cv2_module = None  # type: ignore[assignment]
 
+try:
+    from numba import njit  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover - numba é opcional
+    njit = None
+
 try:
     import mss as _mss_module
 except Exception:  # pragma: no cover
@@ -92,6 +116,61 @@ _DEFAULT_CHROME_BOTTOM: int = _emu_profile.chrome_bottom if _emu_profile else 0
 _DEFAULT_CHROME_LEFT: int = _emu_profile.chrome_left if _emu_profile else 0
 _DEFAULT_CHROME_RIGHT: int = _emu_profile.chrome_right if _emu_profile else 0
 
+def _xyxy_to_cxcywh(xyxy: Any) -> Any:
+    """``(N, 4)`` float64 xyxy → ``(N, 4)`` int64 ``cx, cy, w, h`` numa passada.
+
+    Truncamento igual ao ``int()`` de Python (compilado com numba quando
+    disponível).
+    """
+    count = xyxy.shape[0]
+    out = np.empty((count, 4), dtype=np.int64)
+    for i in range(count):
+        x1 = xyxy[i, 0]
+        y1 = xyxy[i, 1]
+        x2 = xyxy[i, 2]
+        y2 = xyxy[i, 3]
+        out[i, 0] = int((x1 + x2) / 2.0)
+        out[i, 1] = int((y1 + y2) / 2.0)
+        out[i, 2] = int(x2 - x1)
+        out[i, 3] = int(y2 - y1)
+    return out
+
+
+def _xyxy_to_cxcywh_numpy(xyxy: Any) -> Any:
+    """Fallback vetorizado de :func:`_xyxy_to_cxcywh` (sem numba)."""
+    out = np.empty((xyxy.shape[0], 4), dtype=np.int64)
+    out[:, 0] = (xyxy[:, 0] + xyxy[:, 2]) / 2.0
+    out[:, 1] = (xyxy[:, 1] + xyxy[:, 3]) / 2.0
+    out[:, 2] = xyxy[:, 2] - xyxy[:, 0]
+    out[:, 3] = xyxy[:, 3] - xyxy[:, 1]
+    return out
+
+
+# Kernel sem decorar: os testes o comparam com o fallback numpy
+_xyxy_to_cxcywh_py = _xyxy_to_cxcywh
+
+if njit is not None:
+    _xyxy_to_cxcywh = njit(cache=True, boundscheck=False)(_xyxy_to_cxcywh)
+else:
+    _xyxy_to_cxcywh = _xyxy_to_cxcywh_numpy
+
+# Rate-limit: o resto da espera abaixo disto é feito em spin (perf_counter).
+# No Python 3.11+ o time.sleep do Windows já usa waitable timer de alta
+# resolução, mas ainda pode acordar ~1 ms atrasado.
+_RATE_LIMIT_SPIN_S: float = 0.002
+
+# Espera máxima por um frame da thread de captura (TITAN_VISION_PREFETCH)
+_CAPTURE_QUEUE_TIMEOUT_S: float = 1.0
+
+
+def _wait_until(deadline: float) -> None:
+    """Espera até ``deadline`` (``time.perf_counter``): sleep + spin no final."""
+    remaining = deadline - time.perf_counter()
+    if remaining > _RATE_LIMIT_SPIN_S:
+        time.sleep(remaining - _RATE_LIMIT_SPIN_S)
+    while time.perf_counter() < deadline:
+        time.sleep(0)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Dataclasses
@@ -142,22 +221,40 @@ class DetectionFrame:
     timestamp: float = 0.0
     window_left: int = 0
     window_top: int = 0
+    # label minúsculo → índices em ``detections``; montado na 1ª consulta
+    # (não alterar ``detections`` depois de consultar o frame).
+    _label_index: dict[str, list[int]] | None = field(default=None, repr=False, compare=False)
 
     # -- Helpers de consulta rápida -----------------------------------------
 
+    def _labels(self) -> dict[str, list[int]]:
+        index = self._label_index
+        if index is None:
+            index = {}
+            for i, d in enumerate(self.detections):
+                index.setdefault(d.label.lower(), []).append(i)
+            self._label_index = index
+        return index
+
     def labels_by_prefix(self, prefix: str) -> list[DetectionItem]:
         """Retorna detecções cujo label começa com *prefix* (case-insensitive)."""
         prefix_lower = prefix.lower()
-        return [d for d in self.detections if d.label.lower().startswith(prefix_lower)]
+        indices = sorted(
+            i
+            for label, label_indices in self._labels().items()
+            if label.startswith(prefix_lower)
+            for i in label_indices
+        )
+        return [self.detections[i] for i in indices]
 
     def best_by_label(self, label: str) -> DetectionItem | None:
         """Retorna a detecção de maior confiança para *label* exato."""
-        best: DetectionItem | None = None
-        for d in self.detections:
-            if d.label.lower() == label.lower():
-                if best is None or d.confidence > best.confidence:
-                    best = d
-        return best
+        indices = self._labels().get(label.lower(), ())
+        return max(
+            (self.detections[i] for i in indices),
+            key=lambda d: d.confidence,
+            default=None,
+        )
 
     def to_screen_coords(self, cx: int, cy: int) -> tuple[int, int]:
         """Converte coordenadas relativas à ROI → absolutas na tela.
@@ -223,9 +320,14 @@ class EmulatorWindow:
         self._offset_y: int = 0   # top absoluto da ROI na tela
         self._canvas_w: int = 0   # largura da ROI
         self._canvas_h: int = 0   # altura da ROI
+        # Dict ``mss`` da ROI, refeito só quando a ROI muda (ver ``region``)
+        self._region: dict[str, int] = {"left": 0, "top": 0, "width": 0, "height": 0}
 
         self._hwnd: int = 0
         self._last_find_ok: bool = False
+        # Busca completa (EnumWindows) no máximo a cada TTL — ver find_cached
+        self._find_ttl: float = max(0.0, self._env_float("TITAN_WINDOW_TTL", 1.0))
+        self._last_find_ts: float = 0.0
 
     # -- Localização via win32gui -------------------------------------------
 
@@ -235,7 +337,8 @@ class EmulatorWindow:
         Strategy:
           1. Use ``find_render_hwnd`` from emulator_profiles (if available)
              to get the render child HWND (e.g. ``nemuwin`` in MuMu).
-          2. Fallback: ``EnumWindows`` title match → look for render child
+          2. Fallback: exact-title ``FindWindow`` (single call), else
+             ``EnumWindows`` title-substring match → look for render child
              among the matched window's children.
           3. Last resort: use the main window HWND directly.
 
@@ -260,9 +363,16 @@ class EmulatorWindow:
         if render_hwnd and win32gui.IsWindowVisible(render_hwnd):
             self._hwnd = render_hwnd
         else:
-            # ── Strategy B: title-based enumeration ──
+            # ── Strategy B: exact title (one FindWindow call), then
+            #    title-substring enumeration over all top-level windows ──
             found_hwnd: int = 0
             pattern_lower = self.title_pattern.lower()
+            try:
+                exact_hwnd = int(win32gui.FindWindow(None, self.title_pattern) or 0)
+            except Exception:
+                exact_hwnd = 0
+            if exact_hwnd and win32gui.IsWindowVisible(exact_hwnd):
+                found_hwnd = exact_hwnd
 
             def _enum_callback(hwnd: int, _extra: Any) -> bool:
                 nonlocal found_hwnd
@@ -274,10 +384,11 @@ class EmulatorWindow:
                     return False
                 return True
 
-            try:
-                win32gui.EnumWindows(_enum_callback, None)
-            except Exception:
-                pass
+            if found_hwnd == 0:
+                try:
+                    win32gui.EnumWindows(_enum_callback, None)
+                except Exception:
+                    pass
 
             if found_hwnd == 0:
                 self._last_find_ok = False
@@ -287,7 +398,37 @@ class EmulatorWindow:
             child_hwnd = self._find_render_child(found_hwnd)
             self._hwnd = child_hwnd if child_hwnd else found_hwnd
 
-        # Get the screen rect of the chosen HWND
+        if not self._refresh_rect():
+            return False
+        self._last_find_ts = time.perf_counter()
+        return True
+
+    def find_cached(self) -> bool:
+        """:meth:`find` com cache: a busca completa roda no máximo a cada ``TITAN_WINDOW_TTL`` s.
+
+        Dentro do TTL apenas revalida o HWND já encontrado e relê o seu
+        retângulo (a janela pode ter sido arrastada).  Qualquer falha
+        invalida o cache e cai na busca completa.
+        """
+        if (
+            self._last_find_ok
+            and win32gui is not None
+            and time.perf_counter() - self._last_find_ts < self._find_ttl
+        ):
+            try:
+                alive = bool(win32gui.IsWindow(self._hwnd)) and bool(win32gui.IsWindowVisible(self._hwnd))
+            except Exception:
+                alive = False
+            if alive and self._refresh_rect():
+                return True
+        return self.find()
+
+    def invalidate_cache(self) -> None:
+        """Força a próxima :meth:`find_cached` a refazer a busca completa."""
+        self._last_find_ts = float("-inf")
+
+    def _refresh_rect(self) -> bool:
+        """Lê ``GetWindowRect`` do HWND atual e recalcula a ROI."""
         try:
             rect = win32gui.GetWindowRect(self._hwnd)
             self._win_left = int(rect[0])
@@ -380,6 +521,19 @@ class EmulatorWindow:
         self._offset_y = self._win_top + self._chrome_top
         self._canvas_w = max(0, self._win_width - self._chrome_left - self._chrome_right)
         self._canvas_h = max(0, self._win_height - self._chrome_top - self._chrome_bottom)
+        region = self._region
+        if (
+            region["left"] != self._offset_x
+            or region["top"] != self._offset_y
+            or region["width"] != self._canvas_w
+            or region["height"] != self._canvas_h
+        ):
+            self._region = {
+                "left": self._offset_x,
+                "top": self._offset_y,
+                "width": self._canvas_w,
+                "height": self._canvas_h,
+            }
 
     # -- Propriedades -------------------------------------------------------
 
@@ -439,15 +593,13 @@ class EmulatorWindow:
 
         Formato: ``{"left": offset_x, "top": offset_y, "width": canvas_w, "height": canvas_h}``.
         Retorna ``None`` se a janela não foi encontrada ou a ROI é inválida.
+
+        O mesmo dict é devolvido enquanto a ROI não muda (um novo é criado
+        quando a janela se move) — trate-o como somente leitura.
         """
         if not self._last_find_ok or self._canvas_w <= 0 or self._canvas_h <= 0:
             return None
-        return {
-            "left": self._offset_x,
-            "top": self._offset_y,
-            "width": self._canvas_w,
-            "height": self._canvas_h,
-        }
+        return self._region
 
     @property
     def full_window_region(self) -> dict[str, int] | None:
@@ -519,6 +671,17 @@ class EmulatorWindow:
         except ValueError:
             return default
 
+    @staticmethod
+    def _env_float(name: str, default: float) -> float:
+        """Lê uma variável de ambiente como float, com fallback."""
+        raw = os.getenv(name, "").strip()
+        if not raw:
+            return default
+        try:
+            return float(raw)
+        except ValueError:
+            return default
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # VisionYolo — captura ROI + inferência YOLO
@@ -572,6 +735,24 @@ class VisionYolo:
         self._model: Any = None
         self._model_loaded: bool = False
         self._model_error: str = ""
+        # Instância mss reaproveitada entre capturas (aberta na primeira)
+        self._sct: Any = None
+
+        # Prefetch: thread de captura contínua → fila com só o frame mais
+        # recente, enquanto o frame anterior passa pelo YOLO
+        self._prefetch_enabled: bool = self._env_bool("TITAN_VISION_PREFETCH")
+        self._frame_queue: queue.Queue[tuple[Any, int, int]] = queue.Queue(maxsize=1)
+        self._capture_stop = threading.Event()
+        self._capture_thread: threading.Thread | None = None
+
+        # Tela parada: frame idêntico ao anterior (pixel a pixel) repete o
+        # último resultado em vez de rodar o YOLO de novo
+        self._skip_static: bool = self._env_bool("TITAN_VISION_SKIP_STATIC")
+        self._static_frame: Any = None
+        self._static_result: DetectionFrame | None = None
+
+        # Kwargs extras do predict() (FP16 na GPU), definidos ao carregar
+        self._predict_kwargs: dict[str, Any] = {}
         self.last_frame_hash: str = ""
 
         collect_raw_dir = os.getenv("TITAN_COLLECT_DATA_DIR", "").strip()
@@ -637,22 +818,136 @@ class VisionYolo:
             self._model_error = "TITAN_YOLO_MODEL não definido"
             return False
 
+        if os.getenv("TITAN_YOLO_BACKEND", "").strip().lower() == "onnx":
+            return self._load_onnx_model()
+
         try:
             from ultralytics import YOLO  # type: ignore[import-untyped]
 
-            self._model = YOLO(self.model_path)
+            engine_path = self._int8_engine() if self._env_bool("TITAN_YOLO_INT8") else None
+            if not engine_path and self._env_bool("TITAN_YOLO_TRT"):
+                engine_path = self._tensorrt_engine(YOLO)
+            if engine_path:
+                self._model = YOLO(engine_path, task="detect")
+            else:
+                self._model = YOLO(self.model_path)
+            self._configure_precision()
+            if not engine_path and self._env_bool("TITAN_YOLO_COMPILE"):
+                self._compile_model()
+            else:
+                try:
+                    self._warm_up_predict()
+                except Exception:
+                    pass  # o primeiro frame real paga a montagem do predictor
             return True
         except Exception as err:
             self._model_error = str(err)
             self._model = None
             return False
 
+    def _load_onnx_model(self) -> bool:
+        """Backend ONNX Runtime (DirectML/CPU): ``.onnx`` irmão do ``.pt``, sem PyTorch."""
+        onnx_path = self.model_path
+        if not onnx_path.lower().endswith(".onnx"):
+            onnx_path = os.path.splitext(onnx_path)[0] + ".onnx"
+        try:
+            from agent.yolo_onnx import OnnxYolo
+
+            self._model = OnnxYolo(onnx_path)
+            self._predict_kwargs = {}
+            return True
+        except Exception as err:
+            self._model_error = f"backend ONNX falhou: {err}"
+            self._model = None
+            return False
+
+    def _compile_model(self) -> None:
+        """``torch.compile`` no ``nn.Module`` do YOLO + um predict de warm-up.
+
+        O warm-up (frame preto do tamanho do canvas) paga a compilação e a
+        captura de CUDA graphs na carga, não no primeiro frame real.  Se
+        algo falhar, segue com o módulo original.
+        """
+        original = self._model.model
+        try:
+            import torch  # type: ignore[import-untyped]
+
+            self._model.model = torch.compile(original, mode="reduce-overhead", fullgraph=False)
+            self._warm_up_predict()
+        except Exception as err:
+            self._model.model = original
+            self._model_error = f"torch.compile falhou: {err}"
+
+    def _warm_up_predict(self) -> None:
+        """Um ``predict()`` num frame preto do tamanho do canvas, na carga.
+
+        O Ultralytics monta o predictor (AutoBackend, contexto CUDA, FP16,
+        shapes do letterbox) só no primeiro ``predict()``; fazê-lo aqui, com
+        os mesmos kwargs do loop, tira esse custo do primeiro frame real.
+        Erros sobem para o chamador.
+        """
+        height = self.emulator.canvas_height or 640
+        width = self.emulator.canvas_width or 640
+        self._model.predict(
+            source=np.zeros((height, width, 3), dtype=np.uint8),
+            conf=self.confidence,
+            verbose=False,
+            **self._predict_kwargs,
+        )
+
+    def _configure_precision(self) -> None:
+        """Liga TF32 nas matmuls e FP16 no predict() quando há CUDA."""
+        self._predict_kwargs = {}
+        try:
+            import torch  # type: ignore[import-untyped]
+
+            if not torch.cuda.is_available():
+                return
+            torch.set_float32_matmul_precision("high")
+            torch.backends.cudnn.allow_tf32 = True
+        except Exception:
+            return
+        if self._env_bool("TITAN_YOLO_HALF", default=True):
+            self._predict_kwargs = {"half": True, "device": 0}
+
+    def _int8_engine(self) -> str | None:
+        """Engine INT8 ``<modelo>.int8.engine`` ao lado do ``.pt``, se existir.
+
+        Não é exportada aqui: a calibração precisa de screenshots reais
+        (``training/export_int8.py``).  Sem ela, segue para FP16/``.pt``.
+        """
+        engine_path = os.path.splitext(self.model_path)[0] + ".int8.engine"
+        return engine_path if os.path.isfile(engine_path) else None
+
+    def _tensorrt_engine(self, yolo_cls: Any) -> str | None:
+        """Caminho da engine TensorRT irmã do ``.pt``, exportando-a se preciso.
+
+        A exportação (FP16, GPU 0) roda uma única vez; as cargas seguintes
+        reutilizam o arquivo ``.engine``.  Retorna ``None`` se a exportação
+        falhar — o chamador volta para os pesos ``.pt``.
+        """
+        engine_path = os.path.splitext(self.model_path)[0] + ".engine"
+        if os.path.isfile(engine_path):
+            return engine_path
+
+        export_kwargs: dict[str, Any] = {"format": "engine", "half": True, "device": 0}
+        height, width = self.emulator.canvas_height, self.emulator.canvas_width
+        if height > 0 and width > 0:
+            export_kwargs["imgsz"] = (height, width)
+        try:
+            exported = yolo_cls(self.model_path).export(**export_kwargs)
+        except Exception as err:
+            self._model_error = f"export TensorRT falhou: {err}"
+            return None
+
+        exported_path = str(exported or engine_path)
+        return exported_path if os.path.isfile(exported_path) else None
+
     # -- Debug helpers ------------------------------------------------------
 
     @staticmethod
     def _env_bool(name: str, default: bool = False) -> bool:
-        value = os.getenv(name, "1" if default else "0").strip().lower()
-        return value in {"1", "true", "yes", "on"}
+        return env_truthy(name, default)
 
     def _debug_dir(self) -> str:
         return os.getenv("TITAN_VISION_DEBUG_DIR", os.path.join("reports", "debug_vision")).strip()
@@ -751,18 +1046,18 @@ class VisionYolo:
         Retorna um array numpy BGR (H×W×3) ou ``None`` se falhar.
         Respeita o rate-limit de ``target_fps``.
         """
-        # Rate-limit para não sobrecarregar a CPU
-        now = time.perf_counter()
-        elapsed = now - self._last_capture_time
-        if elapsed < self._frame_interval:
-            time.sleep(self._frame_interval - elapsed)
+        # Rate-limit para não sobrecarregar a CPU; se a inferência já
+        # consumiu o intervalo do frame, captura na hora.
+        deadline = self._last_capture_time + self._frame_interval
+        if time.perf_counter() < deadline:
+            _wait_until(deadline)
         self._last_capture_time = time.perf_counter()
 
         if _mss_module is None or np is None:
             return None
 
-        # Atualiza posição da janela e ROI a cada frame
-        if not self.emulator.find():
+        # Atualiza posição da janela e ROI (busca completa só a cada TTL)
+        if not self.emulator.find_cached():
             return None
 
         # Atualiza offsets internos para to_screen_coords
@@ -775,15 +1070,100 @@ class VisionYolo:
             return None
 
         try:
-            with _mss_module.mss() as sct:
-                raw = sct.grab(roi_region)
-                # mss retorna BGRA; remove canal alpha → BGR para YOLO
-                frame = np.array(raw)[:, :, :3]
-                self._collect_frame_if_enabled(frame)
-                return frame
+            if self._sct is None:
+                self._sct = _mss_module.mss()
+            raw = self._sct.grab(roi_region)
+            # mss retorna BGRA; view sem cópia do buffer do grab → BGR
+            # contíguo numa passada SIMD do OpenCV.  O slice [:, :, :3]
+            # ficaria strided, e cada consumidor (letterbox do YOLO, OCR)
+            # pagaria uma cópia lenta dele.  Mantém BGR: é a ordem que o
+            # Ultralytics espera de arrays numpy.
+            bgra = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+            if _cv2_module is not None:
+                frame = _cv2_module.cvtColor(bgra, _cv2_module.COLOR_BGRA2BGR)
+            else:
+                frame = bgra[:, :, :3]
+            self._collect_frame_if_enabled(frame)
+            return frame
         except Exception:
+            # Grab falhou (janela fechada/minimizada, ROI fora do monitor):
+            # a próxima captura relocaliza a janela em vez de usar o cache
+            self._close_sct()
+            self.emulator.invalidate_cache()
             return None
 
+    def _capture_with_offsets(self) -> tuple[Any, int, int]:
+        """Captura um frame junto com os offsets da ROI daquele instante."""
+        frame = self.capture_frame()
+        return frame, self.offset_x, self.offset_y
+
+    def _next_capture(self) -> tuple[Any, int, int]:
+        """Próxima captura para :meth:`detect_batch`.
+
+        Com ``TITAN_VISION_PREFETCH=1`` uma thread dedicada captura sem
+        parar (no ritmo de ``target_fps``) para uma fila de uma vaga que
+        guarda só o frame mais recente; aqui apenas se retira esse frame,
+        sem esperar pelo mss enquanto a GPU trabalha.  Todas as capturas
+        ficam nessa thread (a instância mss não é compartilhada).
+        """
+        if not self._prefetch_enabled:
+            return self._capture_with_offsets()
+        self._start_capture_thread()
+        try:
+            return self._frame_queue.get(timeout=_CAPTURE_QUEUE_TIMEOUT_S)
+        except queue.Empty:
+            return None, self.offset_x, self.offset_y
+
+    def _start_capture_thread(self) -> None:
+        """Inicia a thread de captura contínua (idempotente)."""
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+        self._capture_stop.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, name="titan-yolo-capture", daemon=True,
+        )
+        self._capture_thread.start()
+
+    def _capture_loop(self) -> None:
+        """Produz capturas na fila de uma vaga, descartando a anterior não lida."""
+        while not self._capture_stop.is_set():
+            try:
+                capture = self._capture_with_offsets()
+            except Exception:
+                capture = (None, self.offset_x, self.offset_y)
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._frame_queue.put_nowait(capture)
+            except queue.Full:
+                pass
+
+    def close(self) -> None:
+        """Para a thread de captura e libera a instância ``mss`` mantida entre capturas."""
+        stop = getattr(self, "_capture_stop", None)
+        thread = getattr(self, "_capture_thread", None)
+        if stop is not None:
+            stop.set()
+        if thread is not None:
+            thread.join(timeout=2.0)
+        self._capture_thread = None
+        self._close_sct()
+
+    def _close_sct(self) -> None:
+        """Fecha a instância ``mss`` (reaberta na próxima captura)."""
+        sct = getattr(self, "_sct", None)
+        self._sct = None
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+    def __del__(self) -> None:
+        self.close()
+
     # -- Captura via ADB (conteúdo real do Android, imune a oclusão) ---------
 
     def capture_frame_adb(self) -> Any:
@@ -846,11 +1226,30 @@ class VisionYolo:
         ``self.to_screen_coords(det.cx, det.cy)`` para converter para
         coordenadas absolutas do monitor.
         """
-        # Captura frame da ROI do jogo
-        frame = self.capture_frame()
-        if frame is None:
-            self._save_debug_note("capture_failed")
-            return DetectionFrame(timestamp=time.perf_counter())
+        return self.detect_batch(1)[0]
+
+    def detect_batch(self, count: int) -> list[DetectionFrame]:
+        """Captura ``count`` frames e roda o YOLO sobre todos num único ``predict()``.
+
+        Um lote enche a GPU melhor que ``count`` chamadas de um frame só.
+        Devolve um :class:`DetectionFrame` por captura, na ordem; capturas
+        que falharam viram frames vazios.  Os offsets de cada frame são os
+        da janela no momento da sua captura.
+        """
+        count = max(1, int(count))
+        captures: list[tuple[int, Any, int, int]] = []
+        outputs: list[DetectionFrame] = []
+        for slot in range(count):
+            # Captura frame da ROI do jogo
+            frame, left, top = self._next_capture()
+            if frame is None:
+                self._save_debug_note("capture_failed")
+                outputs.append(DetectionFrame(timestamp=time.perf_counter()))
+                continue
+            captures.append((slot, frame, left, top))
+            outputs.append(DetectionFrame())
+        if not captures:
+            return outputs
 
         # Garante que o modelo está carregado
         if not self._load_model():
@@ -859,74 +1258,211 @@ class VisionYolo:
             if fail_fast:
                 detail = self._model_error or "falha ao carregar modelo"
                 raise RuntimeError(f"VisionYolo fail-fast: {detail}")
-            return DetectionFrame(timestamp=time.perf_counter())
+            for slot, _frame, _left, _top in captures:
+                outputs[slot] = DetectionFrame(timestamp=time.perf_counter())
+            return outputs
+
+        reused: dict[int, tuple[int | None, int, int]] = {}
+        if self._skip_static:
+            captures, reused = self._split_static(captures)
+        if not captures:
+            return self._fill_static(outputs, reused, [])
 
-        height, width = frame.shape[:2]
+        frames = [frame for _slot, frame, _left, _top in captures]
         t_start = time.perf_counter()
 
         # Inferência YOLO (verbose=False para não poluir stdout)
         try:
             results = self._model.predict(
-                source=frame,
+                source=frames[0] if len(frames) == 1 else frames,
                 conf=self.confidence,
                 verbose=False,
+                batch=len(frames),
+                **self._predict_kwargs,
             )
         except Exception as err:
-            self._save_debug_frame(frame, "predict_exception")
+            self._save_debug_frame(frames[0], "predict_exception")
             self._save_debug_note("predict_exception", detail=str(err))
-            return DetectionFrame(
+            results = None
+            self._static_frame = None
+
+        inference_ms = (time.perf_counter() - t_start) * 1000.0 / len(frames)
+
+        for index, (slot, frame, left, top) in enumerate(captures):
+            height, width = frame.shape[:2]
+            if results is None:
+                outputs[slot] = DetectionFrame(
+                    frame_width=width,
+                    frame_height=height,
+                    timestamp=t_start,
+                    window_left=left,
+                    window_top=top,
+                )
+                continue
+
+            detections = self._extract_detections(results[index] if index < len(results) else None)
+            if not detections:
+                self._save_debug_frame(frame, "no_detections")
+
+            outputs[slot] = DetectionFrame(
+                detections=detections,
                 frame_width=width,
                 frame_height=height,
+                inference_ms=inference_ms,
                 timestamp=t_start,
-                window_left=self.offset_x,
-                window_top=self.offset_y,
+                window_left=left,
+                window_top=top,
+            )
+        return self._fill_static(outputs, reused, [slot for slot, *_ in captures])
+
+    def _split_static(
+        self, captures: list[tuple[int, Any, int, int]],
+    ) -> tuple[list[tuple[int, Any, int, int]], dict[int, tuple[int | None, int, int]]]:
+        """Separa as capturas idênticas à captura anterior (``TITAN_VISION_SKIP_STATIC``).
+
+        Compara o frame completo, BGR, com ``np.array_equal``: qualquer
+        pixel que mude (um traço de dígito, um destaque só de cor) força a
+        inferência.  A assinatura reduzida de :meth:`stability_signature`
+        não serve aqui — o resize e o limiar de 18 níveis de cinza a deixam
+        cega a essas mudanças.  Devolve as capturas a inferir e, para as
+        repetidas, ``(slot de origem, left, top)`` — origem ``None`` =
+        último resultado de uma chamada anterior.
+        """
+        fresh: list[tuple[int, Any, int, int]] = []
+        reused: dict[int, tuple[int | None, int, int]] = {}
+        source: int | None = None
+        for capture in captures:
+            frame = capture[1]
+            unchanged = (
+                (source is not None or self._static_result is not None)
+                and self._static_frame is not None
+                and np.array_equal(self._static_frame, frame)
             )
+            self._static_frame = frame
+            if unchanged:
+                reused[capture[0]] = (source, capture[2], capture[3])
+            else:
+                fresh.append(capture)
+                source = capture[0]
+        return fresh, reused
 
-        inference_ms = (time.perf_counter() - t_start) * 1000.0
+    def _fill_static(
+        self,
+        outputs: list[DetectionFrame],
+        reused: dict[int, tuple[int | None, int, int]],
+        predicted: list[int],
+    ) -> list[DetectionFrame]:
+        """Completa os slots repetidos com cópias do resultado de origem."""
+        if predicted and self._skip_static:
+            self._static_result = outputs[predicted[-1]]
+        for slot, (source, left, top) in reused.items():
+            base = outputs[source] if source is not None else self._static_result
+            if base is None:
+                continue
+            outputs[slot] = replace(
+                base,
+                inference_ms=0.0,
+                timestamp=time.perf_counter(),
+                window_left=left,
+                window_top=top,
+            )
+        return outputs
+
+    @staticmethod
+    def _column(values: Any) -> Any:
+        """Tensor (torch, possivelmente na GPU) ou array → ``np.ndarray``."""
+        if hasattr(values, "cpu"):
+            values = values.cpu().numpy()
+        return np.asarray(values)
 
-        # Extrai detecções do primeiro resultado
+    @staticmethod
+    def _extract_detections(result: Any) -> list[DetectionItem]:
+        """Converte um resultado do Ultralytics em :class:`DetectionItem` (coords da ROI)."""
         detections: list[DetectionItem] = []
-        if results and len(results) > 0:
-            result = results[0]
-            names: dict[int, str] = getattr(result, "names", {})
-            boxes = getattr(result, "boxes", None)
-
-            if boxes is not None:
-                cls_list = boxes.cls.tolist() if boxes.cls is not None else []
-                xyxy_list = boxes.xyxy.tolist() if boxes.xyxy is not None else []
-                conf_list = boxes.conf.tolist() if boxes.conf is not None else []
-
-                for idx, (cls_idx, xyxy) in enumerate(zip(cls_list, xyxy_list)):
-                    label = names.get(int(cls_idx), "")
-                    conf = float(conf_list[idx]) if idx < len(conf_list) else 0.0
-
-                    x1, y1, x2, y2 = (float(v) for v in xyxy)
-                    cx = int((x1 + x2) / 2.0)
-                    cy = int((y1 + y2) / 2.0)
-                    w = int(x2 - x1)
-                    h = int(y2 - y1)
-
-                    detections.append(DetectionItem(
-                        label=label,
-                        confidence=conf,
-                        cx=cx,
-                        cy=cy,
-                        w=w,
-                        h=h,
-                    ))
-
-        if not detections:
-            self._save_debug_frame(frame, "no_detections")
-
-        return DetectionFrame(
-            detections=detections,
-            frame_width=width,
-            frame_height=height,
-            inference_ms=inference_ms,
-            timestamp=t_start,
-            window_left=self.offset_x,
-            window_top=self.offset_y,
-        )
+        if result is None:
+            return detections
+        names: dict[int, str] = getattr(result, "names", {})
+        boxes = getattr(result, "boxes", None)
+        if boxes is None or boxes.cls is None or boxes.xyxy is None or np is None:
+            return detections
+
+        # Colunas inteiras de uma vez (float64: mesmos valores do tolist());
+        # o loop Python só monta os dataclasses.
+        data = getattr(boxes, "data", None)
+        if data is not None and len(getattr(data, "shape", ())) == 2 and data.shape[1] >= 6:
+            # Ultralytics: (N, 6|7) [x1, y1, x2, y2, (track_id,) conf, cls]
+            # → uma única cópia GPU→CPU em vez de uma por coluna
+            packed = VisionYolo._column(data).astype(np.float64)
+            xyxy = packed[:, :4]
+            conf = packed[:, -2]
+            cls_ids = packed[:, -1].astype(np.int64)
+        else:
+            cls_ids = VisionYolo._column(boxes.cls).astype(np.int64).ravel()
+            xyxy = VisionYolo._column(boxes.xyxy).astype(np.float64).reshape(-1, 4)
+            conf = VisionYolo._column(boxes.conf).astype(np.float64).ravel() if boxes.conf is not None else np.zeros(0)
+        count = min(len(cls_ids), len(xyxy))
+        cxcywh = _xyxy_to_cxcywh(np.ascontiguousarray(xyxy[:count])).tolist()
+        labels = [names.get(cls_idx, "") for cls_idx in cls_ids[:count].tolist()]
+        confs = conf[:count].tolist()
+        confs.extend([0.0] * (count - len(confs)))
+
+        detections = [
+            DetectionItem(label=label, confidence=c, cx=x, cy=y, w=bw, h=bh)
+            for label, c, (x, y, bw, bh) in zip(labels, confs, cxcywh)
+        ]
+        return detections
+
+    @staticmethod
+    def stability_signature(frame: Any) -> Any | None:
+        """Versão reduzida de *frame* usada na checagem de estabilidade.
+
+        Com OpenCV: grayscale redimensionado para no máximo 320 px de
+        largura (``INTER_AREA``).  Sem OpenCV: amostragem 1/4 em cada eixo.
+        Calcular uma vez por frame evita reprocessar o frame anterior e
+        permite descartar o frame completo.
+        """
+        if frame is None or np is None:
+            return None
+        try:
+            if _cv2_module is None:
+                return np.ascontiguousarray(frame[::4, ::4])
+
+            cv2 = _cv2_module
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
+            target_w = min(320, int(gray.shape[1]))
+            target_h = max(1, int(gray.shape[0] * (target_w / max(1, gray.shape[1]))))
+            return cv2.resize(gray, (target_w, target_h), interpolation=cv2.INTER_AREA)
+        except Exception:
+            return None
+
+    @staticmethod
+    def check_signature_stability(
+        signature_a: Any,
+        signature_b: Any,
+        threshold: float = 0.01,
+    ) -> bool:
+        """Compara duas assinaturas de :meth:`stability_signature`."""
+        if np is None:
+            return True
+        if signature_a is None or signature_b is None:
+            return False
+
+        try:
+            if signature_a.shape != signature_b.shape:
+                return False
+
+            if _cv2_module is None:
+                diff = np.abs(signature_a.astype("int16") - signature_b.astype("int16"))
+                motion_ratio = float(np.count_nonzero(diff > 12)) / float(diff.size)
+                return motion_ratio <= max(0.0, float(threshold))
+
+            cv2 = _cv2_module
+            diff = cv2.absdiff(signature_a, signature_b)
+            _, motion_mask = cv2.threshold(diff, 18, 255, cv2.THRESH_BINARY)
+            motion_ratio = float(cv2.countNonZero(motion_mask)) / float(motion_mask.size)
+            return motion_ratio <= max(0.0, float(threshold))
+        except Exception:
+            return False
 
     @staticmethod
     def check_screen_stability(
@@ -947,27 +1483,13 @@ class VisionYolo:
         try:
             if frame_a.shape != frame_b.shape:
                 return False
-
-            if _cv2_module is None:
-                diff = np.abs(frame_a.astype("int16") - frame_b.astype("int16"))
-                motion_ratio = float(np.count_nonzero(diff > 12)) / float(diff.size)
-                return motion_ratio <= max(0.0, float(threshold))
-
-            cv2 = _cv2_module
-            gray_a = cv2.cvtColor(frame_a, cv2.COLOR_BGR2GRAY) if len(frame_a.shape) == 3 else frame_a
-            gray_b = cv2.cvtColor(frame_b, cv2.COLOR_BGR2GRAY) if len(frame_b.shape) == 3 else frame_b
-
-            target_w = min(320, int(gray_a.shape[1]))
-            target_h = max(1, int(gray_a.shape[0] * (target_w / max(1, gray_a.shape[1]))))
-            small_a = cv2.resize(gray_a, (target_w, target_h), interpolation=cv2.INTER_AREA)
-            small_b = cv2.resize(gray_b, (target_w, target_h), interpolation=cv2.INTER_AREA)
-
-            diff = cv2.absdiff(small_a, small_b)
-            _, motion_mask = cv2.threshold(diff, 18, 255, cv2.THRESH_BINARY)
-            motion_ratio = float(cv2.countNonZero(motion_mask)) / float(motion_mask.size)
-            return motion_ratio <= max(0.0, float(threshold))
         except Exception:
             return False
+        return VisionYolo.check_signature_stability(
+            VisionYolo.stability_signature(frame_a),
+            VisionYolo.stability_signature(frame_b),
+            threshold=threshold,
+        )
 
     # -- Utilitários --------------------------------------------------------
 
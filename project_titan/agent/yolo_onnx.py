@@ -0,0 +1,162 @@
+"""YOLO via ONNX Runtime — backend sem PyTorch/Ultralytics para o VisionYolo.
+
+Ativado com ``TITAN_YOLO_BACKEND=onnx``: carrega o ``.onnx`` exportado pelo
+Ultralytics (``yolo export model=best.pt format=onnx``) ao lado do ``.pt`` e
+roda com DirectML no Windows (qualquer GPU D3D12, inclusive iGPU) ou CPU.
+
+:class:`OnnxYolo` imita a parte do ``ultralytics.YOLO`` que o VisionYolo
+usa: ``predict(source=..., conf=...)`` devolve resultados com ``names`` e
+``boxes.cls`` / ``boxes.xyxy`` / ``boxes.conf`` (arrays numpy), então o
+restante da pipeline não muda.
+
+Saída esperada do modelo: ``(1, 4 + nc, N)`` — ``cx, cy, w, h`` seguidos
+dos scores por classe (YOLOv8/YOLO11, sem NMS embutido).
+"""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+try:
+    import cv2  # type: ignore[import-untyped]
+except Exception:
+    cv2 = None  # type: ignore[assignment]
+
+# DirectML primeiro; o que não estiver disponível na instalação é ignorado
+_PROVIDERS: tuple[str, ...] = ("DmlExecutionProvider", "CPUExecutionProvider")
+_DEFAULT_IMGSZ = 640
+_LETTERBOX_FILL = 114
+_NMS_IOU = 0.45
+# Deslocamento por classe: NMS comum vira NMS por classe (como no Ultralytics)
+_CLASS_OFFSET = 4096.0
+
+
+@dataclass(slots=True)
+class OnnxBoxes:
+    """Caixas de um frame, no formato de ``ultralytics.engine.results.Boxes``."""
+
+    cls: np.ndarray
+    xyxy: np.ndarray
+    conf: np.ndarray
+
+
+@dataclass(slots=True)
+class OnnxResult:
+    """Resultado de um frame: ``names`` + ``boxes`` (coords do frame original)."""
+
+    names: dict[int, str]
+    boxes: OnnxBoxes
+
+
+class OnnxYolo:
+    """Sessão ONNX Runtime com pré/pós-processamento do YOLO.
+
+    Args:
+        model_path: Caminho do ``.onnx`` exportado pelo Ultralytics.
+        providers:  Execution providers em ordem de preferência.
+
+    Raises:
+        RuntimeError: Sem OpenCV (letterbox/NMS dependem dele).
+        Exception: Erros do ``onnxruntime`` (não instalado, modelo inválido).
+    """
+
+    def __init__(self, model_path: str, providers: tuple[str, ...] = _PROVIDERS) -> None:
+        if cv2 is None:
+            raise RuntimeError("OpenCV necessário para o backend ONNX")
+        import onnxruntime  # type: ignore[import-untyped]
+
+        available = set(onnxruntime.get_available_providers())
+        chosen = [p for p in providers if p in available] or ["CPUExecutionProvider"]
+        self._session: Any = onnxruntime.InferenceSession(model_path, providers=chosen)
+
+        model_input = self._session.get_inputs()[0]
+        self._input_name: str = model_input.name
+        self._input_dtype: Any = np.float16 if "float16" in str(model_input.type) else np.float32
+        # [1, 3, H, W]; dimensões dinâmicas vêm como str/None
+        height, width = model_input.shape[2], model_input.shape[3]
+        self.imgsz: tuple[int, int] = (
+            height if isinstance(height, int) else _DEFAULT_IMGSZ,
+            width if isinstance(width, int) else _DEFAULT_IMGSZ,
+        )
+        self.names: dict[int, str] = self._read_names(self._session)
+
+    @staticmethod
+    def _read_names(session: Any) -> dict[int, str]:
+        """Nomes das classes gravados pelo Ultralytics nos metadados do ONNX."""
+        try:
+            raw = session.get_modelmeta().custom_metadata_map.get("names", "")
+            names = ast.literal_eval(raw) if raw else {}
+            return {int(k): str(v) for k, v in names.items()}
+        except Exception:
+            return {}
+
+    def predict(self, source: Any, conf: float = 0.25, **_ignored: Any) -> list[OnnxResult]:
+        """Inferência sobre um frame BGR ou lista de frames (um run por frame)."""
+        frames = source if isinstance(source, list) else [source]
+        return [self._predict_one(frame, conf) for frame in frames]
+
+    def _predict_one(self, frame: Any, conf: float) -> OnnxResult:
+        blob, scale, pad_x, pad_y = self._letterbox(frame)
+        output = self._session.run(None, {self._input_name: blob})[0]
+        return OnnxResult(
+            names=self.names,
+            boxes=self._decode(output, conf, scale, pad_x, pad_y, frame.shape[:2]),
+        )
+
+    def _letterbox(self, frame: Any) -> tuple[np.ndarray, float, int, int]:
+        """Redimensiona mantendo o aspecto, centraliza no ``imgsz`` e gera o NCHW RGB."""
+        height, width = frame.shape[:2]
+        target_h, target_w = self.imgsz
+        scale = min(target_h / height, target_w / width)
+        new_h, new_w = round(height * scale), round(width * scale)
+        pad_y, pad_x = (target_h - new_h) // 2, (target_w - new_w) // 2
+
+        canvas = np.full((target_h, target_w, 3), _LETTERBOX_FILL, dtype=np.uint8)
+        canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = cv2.resize(
+            frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR,
+        )
+        blob = cv2.dnn.blobFromImage(canvas, 1.0 / 255.0, swapRB=True)
+        return blob.astype(self._input_dtype, copy=False), scale, pad_x, pad_y
+
+    @staticmethod
+    def _decode(
+        output: Any,
+        conf: float,
+        scale: float,
+        pad_x: int,
+        pad_y: int,
+        frame_shape: tuple[int, int],
+    ) -> OnnxBoxes:
+        """``(1, 4 + nc, N)`` → caixas acima de *conf*, NMS por classe, coords do frame."""
+        preds = np.asarray(output, dtype=np.float32)[0].T  # (N, 4 + nc)
+        scores = preds[:, 4:]
+        cls = scores.argmax(axis=1)
+        best = scores[np.arange(len(cls)), cls]
+        keep = best >= conf
+        preds, cls, best = preds[keep], cls[keep], best[keep]
+
+        xyxy = np.empty((len(preds), 4), dtype=np.float32)
+        xyxy[:, 0] = preds[:, 0] - preds[:, 2] / 2.0
+        xyxy[:, 1] = preds[:, 1] - preds[:, 3] / 2.0
+        xyxy[:, 2] = preds[:, 0] + preds[:, 2] / 2.0
+        xyxy[:, 3] = preds[:, 1] + preds[:, 3] / 2.0
+
+        if len(xyxy):
+            offset = (cls * _CLASS_OFFSET)[:, None]
+            shifted = xyxy[:, :2] + offset
+            rects = np.concatenate((shifted, xyxy[:, 2:] - xyxy[:, :2]), axis=1)
+            picked = np.asarray(
+                cv2.dnn.NMSBoxes(rects.tolist(), best.tolist(), conf, _NMS_IOU), dtype=np.int64,
+            ).reshape(-1)
+            picked = picked[np.argsort(-best[picked], kind="stable")]
+            xyxy, cls, best = xyxy[picked], cls[picked], best[picked]
+
+        # Desfaz o letterbox e limita ao frame original
+        height, width = frame_shape
+        xyxy[:, [0, 2]] = ((xyxy[:, [0, 2]] - pad_x) / scale).clip(0, width)
+        xyxy[:, [1, 3]] = ((xyxy[:, [1, 3]] - pad_y) / scale).clip(0, height)
+        return OnnxBoxes(cls=cls.astype(np.float32), xyxy=xyxy, conf=best)
@@ -14,11 +14,11 @@ Backend selection:
 
 from __future__ import annotations
 
-import json
 import time
 from dataclasses import dataclass
 from typing import Any
 
+from utils import json_codec
 from utils.card_utils import card_to_pt, normalize_cards
 from utils.config import ServerConfig
 from utils.logger import TitanLogger
@@ -104,7 +104,7 @@ class HiveBrain:
             "updated_at": session.updated_at,
             "cards": session.payload.get("cards", []),
         }
-        self._redis_client.setex(key, self.ttl_seconds, json.dumps(payload))
+        self._redis_client.setex(key, self.ttl_seconds, json_codec.dumps(payload))
 
     def _partners_from_redis(self, table_id: str, agent_id: str) -> tuple[list[str], list[str]]:
         if self._redis_client is None:
@@ -119,7 +119,7 @@ class HiveBrain:
             if payload_raw is None:
                 continue
             try:
-                payload = json.loads(payload_raw)
+                payload = json_codec.loads(payload_raw)
             except Exception:
                 continue
 
@@ -255,7 +255,7 @@ class HiveBrain:
         try:
             while True:
                 try:
-                    request = socket.recv_json()
+                    request = json_codec.loads(socket.recv())
                     reconnect_count = 0  # reset on success
                 except zmq.error.Again:
                     continue
@@ -279,12 +279,12 @@ class HiveBrain:
                     continue
                 except Exception as error:
                     _log.error(f"invalid_request: {error}")
-                    socket.send_json({"ok": False, "error": f"invalid_request: {error}"})
+                    socket.send(json_codec.dumps_bytes({"ok": False, "error": f"invalid_request: {error}"}))
                     continue
 
                 message_type = str(request.get("type", "checkin")).strip().lower()
                 if message_type == "health":
-                    socket.send_json({"ok": True, "status": "ok"})
+                    socket.send(json_codec.dumps_bytes({"ok": True, "status": "ok"}))
                     continue
 
                 if message_type == "checkin":
@@ -309,16 +309,16 @@ class HiveBrain:
                         _log.info(f"Agente {agent_id}: Action: {last_action}")
                     if response.get("heads_up_obfuscation"):
                         _log.warn(f"Agente {agent_id}: obfuscacao heads-up ativa -- forcando agressividade")
-                    socket.send_json(response)
+                    socket.send(json_codec.dumps_bytes(response))
                     continue
 
                 if message_type == "decision":
                     response = self._handle_decision(request)
-                    socket.send_json(response)
+                    socket.send(json_codec.dumps_bytes(response))
                     continue
 
                 _log.warn(f"unsupported message type: {message_type}")
-                socket.send_json({"ok": False, "error": f"unsupported_type: {message_type}"})
+                socket.send(json_codec.dumps_bytes({"ok": False, "error": f"unsupported_type: {message_type}"}))
         finally:
             socket.close(0)
 
@@ -40,6 +40,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from utils.env import env_truthy
+
 
 # ── Opponent profile dataclass ──────────────────────────────────────────
 
@@ -165,8 +167,7 @@ class OpponentDB:
     def __init__(self, db_path: str | None = None) -> None:
         self._lock = threading.Lock()
 
-        disabled = os.getenv("TITAN_OPPONENT_DB_OFF", "0").strip().lower()
-        self._disabled = disabled in {"1", "true", "yes", "on"}
+        self._disabled = env_truthy("TITAN_OPPONENT_DB_OFF")
 
         if db_path is None:
             db_path = os.getenv(
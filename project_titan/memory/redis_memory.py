@@ -6,6 +6,10 @@ works identically regardless of the backend.
 
 The active backend (``"redis"`` or ``"memory"``) is exposed via
 :attr:`RedisMemory.backend` for logging / diagnostics.
+
+:meth:`RedisMemory.pipeline` batches several writes into a single Redis
+round-trip (applied directly on the in-memory backend), and
+:meth:`RedisMemory.get_many` does the same for reads.
 """
 
 from __future__ import annotations
@@ -14,9 +18,12 @@ import json
 import importlib
 import logging
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
+from utils import json_codec
+
 _log = logging.getLogger("titan.memory.redis")
 
 
@@ -58,7 +65,7 @@ class RedisMemory:
         effective_ttl = ttl if ttl is not None else self.ttl_seconds
 
         if self._redis_client is not None:
-            payload = json.dumps(value)
+            payload = json_codec.dumps(value)
             if effective_ttl > 0:
                 self._redis_client.setex(key, effective_ttl, payload)
             else:
@@ -71,13 +78,17 @@ class RedisMemory:
         else:
             self._expires_at.pop(key, None)  # no expiry
 
+    def pipeline(self) -> "MemoryPipeline":
+        """Return a write batch flushed by ``execute()`` or on ``with`` exit."""
+        return MemoryPipeline(self)
+
     def get(self, key: str, default: Any = None) -> Any:
         if self._redis_client is not None:
             payload = self._redis_client.get(key)
             if payload is None:
                 return default
             try:
-                return json.loads(payload)
+                return json_codec.loads(payload)
             except json.JSONDecodeError:
                 return default
 
@@ -89,6 +100,28 @@ class RedisMemory:
 
         return self._cache.get(key, default)
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Fetch several keys at once (one ``MGET`` on Redis).
+
+        Missing, expired or undecodable keys are left out of the result,
+        so callers can use ``result.get(key, default)`` like :meth:`get`.
+        """
+        keys = list(keys)
+        if self._redis_client is not None:
+            found: dict[str, Any] = {}
+            for key, payload in zip(keys, self._redis_client.mget(keys)):
+                if payload is None:
+                    continue
+                try:
+                    found[key] = json_codec.loads(payload)
+                except json.JSONDecodeError:
+                    continue
+            return found
+
+        missing = object()
+        values = ((key, self.get(key, missing)) for key in keys)
+        return {key: value for key, value in values if value is not missing}
+
     def delete(self, key: str) -> bool:
         """Remove *key*. Returns ``True`` if the key existed."""
         if self._redis_client is not None:
@@ -126,3 +159,55 @@ class RedisMemory:
             if key.startswith(prefix):
                 result.append(key)
         return result
+
+
+class MemoryPipeline:
+    """Buffered ``set`` calls for :class:`RedisMemory`.
+
+    Usage::
+
+        with memory.pipeline() as pipe:
+            pipe.set("dead_cards", ["Ah"])
+            pipe.set("heads_up_obfuscation", False)
+
+    On Redis the writes go out in one non-transactional pipeline; on the
+    in-memory backend they are applied with :meth:`RedisMemory.set`.
+    """
+
+    __slots__ = ("_memory", "_pending")
+
+    def __init__(self, memory: RedisMemory) -> None:
+        self._memory = memory
+        self._pending: list[tuple[str, Any, int | None]] = []
+
+    def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self._pending.append((key, value, ttl))
+
+    def execute(self) -> None:
+        """Flush the buffered writes (no-op when empty)."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        memory = self._memory
+        client = memory._redis_client
+        if client is None:
+            for key, value, ttl in pending:
+                memory.set(key, value, ttl=ttl)
+            return
+
+        pipe = client.pipeline(transaction=False)
+        for key, value, ttl in pending:
+            effective_ttl = ttl if ttl is not None else memory.ttl_seconds
+            payload = json_codec.dumps(value)
+            if effective_ttl > 0:
+                pipe.setex(key, effective_ttl, payload)
+            else:
+                pipe.set(key, payload)
+        pipe.execute()
+
+    def __enter__(self) -> "MemoryPipeline":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.execute()
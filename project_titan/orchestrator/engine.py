@@ -31,6 +31,7 @@ from tools.rng_tool import RngTool
 from agent.zombie_agent import ZombieAgent
 from agent.automation_toggle import AutomationToggle
 from utils.config import ServerConfig, VisionRuntimeConfig
+from utils.env import TRUTHY
 from utils.logger import TitanLogger
 
 _log = TitanLogger("Orchestrator")
@@ -160,7 +161,7 @@ class Orchestrator:
         if isinstance(dynamic_simulations, bool):
             parsed_dynamic = dynamic_simulations
         elif isinstance(dynamic_simulations, str):
-            parsed_dynamic = dynamic_simulations.strip().lower() in {"1", "true", "yes", "on"}
+            parsed_dynamic = dynamic_simulations.strip().lower() in TRUTHY
 
         return parsed_simulations, parsed_dynamic
 
@@ -0,0 +1,53 @@
+"""Tests for agent.agent_config — startup env snapshot."""
+
+from __future__ import annotations
+
+import pytest
+
+from agent.agent_config import AgentEnv, agent_env, load_agent_env, refresh_agent_env
+from utils.env import env_truthy
+
+
+def test_load_agent_env_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("TITAN_OPPONENTS", "TITAN_ACTION_SMOOTHING_ALPHA", "TITAN_AGENT_MAX_CYCLES"):
+        monkeypatch.delenv(name, raising=False)
+
+    env = load_agent_env()
+
+    assert env.opponents_plus_one is None
+    assert env.smoothing_alpha == AgentEnv().smoothing_alpha
+    assert env.max_cycles is None
+
+
+def test_load_agent_env_parses_and_clamps(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TITAN_OPPONENTS", "20")
+    monkeypatch.setenv("TITAN_ACTION_SMOOTHING_ALPHA", "9")
+    monkeypatch.setenv("TITAN_OCR_CONFIRM_FRAMES", "abc")
+    monkeypatch.setenv("TITAN_AGENT_MAX_CYCLES", "7")
+
+    env = load_agent_env()
+
+    assert env.opponents_plus_one == 10
+    assert env.smoothing_alpha == 1.0
+    assert env.ocr_confirm_frames == 2
+    assert env.max_cycles == 7
+
+
+def test_agent_env_is_shared_until_refreshed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TITAN_AGENT_MAX_CYCLES", "3")
+    first = refresh_agent_env()
+    monkeypatch.setenv("TITAN_AGENT_MAX_CYCLES", "9")
+
+    assert agent_env() is first
+    assert agent_env().max_cycles == 3
+    assert refresh_agent_env().max_cycles == 9
+
+
+def test_env_truthy_matches_legacy_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TITAN_TEST_FLAG", raising=False)
+    assert env_truthy("TITAN_TEST_FLAG") is False
+    assert env_truthy("TITAN_TEST_FLAG", default=True) is True
+
+    for raw, expected in ((" Yes ", True), ("ON", True), ("0", False), ("", False), ("maybe", False)):
+        monkeypatch.setenv("TITAN_TEST_FLAG", raw)
+        assert env_truthy("TITAN_TEST_FLAG", default=True) is expected
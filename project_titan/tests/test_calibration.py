@@ -0,0 +1,92 @@
+"""Tests for agent.calibration — point validation, smoothing and file cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from agent.calibration import (
+    ActionPointsSoA,
+    calibration_journal_path,
+    compact_calibration_file,
+    normalized_action_points,
+    persist_calibration_to_file,
+    restore_calibration_from_file,
+    smooth_action_points,
+)
+
+
+def test_journal_path_pairs_with_snapshot() -> None:
+    assert calibration_journal_path("reports/cache.json") == "reports/cache.jsonl"
+    assert calibration_journal_path("reports/cache") == "reports/cache.jsonl"
+
+
+def test_persist_appends_to_journal_without_rewriting_snapshot(tmp_path: Path) -> None:
+    cache_file = tmp_path / "cache.json"
+    persist_calibration_to_file(str(cache_file), "t1::default", {"fold": (10, 20)}, max_scopes=5)
+    persist_calibration_to_file(str(cache_file), "t1::default", {"fold": (11, 21)}, max_scopes=5)
+
+    assert not cache_file.exists()
+    lines = (tmp_path / "cache.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[-1])["points"] == {"fold": [11, 21]}
+
+
+def test_restore_replays_latest_delta_and_compacts(tmp_path: Path) -> None:
+    cache_file = tmp_path / "cache.json"
+    persist_calibration_to_file(str(cache_file), "t1::default", {"fold": (10, 20)}, max_scopes=5)
+    persist_calibration_to_file(str(cache_file), "t2::default", {"call": (30, 40)}, max_scopes=5)
+    persist_calibration_to_file(str(cache_file), "t1::default", {"fold": (12, 22)}, max_scopes=5)
+
+    points = restore_calibration_from_file(str(cache_file), "t1::default", max_scopes=5)
+
+    assert points == {"fold": (12, 22)}
+    assert not (tmp_path / "cache.jsonl").exists()
+    payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert set(payload["scopes"]) == {"t1::default", "t2::default"}
+
+
+def test_journal_compacts_past_threshold(tmp_path: Path) -> None:
+    cache_file = tmp_path / "cache.json"
+    for i in range(11):
+        persist_calibration_to_file(str(cache_file), "t1::default", {"fold": (i, i)}, max_scopes=1)
+
+    assert cache_file.exists()
+    assert not (tmp_path / "cache.jsonl").exists()
+    scopes = compact_calibration_file(str(cache_file))
+    assert scopes["t1::default"]["points"] == {"fold": [10, 10]}
+
+
+def test_smooth_action_points_matches_scalar_ema() -> None:
+    current = {"fold": (100, 200), "call": (302, 401), "raise": (50, 60)}
+    previous = {"fold": (90, 200), "call": (300, 400)}
+
+    smoothed = smooth_action_points(current, previous, alpha=0.35, deadzone=3)
+
+    # fold moved 10px → blended; call inside deadzone → kept; raise is new.
+    assert smoothed == {"fold": (94, 200), "call": (300, 400), "raise": (50, 60)}
+    assert all(type(v) is int for xy in smoothed.values() for v in xy)
+
+
+def test_action_points_soa_round_trip() -> None:
+    points = {"fold": (1, 2), "call": (3, 4)}
+    soa = ActionPointsSoA.from_dict(points)
+    assert soa.xy.shape == (2, 2)
+    assert soa.to_dict() == points
+
+
+def test_normalized_action_points_canonical_and_raw_inputs() -> None:
+    canonical = {"fold": (1, 2), "call": (3, 4)}
+    result = normalized_action_points(canonical)
+    assert result == canonical and result is not canonical
+
+    raw = {" Fold ": [1, 2], "unknown": (5, 6), "call": (1.5, 2)}
+    assert normalized_action_points(raw) == {"fold": (1, 2)}
+
+
+def test_persist_creates_missing_folder_on_first_append(tmp_path: Path) -> None:
+    cache_file = tmp_path / "nested" / "cache.json"
+    persist_calibration_to_file(str(cache_file), "t1::default", {"fold": (1, 2)}, max_scopes=5)
+
+    assert (tmp_path / "nested" / "cache.jsonl").exists()
+    assert restore_calibration_from_file(str(cache_file), "t1::default") == {"fold": (1, 2)}
@@ -0,0 +1,33 @@
+"""Tests for utils.json_codec — orjson / stdlib JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from utils import json_codec
+
+
+def test_round_trip_keeps_unicode_and_stringifies_keys() -> None:
+    payload = {"carta": "Ás de Copas", 7: [1, 2]}
+
+    raw = json_codec.dumps_bytes(payload)
+
+    assert "Ás".encode("utf-8") in raw
+    assert json_codec.loads(raw) == {"carta": "Ás de Copas", "7": [1, 2]}
+    assert json_codec.loads(json_codec.dumps(payload)) == json.loads(raw)
+
+
+def test_indent_output_is_stdlib_compatible() -> None:
+    payload = {"scopes": {"t1::default": {"points": {"fold": [1, 2]}}}}
+
+    text = json_codec.dumps(payload, indent=True)
+
+    assert text.startswith("{\n  ")
+    assert json.loads(text) == payload
+
+
+def test_decode_error_is_stdlib_type() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{not json")
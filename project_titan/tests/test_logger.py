@@ -0,0 +1,30 @@
+"""Tests for utils.logger — level gating and lazy formatting."""
+
+from __future__ import annotations
+
+import pytest
+
+from utils.logger import TitanLogger
+
+
+def test_level_filter_skips_formatting(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setenv("TITAN_LOG_FILE", "0")
+    monkeypatch.setenv("TITAN_LOG_LEVEL", "warn")
+    log = TitanLogger("Agent")
+
+    assert not log.is_info_enabled()
+    log.info("pot=%.2f", "not-a-float")  # would raise if formatted
+    log.warn("stack=%.1f", 12.34)
+
+    out = capsys.readouterr().out
+    assert "pot=" not in out
+    assert "stack=12.3" in out
+
+
+def test_default_level_emits_everything(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setenv("TITAN_LOG_FILE", "0")
+    monkeypatch.delenv("TITAN_LOG_LEVEL", raising=False)
+    log = TitanLogger("Agent")
+
+    log.status("plain 100%")
+    assert "plain 100%" in capsys.readouterr().out
@@ -0,0 +1,92 @@
+"""Tests for agent.poker_agent — capture thread pacing and exit flush."""
+
+from __future__ import annotations
+
+import threading
+import time
+import types
+from collections.abc import Callable
+
+from agent.poker_agent import PokerAgent
+
+
+class _AdbOnlyVision:
+    """mss always fails (occluded window); ADB always returns a frame."""
+
+    def __init__(self) -> None:
+        self.adb_calls = 0
+        self.frames: list[object] = []
+
+    def capture_frame(self) -> None:
+        return None
+
+    def capture_frame_adb(self) -> object:
+        self.adb_calls += 1
+        frame = object()
+        self.frames.append(frame)
+        return frame
+
+
+def _capture_agent(vision: object, interval: float) -> PokerAgent:
+    agent = PokerAgent.__new__(PokerAgent)
+    agent.config = types.SimpleNamespace(interval_seconds=interval, agent_id="t")  # type: ignore[assignment]
+    agent.ocr_vision = vision
+    agent._capture_thread = None
+    agent._capture_stop = threading.Event()
+    agent._frame_ready = threading.Event()
+    agent._frame_taken = threading.Event()
+    agent._latest_frame = None
+    return agent
+
+
+def test_adb_capture_backs_off_without_a_consumer() -> None:
+    vision = _AdbOnlyVision()
+    agent = _capture_agent(vision, interval=0.2)
+
+    agent._start_capture_thread()
+    time.sleep(0.3)
+    agent._stop_capture_thread()
+
+    assert vision.adb_calls <= 2
+
+
+def test_consumer_receives_the_captured_frame() -> None:
+    vision = _AdbOnlyVision()
+    agent = _capture_agent(vision, interval=0.5)
+
+    agent._start_capture_thread()
+    try:
+        # ADB back-off keeps the producer idle long enough to inspect the handoff
+        frame = agent._next_capture_frame(timeout=1.0)
+        assert frame is vision.frames[0]
+        assert agent._frame_taken.is_set()
+        assert agent._latest_frame is None
+    finally:
+        agent._stop_capture_thread()
+
+
+def test_exit_flush_writes_pending_calibration_without_pinning_agent(monkeypatch) -> None:
+    import gc
+
+    import agent.poker_agent as poker_agent
+
+    hooks: list[Callable[[], None]] = []
+    monkeypatch.setattr(
+        poker_agent, "atexit", types.SimpleNamespace(register=hooks.append, unregister=hooks.remove),
+    )
+    writes: list[tuple[dict, bool]] = []
+    agent = PokerAgent.__new__(PokerAgent)
+    agent._last_effective_points = {"fold": (620, 705)}
+    agent._persist_action_calibration_file_cache = (  # type: ignore[method-assign]
+        lambda points, force=False: writes.append((points, force))
+    )
+
+    agent._register_exit_flush()
+    assert len(hooks) == 1
+    hooks[0]()
+    assert writes == [({"fold": (620, 705)}, True)]
+
+    del agent
+    gc.collect()
+    hooks[0]()  # agente coletado: o hook não o mantinha vivo
+    assert len(writes) == 1
@@ -152,6 +152,39 @@ def test_hive_data_dead_cards_are_persisted() -> None:
     assert "Ac" in saved["dead_cards"] or "Kd" in saved["dead_cards"]
 
 
+class BatchingMemory(DummyMemory):
+    """DummyMemory with ``get_many`` that records per-key ``get`` calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_keys: list[str] = []
+        self.get_many_calls = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.get_keys.append(key)
+        return super().get(key, default)
+
+    def get_many(self, keys: Any) -> dict[str, Any]:
+        self.get_many_calls += 1
+        return {key: self._data[key] for key in keys if key in self._data}
+
+
+def test_execute_prefetches_memory_reads_in_one_call() -> None:
+    workflow = _build_workflow(win_rate=0.40)
+    memory = BatchingMemory()
+    memory.set("dead_cards", ["3s"])
+    workflow.memory = cast(Any, memory)
+
+    workflow.execute(
+        snapshot=Snapshot(),
+        hive_data={"mode": "squad", "dead_cards": ["Ac"], "partners": ["A2"]},
+    )
+
+    assert memory.get_many_calls == 1
+    assert memory.get_keys == []
+    assert {"3s", "Ac"} <= set(memory.get("dead_cards"))
+
+
 def test_execute_handles_hive_none() -> None:
     workflow = _build_workflow(win_rate=0.35)
     decision = workflow.execute(snapshot=Snapshot(), hive_data=None)
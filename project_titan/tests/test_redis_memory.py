@@ -1,6 +1,7 @@
 """Tests for memory.redis_memory — dual-backend key-value store.
 
-Runs against the in-memory fallback backend (no Redis required).
+Runs against the in-memory fallback backend (no Redis required); Redis
+commands are checked with a fake client that records them.
 """
 
 from __future__ import annotations
@@ -22,6 +23,29 @@ def _make_memory() -> RedisMemory:
     return mem
 
 
+class _FakeRedis:
+    """Records write commands; ``pipeline()`` returns itself."""
+
+    def __init__(self) -> None:
+        self.commands: list[tuple[str, str]] = []
+
+    def setex(self, key: str, ttl: int, payload: str) -> None:
+        self.commands.append(("setex", key))
+
+    def set(self, key: str, payload: str) -> None:
+        self.commands.append(("set", key))
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return self
+
+    def execute(self) -> None:
+        self.commands.append(("execute", ""))
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        self.commands.append(("mget", ",".join(keys)))
+        return ['["Ah"]' if key == "dead_cards" else None for key in keys]
+
+
 class TestRedisMemoryInMemory:
     def test_set_and_get(self) -> None:
         mem = _make_memory()
@@ -81,3 +105,58 @@ class TestRedisMemoryInMemory:
         mem._expires_at["ns:dead"] = time.time() - 1
         result = mem.keys("ns:*")
         assert result == ["ns:alive"]
+
+
+class TestMemoryPipeline:
+    def test_pipeline_defers_writes_until_execute(self) -> None:
+        mem = _make_memory()
+        pipe = mem.pipeline()
+        pipe.set("a", 1)
+        pipe.set("b", [2], ttl=0)
+        assert mem.get("a") is None
+
+        pipe.execute()
+        assert mem.get("a") == 1
+        assert mem.get("b") == [2]
+        assert "b" not in mem._expires_at
+
+    def test_pipeline_context_manager_flushes_on_exit(self) -> None:
+        mem = _make_memory()
+        with mem.pipeline() as pipe:
+            pipe.set("dead_cards", ["Ah"])
+        assert mem.get("dead_cards") == ["Ah"]
+
+
+class TestRedisWrites:
+    def test_repeated_value_is_always_written(self) -> None:
+        # Consume-and-clear keys (showdown_events) are shared with other
+        # writers: a repeated "[]" must still reach Redis.
+        mem = _make_memory()
+        fake = _FakeRedis()
+        mem._redis_client = fake
+
+        mem.set("showdown_events", [], ttl=0)
+        mem.set("showdown_events", [], ttl=0)
+        with mem.pipeline() as pipe:
+            pipe.set("showdown_events", [])
+
+        assert fake.commands == [
+            ("set", "showdown_events"), ("set", "showdown_events"),
+            ("setex", "showdown_events"), ("execute", ""),
+        ]
+
+
+class TestGetMany:
+    def test_memory_backend_omits_missing_keys(self) -> None:
+        mem = _make_memory()
+        mem.set("a", 1)
+        mem.set("b", None)
+        assert mem.get_many(["a", "b", "c"]) == {"a": 1, "b": None}
+
+    def test_redis_backend_uses_single_mget(self) -> None:
+        mem = _make_memory()
+        fake = _FakeRedis()
+        mem._redis_client = fake
+
+        assert mem.get_many(["dead_cards", "current_opponent"]) == {"dead_cards": ["Ah"]}
+        assert fake.commands == [("mget", "dead_cards,current_opponent")]
@@ -0,0 +1,45 @@
+"""Tests for agent.sanity_guard — OCR scalar filter and tail stability."""
+
+from __future__ import annotations
+
+from agent.sanity_guard import OCR_KEY_IDS, SanityGuard, sanitize_ocr_scalar
+
+POT = OCR_KEY_IDS["pot"]
+STACK = OCR_KEY_IDS["hero_stack"]
+
+
+def test_sanitize_rejects_out_of_bounds_and_tiny_pot() -> None:
+    assert sanitize_ocr_scalar(POT, 0.5, 40.0, 0.0, 1000.0, 0.0, 0.0, 0, 2) == (40.0, 0.0, 0)
+    assert sanitize_ocr_scalar(STACK, 3.0, 120.0, 0.0, 1000.0, 0.0, 0.0, 0, 2)[0] == 120.0
+    assert sanitize_ocr_scalar(POT, 5000.0, 40.0, 0.0, 1000.0, 0.0, 0.0, 0, 2)[0] == 40.0
+
+
+def test_sanitize_confirms_large_jump_after_n_frames() -> None:
+    value, pending, count = sanitize_ocr_scalar(POT, 500.0, 40.0, 0.0, 1000.0, 100.0, 0.0, 0, 2)
+    assert (value, pending, count) == (40.0, 500.0, 1)
+
+    value, pending, count = sanitize_ocr_scalar(POT, 502.0, 40.0, 0.0, 1000.0, 100.0, pending, count, 2)
+    assert (value, count) == (500.0, 0)
+
+
+def test_sanitize_accepts_small_change() -> None:
+    assert sanitize_ocr_scalar(POT, 60.0, 40.0, 0.0, 1000.0, 100.0, 500.0, 1, 2) == (60.0, 0.0, 0)
+
+
+def test_validate_needs_stable_tail_and_resets_on_change() -> None:
+    guard = SanityGuard(history_size=5, stable_frames=3)
+
+    assert [guard.validate(20.0, 100.0, 2.0) for _ in range(3)] == [False, False, True]
+    assert guard.validate(24.0, 100.0, 2.0) is False
+    assert guard.last_reason == "unstable_tail"
+    assert [guard.validate(24.0, 100.0, 2.0) for _ in range(2)] == [False, True]
+
+
+def test_compiled_filter_matches_python_reference() -> None:
+    from agent.sanity_guard import _sanitize_ocr_scalar_py
+
+    for key_id in (POT, STACK):
+        for candidate in (0.0, 0.5, 3.0, 60.0, 500.0, 502.0, 5000.0):
+            for pending, count in ((0.0, 0), (500.0, 1)):
+                args = (key_id, candidate, 40.0, 0.0, 1000.0, 100.0, pending, count, 2)
+                assert sanitize_ocr_scalar(*args) == _sanitize_ocr_scalar_py(*args)
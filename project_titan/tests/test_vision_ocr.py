@@ -0,0 +1,224 @@
+"""Tests for agent.vision_ocr — batched tesseract candidates."""
+
+from __future__ import annotations
+
+import pytest
+
+from agent.vision_ocr import TitanOCR
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+
+class _FakeTesseract:
+    """Stands in for pytesseract: one call per tesseract process."""
+
+    def __init__(self, reading: str) -> None:
+        self.reading = reading
+        self.calls: list[object] = []
+
+    def image_to_string(self, image: object, config: str = "") -> str:
+        self.calls.append(image)
+        if isinstance(image, str):
+            with open(image, encoding="utf-8") as handle:
+                pages = handle.read().splitlines()
+            return "".join(f"{self.reading}\n\f" for _ in pages)
+        return self.reading
+
+
+def _ocr(fake: _FakeTesseract) -> TitanOCR:
+    ocr = TitanOCR()
+    ocr._pytesseract = fake
+    return ocr
+
+
+def test_read_numeric_region_uses_one_tesseract_call() -> None:
+    fake = _FakeTesseract("1250")
+    ocr = _ocr(fake)
+    crop = np.zeros((12, 40, 3), dtype=np.uint8)
+
+    assert ocr.read_numeric_region(crop, key="pot") == pytest.approx(1250.0)
+    assert len(fake.calls) == 1 and isinstance(fake.calls[0], str)
+
+
+def test_page_count_mismatch_falls_back_to_per_image() -> None:
+    fake = _FakeTesseract("42")
+    fake.image_to_string = lambda image, config="": (  # type: ignore[method-assign]
+        fake.calls.append(image) or ("42\n\f" if isinstance(image, str) else "42")
+    )
+    ocr = _ocr(fake)
+    crop = np.zeros((12, 40, 3), dtype=np.uint8)
+
+    assert ocr.read_numeric_region(crop, key="stack") == pytest.approx(42.0)
+    assert ocr._batch_enabled is False
+    assert all(not isinstance(call, str) for call in fake.calls[1:])
+
+
+def test_unchanged_crop_skips_ocr() -> None:
+    fake = _FakeTesseract("80")
+    ocr = _ocr(fake)
+    crop = np.zeros((12, 40, 3), dtype=np.uint8)
+
+    assert ocr.read_numeric_region(crop, key="pot") == pytest.approx(80.0)
+    assert ocr.read_numeric_region(crop.copy(), key="pot") == pytest.approx(80.0)
+    assert len(fake.calls) == 1
+
+    crop[3, 5] = 255
+    ocr.read_numeric_region(crop, key="pot")
+    assert len(fake.calls) == 2
+
+
+class _FakeDigitSession:
+    """ONNX session stub: every glyph is a '7' with the given confidence."""
+
+    def __init__(self, confidence: float) -> None:
+        self.confidence = confidence
+        self.runs = 0
+
+    def get_inputs(self) -> list[object]:
+        return [type("Input", (), {"name": "x"})()]
+
+    def run(self, outputs: object, feeds: dict[str, object]) -> list[object]:
+        self.runs += 1
+        count = feeds["x"].shape[0]
+        probs = np.full((count, 13), (1.0 - self.confidence) / 12, dtype=np.float32)
+        probs[:, 7] = self.confidence
+        return [np.log(probs)]
+
+
+def _digit_crop() -> object:
+    crop = np.zeros((12, 40, 3), dtype=np.uint8)
+    crop[2:10, 5:9] = 255
+    return crop
+
+
+def test_confident_digit_model_skips_tesseract() -> None:
+    fake = _FakeTesseract("1")
+    ocr = _ocr(fake)
+    ocr._digit_session = _FakeDigitSession(0.99)
+
+    assert ocr.read_numeric_region(_digit_crop(), key="pot") == pytest.approx(7.0)
+    assert ocr._digit_session.runs == 1
+    assert fake.calls == []
+
+
+def test_low_confidence_digits_fall_back_to_tesseract() -> None:
+    fake = _FakeTesseract("15")
+    ocr = _ocr(fake)
+    ocr._digit_session = _FakeDigitSession(0.5)
+
+    assert ocr.read_numeric_region(_digit_crop(), key="pot") == pytest.approx(15.0)
+    assert len(fake.calls) == 1
+
+
+def test_two_agreeing_readings_beat_temporal_coherence() -> None:
+    ocr = _ocr(_FakeTesseract("300"))
+    ocr._last_values["pot"] = 310.0
+    readings = iter([300.0, 305.0, 305.0, 309.0])
+    ocr._try_ocr = lambda image, texts=None, **_: next(readings)  # type: ignore[method-assign]
+
+    assert ocr.read_numeric_region(_digit_crop(), key="pot") == pytest.approx(305.0)
+
+
+class _FakeEasyReader:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def readtext_batched(self, images: list[object], **kwargs: object) -> list[list[str]]:
+        self.batches.append(len(images))
+        return [["64"] for _ in images]
+
+
+def test_easyocr_fallback_reads_all_empty_candidates_in_one_batch() -> None:
+    ocr = _ocr(_FakeTesseract(""))
+    ocr.use_easyocr = True
+    ocr._easy_reader = _FakeEasyReader()
+
+    assert ocr.read_numeric_region(_digit_crop(), key="call") == pytest.approx(64.0)
+    assert len(ocr._easy_reader.batches) == 1
+
+
+def test_grayscale_stage_only_runs_without_colour_consensus() -> None:
+    fake = _FakeTesseract("")
+    ocr = _ocr(fake)
+    crop = np.zeros((12, 40, 3), dtype=np.uint8)
+
+    assert ocr.read_numeric_region(crop, key="pot", fallback=3.0) == pytest.approx(3.0)
+    assert len(fake.calls) == 2  # colour masks, then grayscale strategies
+
+
+class _FakeTessApi:
+    """tesserocr.PyTessBaseAPI stub."""
+
+    def __init__(self, reading: str) -> None:
+        self.reading = reading
+        self.images = 0
+
+    def SetImageBytes(self, data: bytes, width: int, height: int, bpp: int, bpl: int) -> None:
+        assert len(data) == height * bpl
+        self.images += 1
+
+    def GetUTF8Text(self) -> str:
+        return self.reading + "\n"
+
+
+def test_tesserocr_reads_in_process_and_lazily() -> None:
+    fake = _FakeTesseract("999")
+    ocr = _ocr(fake)
+    ocr._tesserapi = _FakeTessApi("55")
+
+    assert ocr.read_numeric_region(_digit_crop(), key="pot") == pytest.approx(55.0)
+    assert fake.calls == []
+    assert ocr._tesserapi.images == 2  # consensus after the first two candidates
+
+
+def test_crop_digest_ignores_memory_layout() -> None:
+    frame = np.arange(60 * 80 * 3, dtype=np.uint32).astype(np.uint8).reshape(60, 80, 3)
+    view = frame[10:22, 5:45]
+
+    assert not view.flags.c_contiguous
+    assert TitanOCR._crop_digest(view) == TitanOCR._crop_digest(np.ascontiguousarray(view))
+
+
+def test_easyocr_batch_waits_for_tesseract_when_batching_is_off() -> None:
+    fake = _FakeTesseract("42")
+    ocr = _ocr(fake)
+    ocr._batch_enabled = False
+    ocr.use_easyocr = True
+    ocr._easy_reader = _FakeEasyReader()
+
+    assert ocr.read_numeric_region(_digit_crop(), key="call") == pytest.approx(42.0)
+    assert len(fake.calls) == 2
+    assert ocr._easy_reader.batches == []
+
+
+def test_thread_limit_only_applies_to_the_tesseract_call(monkeypatch) -> None:
+    import os
+
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    fake = _FakeTesseract("7")
+    seen: list[str | None] = []
+    fake.image_to_string = lambda image, config="": (  # type: ignore[method-assign]
+        seen.append(os.environ.get("OMP_THREAD_LIMIT")) or "7"
+    )
+    ocr = _ocr(fake)
+    ocr._batch_enabled = False
+
+    ocr.read_numeric_region(_digit_crop(), key="pot")
+    assert seen and set(seen) == {"1"}
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+
+def test_invert_kernel_matches_numpy_fallback() -> None:
+    from agent.vision_ocr import _invert_dark_channels_numpy, _invert_dark_channels_py
+
+    rng = np.random.default_rng(7)
+    image = rng.integers(0, 256, size=(12, 40, 3), dtype=np.uint8)
+    image[..., 0] = np.where(image[..., 0] > 200, 255, 0)  # canal escuro: inverte
+    image[..., 2] = 255  # canal claro: mantém
+    expected, actual = image.copy(), image.copy()
+
+    _invert_dark_channels_numpy(expected)
+    _invert_dark_channels_py(actual)
+    assert np.array_equal(actual, expected)
+    assert not np.array_equal(actual[..., 0], image[..., 0])
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from agent.vision_yolo import EmulatorWindow, VisionYolo
 
 
@@ -18,6 +20,22 @@ def test_calculate_game_area_removes_chrome() -> None:
     assert emu.canvas_height == 1565
 
 
+def test_region_dict_is_reused_until_roi_moves() -> None:
+    emu = EmulatorWindow(chrome_top=0, chrome_bottom=0, chrome_left=0, chrome_right=0)
+    emu._win_width, emu._win_height = 720, 1280
+    emu._calculate_game_area()
+    emu._last_find_ok = True
+
+    first = emu.region
+    emu._calculate_game_area()
+    assert emu.region is first
+
+    emu._win_left = 40
+    emu._calculate_game_area()
+    assert emu.region == {"left": 40, "top": 0, "width": 720, "height": 1280}
+    assert first["left"] == 0  # quem guardou o dict antigo não vê a mudança
+
+
 def test_to_screen_coords_applies_offsets() -> None:
     vision = VisionYolo()
     vision.offset_x = 320
@@ -26,3 +44,411 @@ def test_to_screen_coords_applies_offsets() -> None:
     x_abs, y_abs = vision.to_screen_coords(45, 60)
     assert x_abs == 365
     assert y_abs == 200
+
+
+def test_signature_stability_matches_full_frame_check() -> None:
+    import numpy as np
+
+    frame_a = np.zeros((1280, 720, 3), dtype=np.uint8)
+    frame_b = frame_a.copy()
+    frame_b[:640] = 255
+
+    sig_a = VisionYolo.stability_signature(frame_a)
+    assert sig_a is not None and sig_a.shape[1] <= 320
+
+    assert VisionYolo.check_signature_stability(sig_a, VisionYolo.stability_signature(frame_a.copy()))
+    assert not VisionYolo.check_signature_stability(sig_a, VisionYolo.stability_signature(frame_b))
+    assert VisionYolo.check_screen_stability(frame_a, frame_a.copy())
+    assert not VisionYolo.check_screen_stability(frame_a, frame_b)
+
+
+def test_tensorrt_engine_is_exported_once_and_reused(tmp_path, monkeypatch) -> None:
+    import sys
+    import types
+
+    weights = tmp_path / "cards.pt"
+    weights.write_bytes(b"pt")
+    loaded: list[tuple[str, object]] = []
+    exports: list[dict] = []
+
+    class _FakeYOLO:
+        def __init__(self, path: str, task: object = None) -> None:
+            loaded.append((path, task))
+
+        def export(self, **kwargs: object) -> str:
+            exports.append(kwargs)
+            engine = tmp_path / "cards.engine"
+            engine.write_bytes(b"trt")
+            return str(engine)
+
+    monkeypatch.setitem(sys.modules, "ultralytics", types.SimpleNamespace(YOLO=_FakeYOLO))
+    monkeypatch.setenv("TITAN_YOLO_TRT", "1")
+
+    for _ in range(2):
+        vision = VisionYolo(model_path=str(weights))
+        assert vision._load_model()
+
+    assert len(exports) == 1 and exports[0]["format"] == "engine" and exports[0]["half"] is True
+    assert loaded[-1] == (str(tmp_path / "cards.engine"), "detect")
+
+
+def test_precision_kwargs_follow_cuda_and_env(monkeypatch) -> None:
+    import sys
+    import types
+
+    calls: list[str] = []
+    fake_torch = types.SimpleNamespace(
+        cuda=types.SimpleNamespace(is_available=lambda: True),
+        set_float32_matmul_precision=calls.append,
+        backends=types.SimpleNamespace(cudnn=types.SimpleNamespace(allow_tf32=False)),
+    )
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+    vision = VisionYolo()
+    vision._configure_precision()
+    assert vision._predict_kwargs == {"half": True, "device": 0}
+    assert calls == ["high"] and fake_torch.backends.cudnn.allow_tf32 is True
+
+    monkeypatch.setenv("TITAN_YOLO_HALF", "0")
+    vision._configure_precision()
+    assert vision._predict_kwargs == {}
+
+
+def test_detect_batch_runs_one_predict_for_all_frames(monkeypatch) -> None:
+    import types
+
+    import numpy as np
+
+    def _result(cls_idx: float) -> object:
+        boxes = types.SimpleNamespace(
+            cls=np.array([cls_idx]), xyxy=np.array([[10.0, 20.0, 30.0, 60.0]]), conf=np.array([0.9]),
+        )
+        return types.SimpleNamespace(names={0: "Ah", 1: "fold"}, boxes=boxes)
+
+    calls: list[dict] = []
+
+    class _FakeModel:
+        def predict(self, **kwargs: object) -> list[object]:
+            calls.append(kwargs)
+            return [_result(float(i % 2)) for i in range(len(kwargs["source"]))]
+
+    frames = iter([np.zeros((64, 48, 3), dtype=np.uint8), None, np.zeros((64, 48, 3), dtype=np.uint8)])
+    vision = VisionYolo()
+    vision._model, vision._model_loaded = _FakeModel(), True
+    monkeypatch.setattr(vision, "capture_frame", lambda: next(frames))
+    monkeypatch.setattr(vision, "_save_debug_note", lambda *a, **k: None)
+
+    out = vision.detect_batch(3)
+
+    assert len(calls) == 1 and calls[0]["batch"] == 2
+    assert [f.detections[0].label if f.detections else None for f in out] == ["Ah", None, "fold"]
+    assert out[0].detections[0].cx == 20 and out[0].frame_width == 48
+
+
+def test_capture_frame_reuses_one_mss_instance(monkeypatch) -> None:
+    import types
+
+    import numpy as np
+
+    import agent.vision_yolo as vision_yolo
+
+    opened: list[object] = []
+
+    class _FakeSct:
+        def __init__(self) -> None:
+            opened.append(self)
+            self.closed = False
+
+        def grab(self, region: dict) -> object:
+            pixels = np.full((region["height"], region["width"], 4), 7, dtype=np.uint8)
+            return types.SimpleNamespace(raw=bytearray(pixels.tobytes()), height=region["height"], width=region["width"])
+
+        def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(vision_yolo, "_mss_module", types.SimpleNamespace(mss=_FakeSct))
+    emu = EmulatorWindow()
+    monkeypatch.setattr(emu, "find_cached", lambda: True)
+    monkeypatch.setattr(EmulatorWindow, "region", property(lambda self: {"left": 0, "top": 0, "width": 6, "height": 4}))
+    vision = VisionYolo(emulator=emu, target_fps=1000)
+
+    frames = [vision.capture_frame() for _ in range(3)]
+
+    assert len(opened) == 1
+    assert frames[0].shape == (4, 6, 3) and int(frames[0].max()) == 7
+    assert frames[0].flags.c_contiguous
+    assert not np.shares_memory(frames[0], frames[1])
+    vision.close()
+    assert opened[0].closed
+
+
+def test_find_cached_skips_enumeration_within_ttl(monkeypatch) -> None:
+    import types
+
+    import agent.vision_yolo as vision_yolo
+
+    enums: list[int] = []
+    rect = [100, 50, 1000, 1650]
+
+    def _enum_windows(callback, extra) -> None:
+        enums.append(1)
+        callback(42, extra)
+
+    fake_win32gui = types.SimpleNamespace(
+        IsWindow=lambda hwnd: True,
+        IsWindowVisible=lambda hwnd: True,
+        GetWindowText=lambda hwnd: "MuMu Player",
+        FindWindow=lambda cls, title: 0,
+        EnumWindows=_enum_windows,
+        EnumChildWindows=lambda hwnd, callback, extra: None,
+        GetWindowRect=lambda hwnd: tuple(rect),
+    )
+    monkeypatch.setattr(vision_yolo, "win32gui", fake_win32gui)
+    monkeypatch.setattr(vision_yolo, "_find_render_hwnd", None)
+    monkeypatch.setenv("TITAN_WINDOW_TTL", "60")
+    emu = EmulatorWindow(title_pattern="MuMu", chrome_top=0, chrome_bottom=0, chrome_left=0, chrome_right=0)
+
+    assert emu.find_cached() and emu.find_cached()
+    assert len(enums) == 1
+
+    rect[:] = [300, 50, 1200, 1650]  # janela arrastada: ROI acompanha sem nova busca
+    assert emu.find_cached() and emu.offset_x == 300 and len(enums) == 1
+
+    fake_win32gui.IsWindow = lambda hwnd: False
+    assert emu.find_cached()
+    assert len(enums) == 2
+
+    emu.invalidate_cache()  # grab falhou: próxima chamada refaz a busca
+    assert emu.find_cached()
+    assert len(enums) == 3
+
+
+def test_find_uses_exact_title_before_enumerating(monkeypatch) -> None:
+    import types
+
+    import agent.vision_yolo as vision_yolo
+
+    def _no_enum(callback, extra) -> None:
+        raise AssertionError("EnumWindows should not run")
+
+    monkeypatch.setattr(vision_yolo, "win32gui", types.SimpleNamespace(
+        FindWindow=lambda cls, title: 77 if title == "MuMu Player 12" else 0,
+        IsWindowVisible=lambda hwnd: True,
+        EnumWindows=_no_enum,
+        EnumChildWindows=lambda hwnd, callback, extra: None,
+        GetWindowRect=lambda hwnd: (0, 0, 720, 1280),
+    ))
+    monkeypatch.setattr(vision_yolo, "_find_render_hwnd", None)
+    emu = EmulatorWindow(title_pattern="MuMu Player 12", chrome_top=0, chrome_bottom=0, chrome_left=0, chrome_right=0)
+
+    assert emu.find() and emu.hwnd == 77
+
+
+def test_prefetch_thread_hands_over_the_latest_frame(monkeypatch) -> None:
+    import threading
+    import time
+
+    import numpy as np
+
+    monkeypatch.setenv("TITAN_VISION_PREFETCH", "1")
+    threads: set[str] = set()
+    counter = iter(range(1, 10_000))
+
+    def _capture() -> object:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.002)
+        return np.full((8, 8, 3), next(counter) % 256, dtype=np.uint8)
+
+    vision = VisionYolo()
+    monkeypatch.setattr(vision, "capture_frame", _capture)
+
+    first, _, _ = vision._next_capture()
+    time.sleep(0.05)  # a thread segue capturando; só o último frame fica na fila
+    second, _, _ = vision._next_capture()
+    vision.close()
+
+    assert int(second[0, 0, 0]) > int(first[0, 0, 0]) + 1
+    assert threads == {"titan-yolo-capture"}
+    assert vision._capture_thread is None
+
+
+def test_compile_falls_back_to_original_module(monkeypatch) -> None:
+    import sys
+    import types
+
+    def _broken_compile(module: object, **kwargs: object) -> object:
+        raise RuntimeError("no compiler")
+
+    monkeypatch.setitem(sys.modules, "torch", types.SimpleNamespace(compile=_broken_compile))
+    module = object()
+    vision = VisionYolo()
+    vision._model = types.SimpleNamespace(model=module, predict=lambda **kwargs: [])
+
+    vision._compile_model()
+
+    assert vision._model.model is module
+    assert "torch.compile" in vision._model_error
+
+
+def test_detection_frame_label_queries() -> None:
+    from agent.vision_yolo import DetectionFrame, DetectionItem
+
+    frame = DetectionFrame(detections=[
+        DetectionItem("hero_Ah", 0.8, 1, 1, 1, 1),
+        DetectionItem("Fold", 0.6, 2, 2, 1, 1),
+        DetectionItem("hero_Kd", 0.9, 3, 3, 1, 1),
+        DetectionItem("fold", 0.6, 4, 4, 1, 1),
+    ])
+
+    assert [d.cx for d in frame.labels_by_prefix("HERO_")] == [1, 3]
+    assert frame.best_by_label("FOLD").cx == 2  # empate: primeira detecção
+    assert frame.best_by_label("raise") is None
+
+
+def test_wait_until_reaches_deadline_without_oversleeping() -> None:
+    import time
+
+    from agent.vision_yolo import _wait_until
+
+    deadline = time.perf_counter() + 0.01
+    _wait_until(deadline)
+    assert time.perf_counter() >= deadline
+
+    start = time.perf_counter()
+    _wait_until(start - 1.0)  # prazo vencido: retorna na hora
+    assert time.perf_counter() - start < 0.005
+
+
+def test_skip_static_reuses_detections_until_frame_changes(monkeypatch) -> None:
+    import types
+
+    import numpy as np
+
+    monkeypatch.setenv("TITAN_VISION_SKIP_STATIC", "1")
+    predicted: list[int] = []
+
+    class _FakeModel:
+        def predict(self, **kwargs: object) -> list[object]:
+            source = kwargs["source"]
+            frames = source if isinstance(source, list) else [source]
+            predicted.append(len(frames))
+            boxes = types.SimpleNamespace(
+                cls=np.zeros(len(frames)), xyxy=np.tile([[0.0, 0.0, 4.0, 4.0]], (len(frames), 1)),
+                conf=np.ones(len(frames)),
+            )
+            return [types.SimpleNamespace(names={0: "Ah"}, boxes=boxes) for _ in frames]
+
+    still = np.zeros((64, 48, 3), dtype=np.uint8)
+    moved = still.copy()
+    moved[10:14, 10:14] = 255  # uma carta pequena aparecendo
+    frames = iter([still, still.copy(), still.copy(), moved])
+    vision = VisionYolo()
+    vision._model, vision._model_loaded = _FakeModel(), True
+    monkeypatch.setattr(vision, "capture_frame", lambda: next(frames))
+
+    first = vision.detect()
+    batch = vision.detect_batch(2)
+    changed = vision.detect()
+
+    assert predicted == [1, 1]  # o lote parado não foi inferido
+    assert [f.detections[0].label for f in (first, *batch, changed)] == ["Ah"] * 4
+    assert batch[0].inference_ms == 0.0 and batch[0] is not first
+
+
+def test_skip_static_detects_low_contrast_and_colour_only_changes(monkeypatch) -> None:
+    import numpy as np
+
+    monkeypatch.setenv("TITAN_VISION_SKIP_STATIC", "1")
+    vision = VisionYolo()
+    vision._static_result = object()  # type: ignore[assignment]
+    base = np.full((720, 1280, 3), 40, dtype=np.uint8)
+    stroke = base.copy()
+    stroke[300:320, 600] = 60  # traço de 1 px, baixo contraste
+    tinted = base.copy()
+    tinted[100:140, 100:200] = (40, 40, 41)  # só a cor muda
+
+    fresh, reused = vision._split_static([(0, base, 0, 0), (1, base.copy(), 0, 0)])
+    assert [c[0] for c in fresh] == [0] and set(reused) == {1}
+    for slot, frame in ((2, stroke), (3, tinted)):
+        fresh, reused = vision._split_static([(slot, frame, 0, 0)])
+        assert [c[0] for c in fresh] == [slot] and not reused
+
+
+def test_extract_detections_reads_packed_box_data() -> None:
+    import types
+
+    import numpy as np
+
+    class _Column:
+        """Column accessors must not be touched when ``data`` is present."""
+
+        def __getattr__(self, name: str) -> object:
+            raise AssertionError(f"unexpected column access: {name}")
+
+    data = np.array([[10.0, 20.0, 30.0, 60.0, 0.75, 1.0]], dtype=np.float32)
+    boxes = types.SimpleNamespace(data=data, cls=_Column(), xyxy=_Column(), conf=_Column())
+    result = types.SimpleNamespace(names={1: "fold"}, boxes=boxes)
+
+    (item,) = VisionYolo._extract_detections(result)
+
+    assert (item.label, item.cx, item.cy, item.w, item.h) == ("fold", 20, 40, 20, 40)
+    assert item.confidence == pytest.approx(0.75)
+
+
+def test_load_model_warms_up_with_canvas_sized_frame(tmp_path, monkeypatch) -> None:
+    import sys
+    import types
+
+    shapes: list[tuple[int, ...]] = []
+
+    class _FakeYOLO:
+        def __init__(self, path: str, task: object = None) -> None:
+            pass
+
+        def predict(self, **kwargs: object) -> list[object]:
+            shapes.append(kwargs["source"].shape)
+            return []
+
+    monkeypatch.setitem(sys.modules, "ultralytics", types.SimpleNamespace(YOLO=_FakeYOLO))
+    emu = EmulatorWindow(chrome_top=0, chrome_bottom=0, chrome_left=0, chrome_right=0)
+    emu._win_width, emu._win_height = 720, 1280
+    emu._calculate_game_area()
+    vision = VisionYolo(model_path=str(tmp_path / "cards.pt"), emulator=emu)
+
+    assert vision._load_model()
+    assert shapes == [(1280, 720, 3)]
+
+
+def test_int8_engine_is_preferred_when_present(tmp_path, monkeypatch) -> None:
+    import sys
+    import types
+
+    weights = tmp_path / "cards.pt"
+    weights.write_bytes(b"pt")
+    loaded: list[str] = []
+
+    class _FakeYOLO:
+        def __init__(self, path: str, task: object = None) -> None:
+            loaded.append(path)
+
+    monkeypatch.setitem(sys.modules, "ultralytics", types.SimpleNamespace(YOLO=_FakeYOLO))
+    monkeypatch.setenv("TITAN_YOLO_INT8", "1")
+
+    assert VisionYolo(model_path=str(weights))._load_model()
+    assert loaded[-1] == str(weights)  # sem engine calibrada: volta ao .pt
+
+    (tmp_path / "cards.int8.engine").write_bytes(b"int8")
+    assert VisionYolo(model_path=str(weights))._load_model()
+    assert loaded[-1] == str(tmp_path / "cards.int8.engine")
+
+
+def test_box_kernel_matches_numpy_fallback() -> None:
+    import numpy as np
+
+    from agent.vision_yolo import _xyxy_to_cxcywh_numpy, _xyxy_to_cxcywh_py
+
+    rng = np.random.default_rng(3)
+    xy = rng.uniform(0, 1280, size=(16, 2))
+    xyxy = np.concatenate((xy, xy + rng.uniform(0.5, 90, size=(16, 2))), axis=1)
+
+    assert np.array_equal(_xyxy_to_cxcywh_py(xyxy), _xyxy_to_cxcywh_numpy(xyxy))
@@ -0,0 +1,63 @@
+"""Tests for agent.yolo_onnx — letterbox, decoding and NMS of raw YOLO output."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from agent.yolo_onnx import OnnxYolo  # noqa: E402
+
+
+class _FakeSession:
+    """Returns a fixed ``(1, 4 + nc, N)`` output and records the input blob."""
+
+    def __init__(self, output: object) -> None:
+        self.output = output
+        self.blobs: list[object] = []
+
+    def run(self, outputs: object, feeds: dict[str, object]) -> list[object]:
+        self.blobs.extend(feeds.values())
+        return [self.output]
+
+
+def _model(output: object) -> OnnxYolo:
+    model = object.__new__(OnnxYolo)
+    model._session = _FakeSession(output)
+    model._input_name = "images"
+    model._input_dtype = np.float32
+    model.imgsz = (64, 64)
+    model.names = {0: "Ah", 1: "fold"}
+    return model
+
+
+def _column(cx: float, cy: float, w: float, h: float, scores: tuple[float, float]) -> list[float]:
+    return [cx, cy, w, h, *scores]
+
+
+def test_predict_decodes_nms_and_undoes_letterbox() -> None:
+    # Frame 32x64 → letterbox scale 1.0, pad_y 16 no canvas 64x64.
+    columns = [
+        _column(20, 26, 10, 10, (0.9, 0.1)),   # Ah
+        _column(21, 26, 10, 10, (0.8, 0.1)),   # Ah sobreposto → suprimido
+        _column(21, 26, 10, 10, (0.1, 0.7)),   # fold no mesmo lugar: outra classe, fica
+        _column(50, 40, 8, 8, (0.1, 0.2)),     # abaixo do conf
+    ]
+    output = np.asarray(columns, dtype=np.float32).T[None]
+    model = _model(output)
+
+    result = model.predict(source=np.zeros((32, 64, 3), dtype=np.uint8), conf=0.5)[0]
+
+    assert model._session.blobs[0].shape == (1, 3, 64, 64)
+    assert result.names[int(result.boxes.cls[0])] == "Ah"
+    assert result.boxes.cls.tolist() == [0.0, 1.0]
+    assert result.boxes.conf.tolist() == pytest.approx([0.9, 0.7])
+    assert result.boxes.xyxy[0].tolist() == pytest.approx([15.0, 5.0, 25.0, 15.0])
+
+
+def test_predict_accepts_frame_lists() -> None:
+    output = np.zeros((1, 6, 3), dtype=np.float32)
+    results = _model(output).predict(source=[np.zeros((10, 10, 3), np.uint8)] * 2, conf=0.5)
+
+    assert len(results) == 2 and all(len(r.boxes.xyxy) == 0 for r in results)
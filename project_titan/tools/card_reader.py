@@ -38,6 +38,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from utils.env import env_truthy
+
 # ---------------------------------------------------------------------------
 # Lazy imports — avoid hard dependency on cv2 / numpy / pytesseract
 # ---------------------------------------------------------------------------
@@ -173,16 +175,12 @@ class PPPokerCardReader:
             "TITAN_CARD_READER_DEBUG_DIR",
             os.path.join("reports", "debug_cards"),
         ).strip()
-        self._enabled = os.getenv(
-            "TITAN_CARD_READER_ENABLED", "1"
-        ).strip() in {"1", "true", "yes", "on"}
+        self._enabled = env_truthy("TITAN_CARD_READER_ENABLED", default=True)
 
         # Auto-template learning: save OCR-identified card crops as
         # MuMu-native templates for the TemplateCardReader.
         self._auto_template_dir = os.path.join("assets", "cards_mumu")
-        self._auto_template_enabled = os.getenv(
-            "TITAN_AUTO_TEMPLATE_LEARNING", "1"
-        ).strip() in {"1", "true", "yes", "on"}
+        self._auto_template_enabled = env_truthy("TITAN_AUTO_TEMPLATE_LEARNING", default=True)
 
         # Allow env-var overrides for region offsets
         self._hero_y_top = self._env_int(
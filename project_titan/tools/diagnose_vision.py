@@ -184,7 +184,9 @@ def main() -> None:
     else:
         print("✅ Action buttons available")
 
-    gm_active = os.getenv("TITAN_GHOST_MOUSE", "0") in ("1", "true", "yes", "on")
+    from utils.env import env_truthy
+
+    gm_active = env_truthy("TITAN_GHOST_MOUSE")
     if not gm_active:
         issues.append("⚠️  TITAN_GHOST_MOUSE not set — mouse won't actually move")
     else:
@@ -17,6 +17,7 @@ from typing import Any
 
 from core.rng_auditor import PlayerAuditStats, RngAuditor
 from workflows.protocol import SupportsMemory
+from utils.env import TRUTHY
 
 
 @dataclass(slots=True)
@@ -104,7 +105,7 @@ class RngTool:
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.strip().lower() in {"1", "true", "yes", "on"}
+            return value.strip().lower() in TRUTHY
         return bool(value)
 
     def ingest_showdown(self, payload: dict[str, Any]) -> PlayerAuditStats | None:
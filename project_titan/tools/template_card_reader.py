@@ -52,6 +52,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from utils.env import env_truthy
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -154,9 +156,7 @@ class TemplateCardReader:
         template_dir: str | None = None,
         match_threshold: float | None = None,
     ) -> None:
-        self._enabled = os.getenv(
-            "TITAN_TEMPLATE_READER_ENABLED", "1"
-        ).strip() in {"1", "true", "yes", "on"}
+        self._enabled = env_truthy("TITAN_TEMPLATE_READER_ENABLED", default=True)
 
         self._debug = os.getenv(
             "TITAN_TEMPLATE_READER_DEBUG", "0"
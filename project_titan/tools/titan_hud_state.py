@@ -8,6 +8,7 @@ Usage (agent side)::
 
     from tools.titan_hud_state import hud_state
     hud_state.push(hero_cards=["Ah","Kd"], equity=0.72, ...)
+    hud_state.push_many(patch)   # one merge per cycle
 
 Usage (GUI side)::
 
@@ -86,8 +87,14 @@ class HudState:
 
     def push(self, **kwargs: Any) -> None:
         """Update one or more fields atomically."""
+        self.push_many(kwargs)
+
+    def push_many(self, patch: dict[str, Any]) -> None:
+        """Merge a whole per-cycle *patch* under a single lock acquisition."""
+        if not patch:
+            return
         with self._lock:
-            for k, v in kwargs.items():
+            for k, v in patch.items():
                 if hasattr(self._data, k):
                     # Copy mutable collections
                     if isinstance(v, list):
@@ -47,6 +47,7 @@ from tools.vision_label_parser import (
 )
 from tools.card_reader import PPPokerCardReader
 from tools.template_card_reader import TemplateCardReader
+from utils.env import TRUTHY
 
 
 class VisionTool:
@@ -759,7 +760,7 @@ class VisionTool:
         raw = os.getenv(name, "").strip().lower()
         if not raw:
             return default
-        return raw in {"1", "true", "yes", "on"}
+        return raw in TRUTHY
 
     @staticmethod
     def _float_env(name: str, default: float) -> float:
@@ -0,0 +1,157 @@
+"""
+Project Titan — INT8 TensorRT Export
+
+Calibra e exporta o modelo YOLO para uma engine TensorRT INT8 usando
+screenshots reais do emulador (ex.: as capturadas por
+``training/capture_frames.py``).  O TensorRT mede a faixa das ativações
+nesses frames, então eles devem cobrir mesas variadas (preflop, board
+completo, showdown, botões visíveis) — 200 a 500 frames bastam.
+
+A engine é gravada como ``<modelo>.int8.engine`` ao lado do ``.pt`` e é
+carregada pelo VisionYolo com ``TITAN_YOLO_INT8=1``.
+
+Uso:
+    python training/export_int8.py --model models/best.pt --frames data/to_annotate
+    python training/export_int8.py --model models/best.pt --frames data/to_annotate --max-frames 300 --imgsz 720 1280
+    python training/export_int8.py --model models/best.pt --frames data/to_annotate --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp"}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export YOLO model to an INT8 TensorRT engine")
+    parser.add_argument("--model", type=str, required=True, help="Path to trained .pt model")
+    parser.add_argument("--frames", type=str, default="data/to_annotate", help="Directory with emulator screenshots")
+    parser.add_argument("--max-frames", type=int, default=500, dest="max_frames", help="Calibration frames to use")
+    parser.add_argument("--imgsz", type=int, nargs="+", default=[640], help="Engine input size (H W or single side)")
+    parser.add_argument("--dry-run", action="store_true", help="Write calibration files without exporting")
+    return parser.parse_args()
+
+
+def _resolve_path(p: str) -> Path:
+    pp = Path(p)
+    if pp.is_absolute():
+        return pp
+    return PROJECT_ROOT / pp
+
+
+def calibration_frames(frames_dir: Path, max_frames: int) -> list[Path]:
+    """Screenshots do diretório, amostrados uniformemente até *max_frames*."""
+    frames = sorted(p for p in frames_dir.rglob("*") if p.suffix.lower() in _IMAGE_SUFFIXES)
+    if max_frames > 0 and len(frames) > max_frames:
+        step = len(frames) / max_frames
+        frames = [frames[int(i * step)] for i in range(max_frames)]
+    return frames
+
+
+def write_calibration_yaml(frames: list[Path], names: dict[int, str], out_dir: Path) -> Path:
+    """Grava ``calibration.txt`` (lista de frames) e ``calibration.yaml``.
+
+    O Ultralytics lê as imagens de calibração do split ``val``; rótulos não
+    são necessários.  JSON é YAML válido, então não dependemos de PyYAML.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    image_list = out_dir / "calibration.txt"
+    image_list.write_text("".join(f"{p.resolve()}\n" for p in frames), encoding="utf-8")
+
+    config = {
+        "path": str(out_dir.resolve()),
+        "train": image_list.name,
+        "val": image_list.name,
+        "nc": len(names),
+        "names": {int(k): str(v) for k, v in names.items()},
+    }
+    yaml_path = out_dir / "calibration.yaml"
+    yaml_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    return yaml_path
+
+
+def calibrate_int8(
+    frames_dir: str | Path,
+    model_path: str | Path,
+    imgsz: int | tuple[int, int] = 640,
+    max_frames: int = 500,
+    dry_run: bool = False,
+) -> Path:
+    """Calibra com os screenshots de *frames_dir* e exporta ``<modelo>.int8.engine``.
+
+    Returns:
+        Caminho da engine INT8 (ou do ``calibration.yaml`` em *dry_run*).
+
+    Raises:
+        FileNotFoundError: Modelo ou screenshots ausentes.
+    """
+    from ultralytics import YOLO  # type: ignore[import-untyped]
+
+    frames_dir, model_path = Path(frames_dir), Path(model_path)
+    if not model_path.exists():
+        raise FileNotFoundError(f"modelo não encontrado: {model_path}")
+    frames = calibration_frames(frames_dir, max_frames)
+    if not frames:
+        raise FileNotFoundError(f"nenhum screenshot em {frames_dir}")
+
+    model = YOLO(str(model_path))
+    yaml_path = write_calibration_yaml(frames, dict(model.names), frames_dir / "calibration")
+    print(f"[INT8] {len(frames)} frames de calibração → {yaml_path}")
+    if dry_run:
+        return yaml_path
+
+    # O Ultralytics grava em <modelo>.engine, o mesmo caminho da engine FP16
+    # (TITAN_YOLO_TRT): ela é movida de lado durante o export e restaurada.
+    engine_path = model_path.with_suffix(".engine")
+    int8_path = model_path.with_suffix(".int8.engine")
+    fp16_backup = model_path.with_suffix(".engine.fp16")
+    if engine_path.exists():
+        os.replace(engine_path, fp16_backup)
+    try:
+        exported: Any = model.export(
+            format="engine", int8=True, data=str(yaml_path), imgsz=imgsz, device=0,
+        )
+        os.replace(str(exported or engine_path), int8_path)
+    finally:
+        if fp16_backup.exists():
+            os.replace(fp16_backup, engine_path)
+    return int8_path
+
+
+def main() -> None:
+    args = _parse_args()
+    model_path = _resolve_path(args.model)
+    frames_dir = _resolve_path(args.frames)
+    imgsz: int | tuple[int, int] = args.imgsz[0] if len(args.imgsz) == 1 else (args.imgsz[0], args.imgsz[1])
+
+    print(f"[INT8] model  = {model_path}")
+    print(f"[INT8] frames = {frames_dir}")
+    print(f"[INT8] imgsz  = {imgsz}")
+
+    try:
+        result = calibrate_int8(frames_dir, model_path, imgsz, args.max_frames, args.dry_run)
+    except ImportError:
+        print("[INT8] ERRO: ultralytics não instalado.")
+        sys.exit(1)
+    except FileNotFoundError as err:
+        print(f"[INT8] ERRO: {err}")
+        sys.exit(1)
+
+    if args.dry_run:
+        print("[INT8] Dry-run: arquivos de calibração gerados.")
+    else:
+        print(f"[INT8] engine salva: {result}")
+        print("[INT8] Use TITAN_YOLO_INT8=1 para carregá-la no agente.")
+
+
+if __name__ == "__main__":
+    main()
@@ -60,6 +60,12 @@ def index_to_card(index: int) -> str:
 
 # ── Normalisation (canonical ``Xs`` format) ───────────────────────
 
+# Upper-cased raw token → canonical card, including the ``10x`` spelling.
+_CARD_LOOKUP: dict[str, str] = {
+    f"{rank}{suit}".upper(): f"{rank}{suit}" for rank in RANKS for suit in SUITS
+}
+_CARD_LOOKUP.update({f"10{suit}".upper(): f"T{suit}" for suit in SUITS})
+
 
 def normalize_card(card: str) -> str | None:
     """Normalise a card string to canonical ``Xs`` format.
@@ -67,14 +73,7 @@ def normalize_card(card: str) -> str | None:
     Accepts common variants like ``"10h"`` → ``"Th"``, ``"aS"`` → ``"As"``.
     Returns ``None`` if the input is not a valid card.
     """
-    cleaned = card.strip().upper().replace("10", "T")
-    if len(cleaned) != 2:
-        return None
-    rank = cleaned[0]
-    suit = cleaned[1].lower()
-    if rank not in RANKS or suit not in SUITS:
-        return None
-    return f"{rank}{suit}"
+    return _CARD_LOOKUP.get(card.strip().upper())
 
 
 def normalize_cards(raw_cards: Any) -> list[str]:
@@ -85,11 +84,13 @@ def normalize_cards(raw_cards: Any) -> list[str]:
     if not isinstance(raw_cards, list):
         return []
     cards: list[str] = []
+    seen: set[str] = set()
     for item in raw_cards:
         if not isinstance(item, str):
             continue
-        normalized = normalize_card(item)
-        if normalized is not None and normalized not in cards:
+        normalized = _CARD_LOOKUP.get(item.strip().upper())
+        if normalized is not None and normalized not in seen:
+            seen.add(normalized)
             cards.append(normalized)
     return cards
 
@@ -97,10 +98,12 @@ def normalize_cards(raw_cards: Any) -> list[str]:
 def merge_dead_cards(*sources: list[str]) -> list[str]:
     """Merge and deduplicate dead cards from multiple sources."""
     merged: list[str] = []
+    seen: set[str] = set()
     for source in sources:
         for card in source:
-            normalized = normalize_card(card)
-            if normalized is not None and normalized not in merged:
+            normalized = _CARD_LOOKUP.get(card.strip().upper())
+            if normalized is not None and normalized not in seen:
+                seen.add(normalized)
                 merged.append(normalized)
     return merged
 
@@ -120,16 +123,16 @@ def street_from_board(board_cards: list[str]) -> str:
 # ── Display (Portuguese) ──────────────────────────────────────────
 
 
+# Upper-cased raw token → Portuguese name, precomputed for the whole deck.
+_CARD_PT: dict[str, str] = {
+    raw: f"{_RANK_PT[card[0]]} de {_SUIT_PT[card[1].upper()]}"
+    for raw, card in _CARD_LOOKUP.items()
+}
+
+
 def card_to_pt(card: str) -> str | None:
     """Return the Portuguese display name for a card (e.g. ``"Ah"`` → ``"Ás de Copas"``)."""
-    token = str(card or "").strip().upper().replace("10", "T")
-    if len(token) != 2:
-        return None
-    rank = _RANK_PT.get(token[0])
-    suit = _SUIT_PT.get(token[1].upper())
-    if rank is None or suit is None:
-        return None
-    return f"{rank} de {suit}"
+    return _CARD_PT.get(str(card or "").strip().upper())
 
 
 # ── Poker math helpers ────────────────────────────────────────────
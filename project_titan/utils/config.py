@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 import json
 import os
 
+from utils.env import env_truthy
+
 
 @dataclass(slots=True)
 class ServerConfig:
@@ -66,8 +68,8 @@ class OCRRuntimeConfig:
     ``VisionYolo.capture_frame()``.
     """
 
-    enabled: bool = field(default_factory=lambda: os.getenv("TITAN_OCR_ENABLED", "1").strip().lower() in {"1", "true", "yes", "on"})
-    use_easyocr: bool = field(default_factory=lambda: os.getenv("TITAN_OCR_USE_EASYOCR", "0").strip().lower() in {"1", "true", "yes", "on"})
+    enabled: bool = field(default_factory=lambda: env_truthy("TITAN_OCR_ENABLED", default=True))
+    use_easyocr: bool = field(default_factory=lambda: env_truthy("TITAN_OCR_USE_EASYOCR"))
     tesseract_cmd: str = field(default_factory=lambda: os.getenv("TITAN_TESSERACT_CMD", "").strip())
 
     # default ROIs (x, y, w, h) relative to emulator canvas
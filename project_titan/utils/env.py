@@ -0,0 +1,25 @@
+"""Shared boolean parsing for ``TITAN_*`` env-vars and config values.
+
+Every module accepts the same spellings (``1/true/yes/on`` and
+``0/false/no/off``, case-insensitive), so they live here once instead of
+as a set literal at each call site.
+"""
+
+from __future__ import annotations
+
+import os
+
+TRUTHY: frozenset[str] = frozenset(("1", "true", "yes", "on"))
+FALSY: frozenset[str] = frozenset(("0", "false", "no", "off"))
+
+
+def env_truthy(name: str, default: bool = False) -> bool:
+    """``True`` when env-var *name* is one of :data:`TRUTHY`.
+
+    An unset variable yields *default*; any other value (including an
+    empty string) is ``False``.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in TRUTHY
@@ -0,0 +1,44 @@
+"""JSON encode/decode helpers shared by the hot paths.
+
+Uses ``orjson`` when installed (faster, fewer allocations) and falls back
+to the stdlib :mod:`json` otherwise.  Both backends emit UTF-8 without
+ASCII escaping and accept non-string dict keys, so files and Redis values
+stay readable by either one.  Decode errors are always
+:class:`json.JSONDecodeError` (``orjson.JSONDecodeError`` subclasses it).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+if orjson is not None:
+    _OPT_COMPACT = orjson.OPT_NON_STR_KEYS
+    _OPT_INDENT = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 JSON bytes (2-space indented if *indent*)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_OPT_INDENT if indent else _OPT_COMPACT)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialise *obj* to a JSON string."""
+    return dumps_bytes(obj, indent=indent).decode("utf-8")
+
+
+def loads(raw: bytes | bytearray | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
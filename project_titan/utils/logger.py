@@ -3,6 +3,10 @@
 Provides ANSI-coloured output for demo / presentation quality logging.
 Falls back to plain text when the terminal does not support ANSI or when
 ``TITAN_NO_COLOR=1`` is set.
+
+``TITAN_LOG_LEVEL`` (``status`` | ``info`` | ``warn`` | ``error``) drops
+messages below the chosen level; the default ``status`` emits everything.
+Messages accept ``%``-style args that are only formatted when emitted.
 """
 
 from __future__ import annotations
@@ -13,6 +17,8 @@ import sys
 import threading
 from datetime import datetime, timezone
 
+from utils.env import FALSY, env_truthy
+
 
 # ---------------------------------------------------------------------------
 # ANSI colour codes
@@ -36,7 +42,7 @@ _FG_BRIGHT_CYAN = "\033[96m"
 
 def _supports_color() -> bool:
     """Heuristic check for ANSI colour support."""
-    if os.getenv("TITAN_NO_COLOR", "").strip().lower() in {"1", "true", "yes"}:
+    if env_truthy("TITAN_NO_COLOR"):
         return False
     if os.getenv("NO_COLOR"):
         return False
@@ -59,6 +65,20 @@ def _supports_color() -> bool:
 
 _COLOR_ENABLED = _supports_color()
 
+_LEVELS: dict[str, int] = {
+    "STATUS": 10,
+    "INFO": 20,
+    "SUCCESS": 20,
+    "HIGHLIGHT": 20,
+    "WARN": 30,
+    "ERROR": 40,
+}
+
+
+def _min_level() -> int:
+    raw = os.getenv("TITAN_LOG_LEVEL", "status").strip().upper()
+    return _LEVELS.get("WARN" if raw == "WARNING" else raw, _LEVELS["STATUS"])
+
 
 def _log_file_path() -> str | None:
     """Resolve JSONL log destination from env vars.
@@ -66,7 +86,7 @@ def _log_file_path() -> str | None:
     ``TITAN_LOG_DIR`` controls the folder; defaults to ``reports/logs``.
     Set ``TITAN_LOG_FILE=0`` to disable file logging.
     """
-    if os.getenv("TITAN_LOG_FILE", "1").strip().lower() in {"0", "false", "no", "off"}:
+    if os.getenv("TITAN_LOG_FILE", "1").strip().lower() in FALSY:
         return None
     log_dir = os.getenv("TITAN_LOG_DIR", os.path.join("reports", "logs")).strip()
     if not log_dir:
@@ -105,6 +125,23 @@ class TitanLogger:
         self.module = module
         self._prefix_color = self._MODULE_COLORS.get(module, _FG_WHITE)
         self._log_file = _log_file_path()
+        self._min_level = _min_level()
+
+    def is_enabled_for(self, level: str) -> bool:
+        """``True`` when messages at *level* (e.g. ``"INFO"``) are emitted."""
+        return _LEVELS.get(level.upper(), 0) >= self._min_level
+
+    def is_info_enabled(self) -> bool:
+        return self.is_enabled_for("INFO")
+
+    def is_highlight_enabled(self) -> bool:
+        return self.is_enabled_for("HIGHLIGHT")
+
+    def _render(self, level: str, message: str, args: tuple) -> str | None:
+        """Return the final message, or ``None`` when *level* is filtered out."""
+        if _LEVELS[level] < self._min_level:
+            return None
+        return message % args if args else message
 
     def _write_file_log(self, level: str, message: str) -> None:
         """Append structured log event to JSONL file (thread-safe)."""
@@ -132,37 +169,55 @@ class TitanLogger:
             )
         return f"[{self.module}] {level} {message}"
 
-    def info(self, message: str) -> None:
-        self._write_file_log("INFO", message)
-        print(self._format(_FG_GREEN, ">", message))
+    def info(self, message: str, *args: object) -> None:
+        text = self._render("INFO", message, args)
+        if text is None:
+            return
+        self._write_file_log("INFO", text)
+        print(self._format(_FG_GREEN, ">", text))
 
-    def success(self, message: str) -> None:
-        self._write_file_log("SUCCESS", message)
-        print(self._format(_FG_BRIGHT_GREEN, "+", message))
+    def success(self, message: str, *args: object) -> None:
+        text = self._render("SUCCESS", message, args)
+        if text is None:
+            return
+        self._write_file_log("SUCCESS", text)
+        print(self._format(_FG_BRIGHT_GREEN, "+", text))
 
-    def warn(self, message: str) -> None:
-        self._write_file_log("WARN", message)
-        print(self._format(_FG_YELLOW, "!", message))
+    def warn(self, message: str, *args: object) -> None:
+        text = self._render("WARN", message, args)
+        if text is None:
+            return
+        self._write_file_log("WARN", text)
+        print(self._format(_FG_YELLOW, "!", text))
 
     # alias for compatibility with stdlib logging convention
     warning = warn
 
-    def error(self, message: str) -> None:
-        self._write_file_log("ERROR", message)
-        print(self._format(_FG_RED, "X", message))
+    def error(self, message: str, *args: object) -> None:
+        text = self._render("ERROR", message, args)
+        if text is None:
+            return
+        self._write_file_log("ERROR", text)
+        print(self._format(_FG_RED, "X", text))
 
-    def status(self, message: str) -> None:
+    def status(self, message: str, *args: object) -> None:
         """Dimmed status line for non-critical events."""
-        self._write_file_log("STATUS", message)
+        text = self._render("STATUS", message, args)
+        if text is None:
+            return
+        self._write_file_log("STATUS", text)
         if _COLOR_ENABLED:
-            print(f"{self._prefix_color}{_BOLD}[{self.module}]{_RESET} {_DIM}{message}{_RESET}")
+            print(f"{self._prefix_color}{_BOLD}[{self.module}]{_RESET} {_DIM}{text}{_RESET}")
         else:
-            print(f"[{self.module}] {message}")
+            print(f"[{self.module}] {text}")
 
-    def highlight(self, message: str) -> None:
+    def highlight(self, message: str, *args: object) -> None:
         """Bold bright message (mode activations, demos)."""
-        self._write_file_log("HIGHLIGHT", message)
+        text = self._render("HIGHLIGHT", message, args)
+        if text is None:
+            return
+        self._write_file_log("HIGHLIGHT", text)
         if _COLOR_ENABLED:
-            print(f"{self._prefix_color}{_BOLD}[{self.module}] * {message}{_RESET}")
+            print(f"{self._prefix_color}{_BOLD}[{self.module}] * {text}{_RESET}")
         else:
-            print(f"[{self.module}] * {message}")
+            print(f"[{self.module}] * {text}")
@@ -25,6 +25,8 @@ import threading
 from pathlib import Path
 from typing import Any
 
+from utils.env import FALSY, TRUTHY
+
 
 def _find_config_path() -> Path:
     """Resolve o caminho do config.yaml subindo até a raiz do projeto."""
@@ -159,18 +161,18 @@ class TitanConfig:
         """Retorna booleano: env > yaml > default."""
         env_val = os.getenv(self._env_key(key), "").strip().lower()
         if env_val:
-            if env_val in {"1", "true", "yes", "on"}:
+            if env_val in TRUTHY:
                 return True
-            if env_val in {"0", "false", "no", "off"}:
+            if env_val in FALSY:
                 return False
         yaml_val = self._resolve(key)
         if yaml_val is not None:
             if isinstance(yaml_val, bool):
                 return yaml_val
             raw = str(yaml_val).strip().lower()
-            if raw in {"1", "true", "yes", "on"}:
+            if raw in TRUTHY:
                 return True
-            if raw in {"0", "false", "no", "off"}:
+            if raw in FALSY:
                 return False
         return default
 
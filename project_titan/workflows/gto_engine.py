@@ -44,6 +44,7 @@ from typing import Any
 
 from workflows.thresholds import select_action as select_action_deterministic
 from workflows.thresholds import information_quality  # re-export
+from utils.env import env_truthy
 
 # Minimum observed hands before exploiting opponent tendencies.
 # Below this threshold, opponent classification is unreliable.
@@ -134,9 +135,7 @@ class MixedStrategy:
         else:
             self._rng = random.Random()
 
-        self._enabled = os.getenv(
-            "TITAN_GTO_ENABLED", "1"
-        ).strip().lower() in {"1", "true", "yes", "on"}
+        self._enabled = env_truthy("TITAN_GTO_ENABLED", default=True)
 
         self._randomness = self._env_float("TITAN_GTO_RANDOMNESS", 0.85)
         self._bluff_freq = self._env_float("TITAN_GTO_BLUFF_FREQ", 0.12)
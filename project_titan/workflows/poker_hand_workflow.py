@@ -61,7 +61,8 @@ from dataclasses import dataclass, field
 import logging
 import os
 import time
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, cast
 
 from tools.action_tool import ActionTool
 from tools.equity_tool import EquityTool
@@ -73,6 +74,16 @@ from workflows.protocol import SupportsMemory
 from workflows.thresholds import information_quality, select_action
 from workflows.gto_engine import MixedStrategy, OpponentTendencies, ActionDistribution
 from memory.opponent_db import OpponentDB, HandEvent
+from utils.env import TRUTHY, env_truthy
+
+# Keys read back from memory during a cycle, fetched in a single round-trip.
+_PREFETCH_KEYS: tuple[str, ...] = (
+    "heads_up_obfuscation",
+    "showdown_events",
+    "current_opponent",
+    "dead_cards",
+)
+_MISSING = object()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -174,14 +185,12 @@ class PokerHandWorkflow:
     @staticmethod
     def _dynamic_simulations_enabled() -> bool:
         """Read ``TITAN_DYNAMIC_SIMULATIONS`` (default off)."""
-        raw_value = os.getenv("TITAN_DYNAMIC_SIMULATIONS", "0").strip().lower()
-        return raw_value in {"1", "true", "yes", "on"}
+        return env_truthy("TITAN_DYNAMIC_SIMULATIONS")
 
     @staticmethod
     def _rng_evasion_enabled() -> bool:
         """Read ``TITAN_RNG_EVASION`` (default on)."""
-        raw_value = os.getenv("TITAN_RNG_EVASION", "1").strip().lower()
-        return raw_value in {"1", "true", "yes", "on"}
+        return env_truthy("TITAN_RNG_EVASION", default=True)
 
     @staticmethod
     def _god_mode_bonus() -> float:
@@ -225,7 +234,7 @@ class PokerHandWorkflow:
             return 0.45
 
     @staticmethod
-    def _current_opponent(memory: SupportsMemory) -> str:
+    def _current_opponent(memory: Mapping[str, Any]) -> str:
         """Resolve the current opponent from memory, then env-var fallback."""
         memory_value = memory.get("current_opponent", "")
         if isinstance(memory_value, str) and memory_value.strip():
@@ -233,7 +242,7 @@ class PokerHandWorkflow:
         return os.getenv("TITAN_CURRENT_OPPONENT", "").strip()
 
     @staticmethod
-    def _heads_up_obfuscation(memory: SupportsMemory) -> bool:
+    def _heads_up_obfuscation(memory: Mapping[str, Any]) -> bool:
         """Return ``True`` when HiveBrain flagged a heads-up collusion scenario.
 
         In this case, the workflow must play aggressively (never check-down)
@@ -243,11 +252,28 @@ class PokerHandWorkflow:
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.strip().lower() in {"1", "true", "yes", "on"}
+            return value.strip().lower() in TRUTHY
         return bool(value)
 
+    def _prefetch_memory(self) -> dict[str, Any]:
+        """Read :data:`_PREFETCH_KEYS` at once (``get_many`` when available).
+
+        The ``memory`` helpers below read from this mapping with
+        ``.get(key, default)``.  Absent keys are left out.
+        """
+        get_many = getattr(self.memory, "get_many", None)
+        if callable(get_many):
+            return cast("dict[str, Any]", get_many(_PREFETCH_KEYS))
+        values = ((key, self.memory.get(key, _MISSING)) for key in _PREFETCH_KEYS)
+        return {key: value for key, value in values if value is not _MISSING}
+
+    def _memory_batch(self) -> Any:
+        """Write batch for the pre-equity writes (the store itself if unsupported)."""
+        pipeline = getattr(self.memory, "pipeline", None)
+        return pipeline() if callable(pipeline) else self.memory
+
     @staticmethod
-    def _extract_showdown_events(memory: SupportsMemory) -> list[dict[str, Any]]:
+    def _extract_showdown_events(memory: Mapping[str, Any]) -> list[dict[str, Any]]:
         """Pull any pending showdown events from memory and normalise."""
         events = memory.get("showdown_events", [])
         if not isinstance(events, list):
@@ -428,39 +454,44 @@ class PokerHandWorkflow:
             hive_data.get("partners", []) if hive_data is not None else []
         )
 
+        # Values read back later this cycle: one round-trip.  Writes up to
+        # the dead-card merge go out together; ``memory_view`` mirrors them.
+        memory_view = self._prefetch_memory()
+        memory_batch = self._memory_batch()
+
         # Store hive data in memory for other components
         if hive_data is not None:
             if "heads_up_obfuscation" in hive_data:
-                self.memory.set(
-                    "heads_up_obfuscation",
-                    bool(hive_data["heads_up_obfuscation"]),
-                )
-            self.memory.set("hive_mode", hive_mode)
-            self.memory.set("hive_partners", hive_partners)
+                heads_up = bool(hive_data["heads_up_obfuscation"])
+                memory_batch.set("heads_up_obfuscation", heads_up)
+                memory_view["heads_up_obfuscation"] = heads_up
+            memory_batch.set("hive_mode", hive_mode)
+            memory_batch.set("hive_partners", hive_partners)
 
         # ── 3. Showdown ingestion ───────────────────────────────────
         snapshot_events = getattr(snapshot, "showdown_events", [])
         if not isinstance(snapshot_events, list):
             snapshot_events = []
 
-        memory_events = self._extract_showdown_events(self.memory)
+        memory_events = self._extract_showdown_events(memory_view)
         rng_events = [e for e in snapshot_events if isinstance(e, dict)] + memory_events
         for event in rng_events:
             self.rng.ingest_showdown(event)
         if memory_events:
-            self.memory.set("showdown_events", [])
+            memory_batch.set("showdown_events", [])
 
         # Persist current opponent from vision
         snapshot_opponent = getattr(snapshot, "current_opponent", "")
         if isinstance(snapshot_opponent, str) and snapshot_opponent.strip():
-            self.memory.set("current_opponent", snapshot_opponent.strip())
+            memory_batch.set("current_opponent", snapshot_opponent.strip())
+            memory_view["current_opponent"] = snapshot_opponent.strip()
 
         # Publish flagged opponents
         flagged_opponents = self.rng.flagged_opponents()
-        self.memory.set("rng_super_users", flagged_opponents)
+        memory_batch.set("rng_super_users", flagged_opponents)
 
         # ── 4. Dead-card merge (memory + vision + hive) ─────────────
-        memory_dead_cards = self.memory.get("dead_cards", [])
+        memory_dead_cards = memory_view.get("dead_cards", [])
         if not isinstance(memory_dead_cards, list):
             memory_dead_cards = []
         snapshot_dead_cards = getattr(snapshot, "dead_cards", [])
@@ -476,7 +507,9 @@ class PokerHandWorkflow:
             *(self._normalize_card(c) for c in snapshot.board_cards),
         }
         dead_cards = [c for c in dead_cards if c not in visible_cards]
-        self.memory.set("dead_cards", dead_cards)
+        memory_batch.set("dead_cards", dead_cards)
+        if memory_batch is not self.memory:
+            memory_batch.execute()
 
         # ── 5. Equity computation (PLO6 Monte-Carlo) ────────────────
         _t0 = time.perf_counter()
@@ -513,7 +546,7 @@ class PokerHandWorkflow:
         current_opponent = (
             snapshot_opponent.strip()
             if isinstance(snapshot_opponent, str) and snapshot_opponent.strip()
-            else self._current_opponent(self.memory)
+            else self._current_opponent(memory_view)
         )
 
         # ── 6. Action selection via GTO mixed-strategy engine ────────
@@ -633,7 +666,7 @@ class PokerHandWorkflow:
         # ── 10. Collusion obfuscation ───────────────────────────────
         # When two friendly bots are heads-up, never check-down —
         # escalate passive actions to look aggressive.
-        hu_obfuscation = self._heads_up_obfuscation(self.memory)
+        hu_obfuscation = self._heads_up_obfuscation(memory_view)
         if hu_obfuscation and decision_action not in {"wait", "fold"}:
             if decision_action == "call":
                 decision_action = "raise_small"